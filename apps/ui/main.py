@@ -27,6 +27,7 @@ import asyncio
 
 from src.views.splash import SplashUI
 from src.modules.login.auth_controller import AuthController
+from src.API.outbox import get_outbox
 
 
 def main(page: ft.Page):
@@ -42,6 +43,9 @@ def main(page: ft.Page):
     page.views.append(ft.View(route="/splash", controls=[splash]))
     page.update()
 
+    # Reanuda el envío de intentos que quedaron en cola en sesiones anteriores
+    get_outbox()
+
     # Mostrar el login justo después del splash sin esperas extra
     async def go_login():
         await asyncio.sleep(1.0)  # duración total visible del splash
@@ -0,0 +1,306 @@
+# src/API/cache.py
+"""Caché en memoria de respuestas GET para RestClient.
+
+- LRU acotado por bytes (se guarda el cuerpo crudo, no el objeto decodificado,
+  así cada hit entrega una copia nueva que el llamador puede mutar).
+- TTL por ruta con patrones fnmatch ("pruebas", "pruebas/*", ...).
+- Revalidación con If-None-Match / If-Modified-Since cuando el servidor
+  envió ETag / Last-Modified: un 304 renueva la entrada sin re-descargar.
+- Opcional: segundo nivel en disco (DiskCache, SQLite) que sobrevive a
+  reinicios, y modos stale-while-revalidate (se entrega la copia vencida y
+  RestClient la refresca en segundo plano) y stale-if-error (sin red se
+  entrega la última copia conocida).
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlencode
+import threading
+import time
+
+from .diskcache import DiskCache
+from .jsonstream import loads
+
+# TTL (segundos) por patrón de ruta. Solo se cachean las rutas que aparecen
+# aquí: el catálogo de pruebas cambia poco; users nunca se cachea.
+DEFAULT_TTLS: Dict[str, float] = {
+    "pruebas": 120.0,
+    "pruebas/*": 300.0,
+    "Pruebas": 120.0,
+    "exams": 120.0,
+    "exams/*": 300.0,
+    "Exams": 120.0,
+}
+
+
+def decode_body(body: bytes) -> Any:
+    """Decodifica un cuerpo guardado igual que RestClient decodifica la respuesta."""
+    if not body:
+        return None
+    try:
+        return loads(body)
+    except ValueError:
+        text = body.decode("utf-8", errors="replace")
+        return {"raw": text} if text else None
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    status: int
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.monotonic()) < self.expires_at
+
+    def staleness(self, now: Optional[float] = None) -> float:
+        """Segundos que lleva vencida (0 si está fresca)."""
+        return max(0.0, (now if now is not None else time.monotonic()) - self.expires_at)
+
+    def validators(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def payload(self) -> Any:
+        return decode_body(self.body)
+
+
+class ResponseCache:
+    """LRU de respuestas GET acotado por max_bytes, con TTL por ruta.
+
+    - disk: segundo nivel persistente; los fallos en memoria se buscan ahí.
+    - stale_while_revalidate: segundos tras vencer durante los que se
+      entrega la copia vencida mientras se refresca en segundo plano.
+    - stale_if_error: segundos tras vencer durante los que se entrega la
+      copia vencida si el servidor no responde (red caída, 5xx).
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 8 * 1024 * 1024,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: Optional[float] = None,
+        disk: Optional[DiskCache] = None,
+        stale_while_revalidate: float = 0.0,
+        stale_if_error: float = 0.0,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.disk = disk
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+        self.stale_served = 0
+        self.disk_hits = 0
+
+    # -------- claves y TTL ----------
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted((str(k), str(v)) for k, v in params.items()))}"
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """TTL de la ruta (sin query); None si la ruta no se cachea."""
+        path = path.strip("/")
+        ttl = self.ttls.get(path)
+        if ttl is not None:
+            return ttl
+        for pattern, value in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return value
+        return self.default_ttl
+
+    def cacheable(self, path: str) -> bool:
+        """La ruta tiene TTL: vale la pena buscarla (y contarla) en la caché."""
+        ttl = self.ttl_for(path)
+        return ttl is not None and ttl >= 0
+
+    # -------- lectura ----------
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.disk is None:
+            return None
+        row = self.disk.get(key)
+        if row is None:
+            return None
+        status, body, etag, last_modified, expires_wall = row
+        entry = CacheEntry(
+            body=body,
+            status=status,
+            etag=etag,
+            last_modified=last_modified,
+            expires_at=time.monotonic() + (expires_wall - time.time()),
+        )
+        with self._lock:
+            self.disk_hits += 1
+            self._insert(key, entry)
+        return entry
+
+    def can_serve_stale(self, entry: CacheEntry) -> bool:
+        """La entrada vencida aún puede entregarse mientras se revalida."""
+        return self.stale_while_revalidate > 0 and entry.staleness() <= self.stale_while_revalidate
+
+    def can_serve_on_error(self, entry: CacheEntry) -> bool:
+        """La entrada vencida puede entregarse porque el servidor no respondió."""
+        return self.stale_if_error > 0 and entry.staleness() <= self.stale_if_error
+
+    def record_stale(self, entry: CacheEntry) -> None:
+        with self._lock:
+            self.stale_served += 1
+            self.bytes_saved += entry.size
+
+    def record_hit(self, entry: CacheEntry) -> None:
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += entry.size
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def revalidated(self, key: str, entry: CacheEntry, path: str, headers: Mapping[str, str]) -> None:
+        """El servidor respondió 304: renueva la entrada con los validadores nuevos."""
+        ttl = self.ttl_for(path) or 0.0
+        with self._lock:
+            entry.expires_at = time.monotonic() + ttl
+            entry.etag = headers.get("ETag") or entry.etag
+            entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+            self.revalidations += 1
+            self.bytes_saved += entry.size
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        if self.disk is not None:
+            self.disk.touch(key, time.time() + ttl, entry.etag, entry.last_modified)
+
+    # -------- escritura ----------
+    def store(self, key: str, path: str, status: int, body: bytes, headers: Mapping[str, str]) -> bool:
+        """Guarda una respuesta 2xx si la ruta es cacheable. Devuelve True si se guardó."""
+        ttl = self.ttl_for(path)
+        if ttl is None or ttl < 0:
+            return False
+        if "no-store" in (headers.get("Cache-Control") or "").lower():
+            return False
+        if len(body) > self.max_bytes:
+            return False
+
+        entry = CacheEntry(
+            body=body,
+            status=status,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            expires_at=time.monotonic() + ttl,
+        )
+        with self._lock:
+            self._insert(key, entry)
+        if self.disk is not None:
+            self.disk.put(key, status, body, entry.etag, entry.last_modified, time.time() + ttl)
+        return True
+
+    def _insert(self, key: str, entry: CacheEntry) -> None:
+        # Llamar con self._lock tomado
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    def invalidate_path(self, url: str) -> int:
+        """Elimina la ruta url y lo que cuelga de ella (url/..., url?...).
+
+        A diferencia de invalidate(prefix), "pruebas" no arrastra "pruebasX".
+        """
+        url = url.rstrip("/")
+
+        def under(key: str) -> bool:
+            return key == url or key.startswith(url + "/") or key.startswith(url + "?")
+
+        with self._lock:
+            keys = [k for k in self._entries if under(k)]
+            for k in keys:
+                self._bytes -= self._entries.pop(k).size
+        if self.disk is not None:
+            self.disk.invalidate_path(url)
+        return len(keys)
+
+    def invalidate(self, prefix: str = "") -> int:
+        """Elimina las entradas cuya clave empieza por prefix (todas si vacío)."""
+        with self._lock:
+            keys = [k for k in self._entries if k.startswith(prefix)]
+            for k in keys:
+                self._bytes -= self._entries.pop(k).size
+        if self.disk is not None:
+            self.disk.invalidate(prefix)
+        return len(keys)
+
+    # -------- métricas ----------
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.revalidations + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "hit_ratio": ((self.hits + self.revalidations) / lookups) if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "stale_served": self.stale_served,
+                "disk_hits": self.disk_hits,
+                "disk_bytes": self.disk.size_bytes if self.disk is not None else 0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# -------- caché persistente compartida ----------
+# Catálogo: se muestra la última copia hasta 7 días después de vencer mientras
+# se refresca, y hasta 30 días si no hay red (salones con conectividad mala).
+SWR_WINDOW = 7 * 24 * 3600.0
+OFFLINE_WINDOW = 30 * 24 * 3600.0
+
+_persistent: Optional[ResponseCache] = None
+_persistent_lock = threading.Lock()
+
+
+def persistent_cache() -> ResponseCache:
+    """ResponseCache compartida con nivel en disco y stale-while-revalidate."""
+    global _persistent
+    with _persistent_lock:
+        if _persistent is None:
+            _persistent = ResponseCache(
+                disk=DiskCache(),
+                stale_while_revalidate=SWR_WINDOW,
+                stale_if_error=OFFLINE_WINDOW,
+            )
+        return _persistent
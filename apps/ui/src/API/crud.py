@@ -8,8 +8,8 @@ except ModuleNotFoundError:  # mobile fallback: use httpx shim
             RequestException = httpx.HTTPError
 
         class Session:
-            def __init__(self):
-                self._client = httpx.Client()
+            def __init__(self, limits=None):
+                self._client = httpx.Client(limits=limits) if limits else httpx.Client()
                 self.headers = {}
 
             def request(
@@ -22,9 +22,11 @@ except ModuleNotFoundError:  # mobile fallback: use httpx shim
                 json=None,
                 data=None,
                 timeout=None,
+                stream=False,
+                extensions=None,
             ):
                 merged_headers = {**self.headers, **(headers or {})}
-                return self._client.request(
+                req = self._client.build_request(
                     method=method,
                     url=url,
                     params=params,
@@ -32,12 +34,118 @@ except ModuleNotFoundError:  # mobile fallback: use httpx shim
                     json=json,
                     data=data,
                     timeout=timeout,
+                    extensions=extensions,
                 )
+                return self._client.send(req, stream=stream)
+
+            def close(self):
+                self._client.close()
 
     requests = _RequestsShim()  # type: ignore
-from typing import Any, Dict, Optional, Tuple, Union
+# Sin requests la sesión es el shim httpx: los tiempos se miden con la extensión "trace"
+_HTTPX_SESSION = not hasattr(requests, "adapters")
+try:
+    import httpx  # cliente asíncrono (AsyncRestClient)
+except ModuleNotFoundError:
+    httpx = None  # type: ignore
+import asyncio
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Union
+from urllib.parse import urlsplit
+
+from .cache import ResponseCache
+from .jsonstream import aiter_json_array, iter_json_array, loads as json_loads
+from .metrics import METRICS, PhaseTimer, RequestEvent, RequestHook, body_size, emit, path_template
+from .retry import CircuitOpenError, RetryPolicy, breaker_for, is_failure_status, parse_retry_after
+from .singleflight import AsyncSingleFlight, SingleFlight, flight_key
 
 JSON = Union[Dict[str, Any], list, None]
+Result = Tuple[bool, JSON, int, Optional[str]]
+# Una petición para gather(): "path" (GET), ("METHOD", "path") o
+# {"method": ..., "path": ..., "params": ..., "json": ...}
+RequestSpec = Union[str, Tuple[str, str], Mapping[str, Any]]
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Ajustes del pool de conexiones HTTP que comparten los clientes.
+
+    - pool_connections: cuántos hosts distintos mantiene en caché el pool.
+    - pool_maxsize: conexiones abiertas como máximo por host.
+    - keepalive_expiry: segundos que un socket ocioso sigue vivo (solo httpx;
+      urllib3 mantiene el socket hasta que el servidor lo cierra).
+    - pool_block: si True, espera a que se libere una conexión en vez de abrir
+      una extra fuera del pool cuando se llega a pool_maxsize.
+    """
+    pool_connections: int = 4
+    pool_maxsize: int = 16
+    keepalive_expiry: float = 30.0
+    pool_block: bool = False
+
+
+DEFAULT_POOL = PoolConfig()
+
+
+def _httpx_limits(pool: PoolConfig):
+    return httpx.Limits(
+        max_connections=pool.pool_maxsize * pool.pool_connections,
+        max_keepalive_connections=pool.pool_maxsize,
+        keepalive_expiry=pool.keepalive_expiry,
+    )
+
+
+def _normalize_spec(spec: RequestSpec) -> Dict[str, Any]:
+    if isinstance(spec, str):
+        return {"method": "GET", "path": spec}
+    if isinstance(spec, tuple):
+        method, path = spec
+        return {"method": method, "path": path}
+    out = dict(spec)
+    out.setdefault("method", "GET")
+    return out
+
+
+# Tiempo de connect() (DNS + TCP + TLS) de la última conexión nueva abierta por este hilo
+_conn_timing = threading.local()
+
+
+@lru_cache(maxsize=1)
+def _timed_pool_classes() -> Dict[str, Any]:
+    """Pools de urllib3 cuyas conexiones anotan en _conn_timing lo que tardó connect()."""
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    def timed(base):
+        class TimedConnection(base):
+            def connect(self):
+                t0 = time.perf_counter()
+                try:
+                    super().connect()
+                finally:
+                    prev = getattr(_conn_timing, "connect_s", None) or 0.0
+                    _conn_timing.connect_s = prev + time.perf_counter() - t0
+
+        return TimedConnection
+
+    class TimedHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = timed(HTTPConnection)
+
+    class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = timed(HTTPSConnection)
+
+    return {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+
+
+def _decode_payload(resp) -> JSON:
+    """Decodifica el cuerpo como JSON (orjson si está disponible); si no lo es, regresa {"raw": texto}."""
+    try:
+        return json_loads(resp.content) if resp.content else None
+    except ValueError:
+        return {"raw": resp.text} if resp.text else None
 
 
 class RestClient:
@@ -51,6 +159,9 @@ class RestClient:
         ok, data, status = api.patch("users/1", json={...})     # PARTIAL UPDATE
         ok, data, status = api.put("users/1", json={...})       # REPLACE
         ok, _,   status = api.delete("users/1")                 # DELETE
+
+    En la app se usa get_client(URL_API) para compartir una sola sesión
+    (y sus conexiones keep-alive) entre todos los módulos.
     """
 
     def __init__(
@@ -59,14 +170,114 @@ class RestClient:
         default_headers: Optional[Dict[str, str]] = None,
         timeout: int = 12,
         raise_on_http_error: bool = False,
+        pool: Optional[PoolConfig] = None,
+        cache: Optional[ResponseCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: bool = True,
+        hooks: Optional[Sequence[RequestHook]] = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.default_headers = default_headers or {"Content-Type": "application/json"}
         self.timeout = timeout
         self.raise_on_http_error = raise_on_http_error
-        self._session = requests.Session()
+        self.hooks: List[RequestHook] = list(hooks or [])
+        self.pool = pool or DEFAULT_POOL
+        self.cache = cache
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker_for(urlsplit(self.base_url).netloc) if circuit_breaker else None
+        self._flight = SingleFlight()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._refreshing: Set[str] = set()
+        self._session = self._build_session(self.pool)
         self._session.headers.update(self.default_headers)
 
+    def enable_cache(self, cache: Optional[ResponseCache] = None) -> ResponseCache:
+        """Activa la caché de GET (opt-in). Si ya estaba activa devuelve la existente."""
+        if self.cache is None:
+            self.cache = cache or ResponseCache()
+        return self.cache
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """Registra un hook de instrumentación (before/after/error por petición)."""
+        if hook not in self.hooks:
+            self.hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        if hook in self.hooks:
+            self.hooks.remove(hook)
+
+    @staticmethod
+    def _build_session(pool: PoolConfig):
+        """Crea la sesión HTTP con un pool de conexiones persistentes (keep-alive)."""
+        adapters = getattr(requests, "adapters", None)
+        if adapters is not None:
+            session = requests.Session()
+            adapter = adapters.HTTPAdapter(
+                pool_connections=pool.pool_connections,
+                pool_maxsize=pool.pool_maxsize,
+                pool_block=pool.pool_block,
+            )
+            # Conexiones cronometradas para separar DNS+connect del TTFB en las métricas
+            adapter.poolmanager.pool_classes_by_scheme = _timed_pool_classes()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            return session
+
+        # Fallback httpx (móvil): los límites se traducen a httpx.Limits
+        return requests.Session(limits=_httpx_limits(pool))
+
+    def close(self) -> None:
+        """Cierra la sesión y libera los sockets del pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        try:
+            self._session.close()
+        except Exception:
+            pass
+
+    # -------- reintentos + circuit breaker ----------
+    def _send_with_retry(self, method: str, send: Callable[[], Any]):
+        """Ejecuta send() aplicando self.retry y el circuit breaker del host.
+
+        Devuelve la última respuesta; relanza el último error de red o
+        CircuitOpenError si el host está caído.
+        """
+        host = urlsplit(self.base_url).netloc
+        attempt = 0
+        while True:
+            probe = self.breaker.before_request(host) if self.breaker is not None else False
+            try:
+                resp = send()
+            except requests.exceptions.RequestException:
+                if self.breaker is not None:
+                    self.breaker.record_failure()
+                if not self.retry.should_retry(method, 0, attempt):
+                    raise
+                time.sleep(self.retry.backoff(attempt))
+                attempt += 1
+                continue
+            except BaseException:
+                # Cualquier otro final (excepción ajena a la red, interrupción)
+                # no dice nada del host, pero la prueba half-open debe liberarse
+                if probe:
+                    self.breaker.release_probe()
+                raise
+
+            status = resp.status_code
+            if self.breaker is not None:
+                if is_failure_status(status):
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.record_success()
+            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            if not self.retry.should_retry(method, status, attempt, retry_after):
+                return resp
+            resp.close()  # libera la conexión antes de reintentar (respuestas en streaming)
+            time.sleep(self.retry.backoff(attempt, retry_after))
+            attempt += 1
+
     # -------- core request ----------
     def _request(
         self,
@@ -78,38 +289,369 @@ class RestClient:
         json: JSON = None,
         data: Any = None,
     ) -> Tuple[bool, JSON, int, Optional[str]]:
+        method = method.upper()
+        hooks = self.hooks
+        if not hooks:
+            return self._perform(method, path, params, headers, json, data, None)
+
+        event = RequestEvent(
+            method=method,
+            path=path,
+            template=path_template(path, params),
+            url=f"{self.base_url}/{path.lstrip('/')}",
+            started_at=time.time(),
+        )
+        emit(hooks, "before", event)
+        t0 = time.perf_counter()
+        result = self._perform(method, path, params, headers, json, data, event)
+        event.total_s = time.perf_counter() - t0
+        event.status = result[2]
+        if event.status == 0:
+            event.error = result[3]
+            emit(hooks, "error", event)
+        else:
+            emit(hooks, "after", event)
+        return result
+
+    def _perform(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        json: JSON,
+        data: Any,
+        event: Optional[RequestEvent],
+        refresh: bool = False,
+    ) -> Result:
+        """Cuerpo de _request; si hay event, anota tiempos, bytes y resultado de caché.
+
+        refresh=True es la revalidación en segundo plano de stale-while-revalidate.
+        """
         url = f"{self.base_url}/{path.lstrip('/')}"
         merged_headers = {**self.default_headers, **(headers or {})}
 
-        try:
-            resp = self._session.request(
-                method=method.upper(),
-                url=url,
-                params=params,
-                headers=merged_headers,
-                json=json,
-                data=data,
-                timeout=self.timeout,
+        # Caché de GET: hit fresco sin red; entrada vencida → petición condicional.
+        # Las rutas sin TTL (users?search=...) ni se buscan: sin SQLite ni misses
+        cache = self.cache if method == "GET" and self.cache is not None and self.cache.cacheable(path) else None
+        cache_key = None
+        entry = None
+        if cache is not None:
+            cache_key = cache.key(url, params)
+            entry = cache.lookup(cache_key)
+            if entry is not None and entry.is_fresh():
+                cache.record_hit(entry)
+                if event is not None:
+                    event.cache = "hit"
+                return True, entry.payload(), entry.status, None
+            if entry is not None and not refresh and cache.can_serve_stale(entry):
+                # stale-while-revalidate: se entrega la copia vencida y se refresca aparte
+                cache.record_stale(entry)
+                self._refresh_in_background(cache_key, method, path, params, headers)
+                if event is not None:
+                    event.cache = "stale"
+                return True, entry.payload(), entry.status, None
+            if entry is not None:
+                merged_headers.update(entry.validators())
+
+        def stale_on_error() -> Optional[Result]:
+            # stale-if-error: sin respuesta útil del servidor, la última copia conocida
+            if entry is None or not cache.can_serve_on_error(entry):
+                return None
+            cache.record_stale(entry)
+            if event is not None:
+                event.cache = "stale-if-error"
+            return True, entry.payload(), entry.status, None
+
+        timer = None
+        extra: Dict[str, Any] = {}
+        if event is not None and _HTTPX_SESSION:
+            timer = PhaseTimer()
+            extra["extensions"] = {"trace": timer.trace}
+
+        def send():
+            if event is not None:
+                event.extra["leader"] = True
+                _conn_timing.connect_s = None
+            resp = self._send_with_retry(
+                method,
+                lambda: self._session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    headers=merged_headers,
+                    json=json,
+                    data=data,
+                    timeout=self.timeout,
+                    **extra,
+                ),
             )
+            if event is not None:
+                if timer is not None:
+                    event.connect_s, event.ttfb_s = timer.connect_s, timer.ttfb_s
+                else:
+                    event.connect_s = _conn_timing.connect_s
+                    event.ttfb_s = resp.elapsed.total_seconds()
+            return resp
+
+        try:
+            if method == "GET":
+                # GETs idénticos en vuelo (varias vistas/sesiones) comparten la misma petición
+                resp = self._flight.do(flight_key(method, url, params, merged_headers), send)
+            else:
+                resp = send()
 
             if self.raise_on_http_error:
                 resp.raise_for_status()
 
             status = resp.status_code
+            if event is not None:
+                event.bytes_in = len(resp.content)
+                event.bytes_out = body_size(getattr(resp.request, "body", None) or getattr(resp.request, "content", None))
+                if not event.extra.pop("leader", False):
+                    event.extra["coalesced"] = True  # compartió la respuesta de otro GET en vuelo
+
+            if cache is not None:
+                if status == 304 and entry is not None:
+                    cache.revalidated(cache_key, entry, path, resp.headers)
+                    if event is not None:
+                        event.cache = "revalidated"
+                    return True, entry.payload(), entry.status, None
+                cache.record_miss()
+                if event is not None:
+                    event.cache = "miss"
+                if 200 <= status < 300:
+                    cache.store(cache_key, path, status, resp.content, resp.headers)
+                elif status >= 500:
+                    stale = stale_on_error()
+                    if stale is not None:
+                        return stale
+            elif self.cache is not None and 200 <= status < 300 and method != "GET":
+                # Una escritura deja obsoleta la colección: invalidar "<base>/<coleccion>"
+                collection = path.strip("/").split("/", 1)[0].split("?", 1)[0]
+                self.cache.invalidate_path(f"{self.base_url}/{collection}")
 
             # intenta decodificar JSON, si no, regresa texto
-            try:
-                payload: JSON = resp.json() if resp.content else None
-            except ValueError:
-                payload = {"raw": resp.text} if resp.text else None
+            payload = _decode_payload(resp)
 
             ok = 200 <= status < 300
             err = None if ok else f"HTTP {status}"
             return ok, payload, status, err
 
-        except requests.exceptions.RequestException as e:
+        except (CircuitOpenError, requests.exceptions.RequestException) as e:
+            if cache is not None:
+                stale = stale_on_error()
+                if stale is not None:
+                    return stale
             return False, None, 0, str(e)
 
+    def _refresh_in_background(
+        self,
+        cache_key: str,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+    ) -> None:
+        """Revalida una entrada vencida en el pool de hilos (una sola vez por clave)."""
+        with self._executor_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+
+        def run() -> None:
+            try:
+                self._perform(method, path, params, headers, None, None, None, refresh=True)
+            finally:
+                with self._executor_lock:
+                    self._refreshing.discard(cache_key)
+
+        try:
+            self._get_executor().submit(run)
+        except RuntimeError:  # executor cerrado (close())
+            with self._executor_lock:
+                self._refreshing.discard(cache_key)
+
+    # -------- peticiones concurrentes ----------
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Pool de hilos acotado al tamaño del pool de conexiones por host
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.pool.pool_maxsize, thread_name_prefix="restclient"
+                )
+            return self._executor
+
+    def gather(
+        self,
+        specs: Sequence[RequestSpec],
+        *,
+        first_success: bool = False,
+        accept: Optional[Callable[[Result], bool]] = None,
+        ordered: bool = False,
+    ):
+        """Lanza varias peticiones a la vez.
+
+        - Por defecto devuelve la lista de resultados (ok, data, status, err)
+          en el mismo orden que specs.
+        - first_success=True devuelve (indice, resultado) del primero que termine
+          y cumpla accept (por defecto: ok). Las peticiones que aún no empezaron
+          se cancelan; las que ya están en la red terminan en segundo plano y se
+          descartan. Si ninguna cumple, devuelve (-1, ultimo_resultado).
+        - Con ordered=True gana el de menor índice que cumpla accept (no el más
+          rápido): solo se espera a los anteriores a él, todos salen a la vez.
+        """
+        normalized = [_normalize_spec(s) for s in specs]
+        if not normalized:
+            return (-1, (False, None, 0, "no requests")) if first_success else []
+
+        def run(spec: Dict[str, Any]) -> Result:
+            spec = dict(spec)
+            return self._request(spec.pop("method"), spec.pop("path"), **spec)
+
+        executor = self._get_executor()
+        futures = [executor.submit(run, spec) for spec in normalized]
+        if not first_success:
+            return [f.result() for f in futures]
+
+        accept = accept or (lambda r: r[0])
+        if ordered:
+            last = (False, None, 0, "no requests")
+            for i, f in enumerate(futures):
+                last = f.result()
+                if accept(last):
+                    for other in futures[i + 1:]:
+                        other.cancel()
+                    return i, last
+            return -1, last
+        index_of = {f: i for i, f in enumerate(futures)}
+        pending = set(futures)
+        last: Result = (False, None, 0, "no requests")
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for f in sorted(done, key=index_of.get):
+                last = f.result()
+                if accept(last):
+                    for other in pending:
+                        other.cancel()
+                    return index_of[f], last
+        return -1, last
+
+    def get_many(
+        self,
+        paths: Sequence[str],
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        first_success: bool = False,
+        accept: Optional[Callable[[Result], bool]] = None,
+        ordered: bool = False,
+    ):
+        """Atajo de gather() para varios GET con los mismos params."""
+        specs = [{"method": "GET", "path": p, "params": params} for p in paths]
+        return self.gather(specs, first_success=first_success, accept=accept, ordered=ordered)
+
+    # -------- paginación ----------
+    def iter_pages(
+        self,
+        path: str,
+        *,
+        page_size: int = 100,
+        params: Optional[Dict[str, Any]] = None,
+        start_page: int = 1,
+        prefetch: bool = True,
+        on_error: Optional[Callable[[Result], None]] = None,
+    ) -> Iterator[Any]:
+        """Recorre una colección de MockAPI página a página (?page=N&limit=page_size).
+
+        Entrega los elementos a medida que llegan las páginas; con prefetch la
+        página siguiente se pide en segundo plano mientras se consume la actual.
+        Si el llamador hace break, no se piden más páginas. Una página que falla
+        corta la iteración y se informa a on_error(resultado).
+        """
+        base = dict(params or {})
+
+        def fetch(page: int) -> Result:
+            return self.get(path, params={**base, "page": page, "limit": page_size})
+
+        executor = self._get_executor() if prefetch else None
+        page = start_page
+        pending = executor.submit(fetch, page) if executor is not None else None
+        try:
+            while True:
+                result = pending.result() if pending is not None else fetch(page)
+                pending = None
+                ok, data, _status, _err = result
+                if not ok or not isinstance(data, list):
+                    if on_error is not None:
+                        on_error(result)
+                    return
+                has_more = len(data) >= page_size
+                page += 1
+                if has_more and executor is not None:
+                    pending = executor.submit(fetch, page)
+                yield from data
+                if not has_more:
+                    return
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    # -------- decodificación incremental ----------
+    def stream_array(
+        self,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 64 * 1024,
+        on_error: Optional[Callable[[Result], None]] = None,
+    ) -> Iterator[Any]:
+        """GET de una colección decodificando el array JSON elemento a elemento.
+
+        El cuerpo se lee en trozos de chunk_size y cada elemento se entrega al
+        completarse, así la memoria pico queda acotada por el elemento más grande.
+        No pasa por la caché ni por single-flight. Un error de red, un estado
+        no 2xx o un cuerpo que no es array se informan a on_error(resultado).
+        """
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        merged_headers = {**self.default_headers, **(headers or {})}
+        try:
+            resp = self._send_with_retry(
+                "GET",
+                lambda: self._session.request(
+                    method="GET",
+                    url=url,
+                    params=params,
+                    headers=merged_headers,
+                    timeout=self.timeout,
+                    stream=True,
+                ),
+            )
+        except (CircuitOpenError, requests.exceptions.RequestException) as e:
+            if on_error is not None:
+                on_error((False, None, 0, str(e)))
+            return
+
+        try:
+            status = resp.status_code
+            if not 200 <= status < 300:
+                if on_error is not None:
+                    on_error((False, _decode_payload(resp), status, f"HTTP {status}"))
+                return
+            chunks = (
+                resp.iter_content(chunk_size) if hasattr(resp, "iter_content") else resp.iter_bytes(chunk_size)
+            )
+            try:
+                yield from iter_json_array(chunks)
+            except ValueError as e:
+                if on_error is not None:
+                    on_error((False, None, status, f"JSON inválido: {e}"))
+            except requests.exceptions.RequestException as e:
+                if on_error is not None:
+                    on_error((False, None, status, str(e)))
+        finally:
+            resp.close()
+
     # -------- public helpers ----------
     def get(
         self,
@@ -161,3 +703,526 @@ class RestClient:
         headers: Optional[Dict[str, str]] = None,
     ):
         return self._request("DELETE", path, params=params, headers=headers)
+
+
+async def _aclose_quietly(client) -> None:
+    try:
+        await client.aclose()
+    except Exception:
+        pass  # sockets de un loop ya cerrado: no hay nada más que liberar
+
+
+class AsyncRestClient:
+    """
+    Variante asyncio de RestClient sobre httpx.AsyncClient.
+    Devuelve el mismo contrato (ok, data, status, err) pero con await, para
+    usarse dentro de page.run_task sin ocupar un hilo por petición:
+
+        api = get_async_client(URL_API)
+        ok, data, status, err = await api.get("users", params={"search": u},
+                                              group="login", deadline=5)
+
+    - deadline: segundos máximos para toda la petición (conexión + respuesta).
+      Si vence se devuelve (False, None, 0, "deadline exceeded").
+    - group: etiqueta para cancelar en bloque con cancel(group), p. ej. cuando
+      el estudiante sale de la vista. Las peticiones canceladas así devuelven
+      (False, None, 0, "cancelled"); si se cancela la tarea que hace el await,
+      la CancelledError se propaga como siempre.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        default_headers: Optional[Dict[str, str]] = None,
+        timeout: int = 12,
+        pool: Optional[PoolConfig] = None,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: bool = True,
+        hooks: Optional[Sequence[RequestHook]] = None,
+    ) -> None:
+        if httpx is None:
+            raise RuntimeError("AsyncRestClient requiere httpx instalado")
+        self.base_url = base_url.rstrip("/")
+        self.default_headers = default_headers or {"Content-Type": "application/json"}
+        self.timeout = timeout
+        self.hooks: List[RequestHook] = list(hooks or [])
+        self.pool = pool or DEFAULT_POOL
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker_for(urlsplit(self.base_url).netloc) if circuit_breaker else None
+        self._client = None
+        self._client_loop = None
+        self._inflight: Dict[asyncio.Task, Optional[str]] = {}
+        self._aborted: Set[asyncio.Task] = set()
+        self._flight = AsyncSingleFlight()
+        self._closing: Set[asyncio.Future] = set()   # aclose() de clientes de loops anteriores
+
+    def _get_client(self):
+        # httpx.AsyncClient queda ligado al event loop donde abre sus sockets
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            if self._client is not None:
+                # el cliente del loop anterior no sirve aquí: cerrarlo para no
+                # dejar su pool de conexiones abierto
+                self._retire(self._client, self._client_loop)
+                self._flight = AsyncSingleFlight()  # sus llamadas son del loop anterior
+            self._client = httpx.AsyncClient(
+                headers=self.default_headers,
+                limits=_httpx_limits(self.pool),
+                timeout=self.timeout,
+            )
+            self._client_loop = loop
+        return self._client
+
+    def _retire(self, client, loop) -> None:
+        """Cierra un AsyncClient de otro loop: en su loop si sigue vivo, si no en el actual."""
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            try:
+                asyncio.run_coroutine_threadsafe(_aclose_quietly(client), loop)
+                return
+            except RuntimeError:
+                pass  # loop cerrándose
+        task = asyncio.ensure_future(_aclose_quietly(client))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    add_hook = RestClient.add_hook
+    remove_hook = RestClient.remove_hook
+
+    async def aclose(self) -> None:
+        """Cierra el AsyncClient y libera los sockets del pool."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def cancel(self, group: Optional[str] = None) -> int:
+        """Cancela las peticiones en curso (todas, o solo las de group). Devuelve cuántas."""
+        count = 0
+        for task, task_group in list(self._inflight.items()):
+            if group is None or task_group == group:
+                if not task.done():
+                    self._aborted.add(task)
+                    task.cancel()
+                    count += 1
+        return count
+
+    async def _send_with_retry(self, method: str, send):
+        """Igual que RestClient._send_with_retry pero esperando con asyncio.sleep."""
+        host = urlsplit(self.base_url).netloc
+        attempt = 0
+        while True:
+            probe = self.breaker.before_request(host) if self.breaker is not None else False
+            try:
+                resp = await send()
+            except httpx.HTTPError:
+                if self.breaker is not None:
+                    self.breaker.record_failure()
+                if not self.retry.should_retry(method, 0, attempt):
+                    raise
+                await asyncio.sleep(self.retry.backoff(attempt))
+                attempt += 1
+                continue
+            except BaseException:
+                # deadline=, cancel(group) o la tarea cancelada (CancelledError):
+                # sin liberar la prueba el breaker rechazaría todo hasta reiniciar
+                if probe:
+                    self.breaker.release_probe()
+                raise
+
+            status = resp.status_code
+            if self.breaker is not None:
+                if is_failure_status(status):
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.record_success()
+            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            if not self.retry.should_retry(method, status, attempt, retry_after):
+                return resp
+            await resp.aclose()
+            await asyncio.sleep(self.retry.backoff(attempt, retry_after))
+            attempt += 1
+
+    # -------- core request ----------
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        json: JSON = None,
+        data: Any = None,
+        deadline: Optional[float] = None,
+        group: Optional[str] = None,
+    ) -> Tuple[bool, JSON, int, Optional[str]]:
+        method = method.upper()
+        hooks = self.hooks
+        if not hooks:
+            return await self._perform(method, path, params, headers, json, data, deadline, group, None)
+
+        event = RequestEvent(
+            method=method,
+            path=path,
+            template=path_template(path, params),
+            url=f"{self.base_url}/{path.lstrip('/')}",
+            started_at=time.time(),
+        )
+        emit(hooks, "before", event)
+        t0 = time.perf_counter()
+        try:
+            result = await self._perform(method, path, params, headers, json, data, deadline, group, event)
+        except asyncio.CancelledError:
+            event.total_s = time.perf_counter() - t0
+            event.error = "cancelled"
+            emit(hooks, "error", event)
+            raise
+        event.total_s = time.perf_counter() - t0
+        event.status = result[2]
+        if event.status == 0:
+            event.error = result[3]
+            emit(hooks, "error", event)
+        else:
+            emit(hooks, "after", event)
+        return result
+
+    async def _perform(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        json: JSON,
+        data: Any,
+        deadline: Optional[float],
+        group: Optional[str],
+        event: Optional[RequestEvent],
+    ) -> Result:
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        client = self._get_client()
+        timer = PhaseTimer() if event is not None else None
+        extra: Dict[str, Any] = {"extensions": {"trace": timer.atrace}} if timer is not None else {}
+
+        def send():
+            if event is not None:
+                event.extra["leader"] = True
+            return self._send_with_retry(
+                method,
+                lambda: client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    headers=headers,
+                    json=json,
+                    data=data,
+                    **extra,
+                ),
+            )
+
+        if method == "GET":
+            merged = {**self.default_headers, **(headers or {})}
+            task = asyncio.ensure_future(self._flight.do(flight_key(method, url, params, merged), send))
+        else:
+            task = asyncio.ensure_future(send())
+        self._inflight[task] = group
+        try:
+            resp = await asyncio.wait_for(task, timeout=deadline)
+        except asyncio.TimeoutError:
+            return False, None, 0, "deadline exceeded"
+        except CircuitOpenError as e:
+            return False, None, 0, str(e)
+        except asyncio.CancelledError:
+            if task in self._aborted:
+                return False, None, 0, "cancelled"
+            raise
+        except httpx.HTTPError as e:
+            return False, None, 0, str(e) or type(e).__name__
+        finally:
+            self._inflight.pop(task, None)
+            self._aborted.discard(task)
+
+        status = resp.status_code
+        if event is not None:
+            event.bytes_in = len(resp.content)
+            event.bytes_out = body_size(resp.request.content)
+            if event.extra.pop("leader", False):
+                event.connect_s, event.ttfb_s = timer.connect_s, timer.ttfb_s
+            else:
+                event.extra["coalesced"] = True
+        payload = _decode_payload(resp)
+        ok = 200 <= status < 300
+        err = None if ok else f"HTTP {status}"
+        return ok, payload, status, err
+
+    # -------- peticiones concurrentes ----------
+    async def gather(
+        self,
+        specs: Sequence[RequestSpec],
+        *,
+        first_success: bool = False,
+        accept: Optional[Callable[[Result], bool]] = None,
+        max_concurrency: Optional[int] = None,
+        deadline: Optional[float] = None,
+        group: Optional[str] = None,
+    ):
+        """Versión asyncio de RestClient.gather; en modo first_success las
+        peticiones restantes sí se cancelan de verdad."""
+        normalized = [_normalize_spec(s) for s in specs]
+        if not normalized:
+            return (-1, (False, None, 0, "no requests")) if first_success else []
+        sem = asyncio.Semaphore(max_concurrency or self.pool.pool_maxsize)
+
+        async def run(spec: Dict[str, Any]) -> Result:
+            spec = dict(spec)
+            async with sem:
+                return await self._request(
+                    spec.pop("method"), spec.pop("path"), deadline=deadline, group=group, **spec
+                )
+
+        tasks = [asyncio.ensure_future(run(spec)) for spec in normalized]
+        if not first_success:
+            try:
+                return list(await asyncio.gather(*tasks))
+            except asyncio.CancelledError:
+                for t in tasks:
+                    t.cancel()
+                raise
+
+        accept = accept or (lambda r: r[0])
+        index_of = {t: i for i, t in enumerate(tasks)}
+        pending = set(tasks)
+        last: Result = (False, None, 0, "no requests")
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for t in sorted(done, key=index_of.get):
+                    last = t.result()
+                    if accept(last):
+                        return index_of[t], last
+            return -1, last
+        finally:
+            for t in pending:
+                t.cancel()
+
+    async def get_many(
+        self,
+        paths: Sequence[str],
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        first_success: bool = False,
+        accept: Optional[Callable[[Result], bool]] = None,
+        deadline: Optional[float] = None,
+        group: Optional[str] = None,
+    ):
+        """Atajo de gather() para varios GET con los mismos params."""
+        specs = [{"method": "GET", "path": p, "params": params} for p in paths]
+        return await self.gather(specs, first_success=first_success, accept=accept, deadline=deadline, group=group)
+
+    # -------- paginación ----------
+    async def iter_pages(
+        self,
+        path: str,
+        *,
+        page_size: int = 100,
+        params: Optional[Dict[str, Any]] = None,
+        start_page: int = 1,
+        prefetch: bool = True,
+        on_error: Optional[Callable[[Result], None]] = None,
+        deadline: Optional[float] = None,
+        group: Optional[str] = None,
+    ) -> AsyncIterator[Any]:
+        """Versión asyncio de RestClient.iter_pages (usar con async for)."""
+        base = dict(params or {})
+
+        def fetch(page: int):
+            return asyncio.ensure_future(
+                self.get(path, params={**base, "page": page, "limit": page_size}, deadline=deadline, group=group)
+            )
+
+        page = start_page
+        pending = fetch(page)
+        try:
+            while pending is not None:
+                result = await pending
+                pending = None
+                ok, data, _status, _err = result
+                if not ok or not isinstance(data, list):
+                    if on_error is not None:
+                        on_error(result)
+                    return
+                has_more = len(data) >= page_size
+                page += 1
+                if has_more:
+                    if prefetch:
+                        pending = fetch(page)
+                    for item in data:
+                        yield item
+                    if pending is None:
+                        pending = fetch(page)
+                else:
+                    for item in data:
+                        yield item
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    # -------- decodificación incremental ----------
+    async def stream_array(
+        self,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        on_error: Optional[Callable[[Result], None]] = None,
+    ) -> AsyncIterator[Any]:
+        """Versión asyncio de RestClient.stream_array (usar con async for)."""
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        client = self._get_client()
+        try:
+            resp = await self._send_with_retry(
+                "GET",
+                lambda: client.send(client.build_request("GET", url, params=params, headers=headers), stream=True),
+            )
+        except (CircuitOpenError, httpx.HTTPError) as e:
+            if on_error is not None:
+                on_error((False, None, 0, str(e) or type(e).__name__))
+            return
+
+        try:
+            status = resp.status_code
+            if not 200 <= status < 300:
+                await resp.aread()
+                if on_error is not None:
+                    on_error((False, _decode_payload(resp), status, f"HTTP {status}"))
+                return
+            try:
+                async for item in aiter_json_array(resp.aiter_bytes()):
+                    yield item
+            except ValueError as e:
+                if on_error is not None:
+                    on_error((False, None, status, f"JSON inválido: {e}"))
+            except httpx.HTTPError as e:
+                if on_error is not None:
+                    on_error((False, None, status, str(e) or type(e).__name__))
+        finally:
+            await resp.aclose()
+
+    # -------- public helpers ----------
+    async def get(
+        self,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[float] = None,
+        group: Optional[str] = None,
+    ):
+        return await self._request("GET", path, params=params, headers=headers, deadline=deadline, group=group)
+
+    async def post(
+        self,
+        path: str,
+        *,
+        json: JSON = None,
+        data: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[float] = None,
+        group: Optional[str] = None,
+    ):
+        return await self._request(
+            "POST", path, params=params, headers=headers, json=json, data=data, deadline=deadline, group=group
+        )
+
+    async def put(
+        self,
+        path: str,
+        *,
+        json: JSON = None,
+        data: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[float] = None,
+        group: Optional[str] = None,
+    ):
+        return await self._request(
+            "PUT", path, params=params, headers=headers, json=json, data=data, deadline=deadline, group=group
+        )
+
+    async def patch(
+        self,
+        path: str,
+        *,
+        json: JSON = None,
+        data: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[float] = None,
+        group: Optional[str] = None,
+    ):
+        return await self._request(
+            "PATCH", path, params=params, headers=headers, json=json, data=data, deadline=deadline, group=group
+        )
+
+    async def delete(
+        self,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[float] = None,
+        group: Optional[str] = None,
+    ):
+        return await self._request("DELETE", path, params=params, headers=headers, deadline=deadline, group=group)
+
+
+# -------- registro de clientes compartidos ----------
+# Un único RestClient por base URL en todo el proceso: al navegar entre
+# login → dashboard → examen se reutilizan los sockets TLS ya abiertos.
+_clients: Dict[str, RestClient] = {}
+_async_clients: Dict[str, AsyncRestClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(base_url: str, pool: Optional[PoolConfig] = None) -> RestClient:
+    """Devuelve el RestClient compartido para base_url (lo crea la primera vez).
+
+    El pool solo se aplica al crear el cliente; las llamadas posteriores
+    reciben la misma instancia aunque pasen otro PoolConfig. Los clientes
+    compartidos reportan sus peticiones a metrics.METRICS.
+    """
+    key = base_url.rstrip("/")
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = RestClient(base_url=key, pool=pool, hooks=[METRICS])
+            _clients[key] = client
+        return client
+
+
+def get_async_client(base_url: str, pool: Optional[PoolConfig] = None) -> AsyncRestClient:
+    """Igual que get_client pero para AsyncRestClient."""
+    key = base_url.rstrip("/")
+    with _clients_lock:
+        client = _async_clients.get(key)
+        if client is None:
+            client = AsyncRestClient(base_url=key, pool=pool, hooks=[METRICS])
+            _async_clients[key] = client
+        return client
+
+
+def configure_pool(pool: PoolConfig) -> None:
+    """Cambia el PoolConfig por defecto de los clientes creados a partir de ahora."""
+    global DEFAULT_POOL
+    DEFAULT_POOL = pool
+
+
+def close_clients() -> None:
+    """Cierra y olvida todos los clientes síncronos compartidos (p. ej. al salir de la app).
+
+    Los AsyncRestClient solo se olvidan: su cierre es asíncrono (aclose()).
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+        _async_clients.clear()
+    for client in clients:
+        client.close()
@@ -0,0 +1,180 @@
+# src/API/diskcache.py
+"""Segundo nivel persistente (SQLite) para ResponseCache.
+
+Guarda las respuestas GET cacheables en un archivo local que sobrevive a
+reinicios: al abrir la app el catálogo de pruebas se puede mostrar al instante
+(o sin red) a partir de la última copia conocida.
+
+- Clave primaria = clave de ResponseCache (url + query ordenada).
+- Índice por accessed_at para desalojar lo menos usado cuando el archivo
+  supera max_bytes.
+- Las fechas se guardan en tiempo de pared (time.time()) porque el reloj
+  monotónico no sobrevive al proceso.
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Optional, Tuple
+import sqlite3
+import threading
+import time
+
+from ..utils.storage import app_data_dir
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key           TEXT PRIMARY KEY,
+    status        INTEGER NOT NULL,
+    body          BLOB NOT NULL,
+    etag          TEXT,
+    last_modified TEXT,
+    expires_at    REAL NOT NULL,
+    accessed_at   REAL NOT NULL,
+    size          INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed_at);
+"""
+
+# (status, body, etag, last_modified, expires_at en tiempo de pared)
+Row = Tuple[int, bytes, Optional[str], Optional[str], float]
+
+
+class DiskCache:
+    """Tabla SQLite de respuestas acotada por max_bytes (LRU por accessed_at)."""
+
+    def __init__(self, path: Optional[Path] = None, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self.path: Optional[Path] = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._bytes = 0
+        try:
+            # app_data_dir() crea la carpeta: HOME de solo lectura o un
+            # MTG_DATA_DIR inválido tampoco deben impedir que arranque la app
+            self.path = path or app_data_dir() / "http_cache.sqlite3"
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            self._conn = conn
+        except (OSError, sqlite3.Error):
+            self._conn = None  # sin disco utilizable: ResponseCache sigue solo en memoria
+
+    @property
+    def available(self) -> bool:
+        return self._conn is not None
+
+    def get(self, key: str) -> Optional[Row]:
+        if self._conn is None:
+            return None
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT status, body, etag, last_modified, expires_at FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            except sqlite3.Error:
+                return None
+        if row is None:
+            return None
+        status, body, etag, last_modified, expires_at = row
+        return status, bytes(body), etag, last_modified, expires_at
+
+    def put(
+        self,
+        key: str,
+        status: int,
+        body: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        expires_at: float,
+    ) -> None:
+        if self._conn is None or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            try:
+                old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, status, body, etag, last_modified, expires_at, accessed_at, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, status, sqlite3.Binary(body), etag, last_modified, expires_at, time.time(), len(body)),
+                )
+                self._bytes += len(body) - (old[0] if old else 0)
+                if self._bytes > self.max_bytes:
+                    self._evict()
+            except sqlite3.Error:
+                pass
+
+    def touch(self, key: str, expires_at: float, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Renueva la expiración (y validadores) tras un 304."""
+        if self._conn is None:
+            return
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "UPDATE responses SET expires_at = ?, accessed_at = ?, "
+                    "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE key = ?",
+                    (expires_at, time.time(), etag, last_modified, key),
+                )
+            except sqlite3.Error:
+                pass
+
+    def invalidate(self, prefix: str = "") -> int:
+        if prefix:
+            # Rango sobre la clave primaria (usa el índice, a diferencia de LIKE)
+            return self._delete("key >= ? AND key < ?", (prefix, prefix + "\U0010ffff"))
+        return self._delete("1", ())
+
+    def invalidate_path(self, url: str) -> int:
+        """Borra url y sus sub-rutas (url/..., url?...), sin tocar "urlX"."""
+        return self._delete(
+            "key = ? OR (key >= ? AND key < ?) OR (key >= ? AND key < ?)",
+            (url, url + "/", url + "/\U0010ffff", url + "?", url + "?\U0010ffff"),
+        )
+
+    def _delete(self, where: str, args: tuple) -> int:
+        if self._conn is None:
+            return 0
+        with self._lock:
+            try:
+                freed = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM responses WHERE {where}", args).fetchone()[0]
+                count = self._conn.execute(f"DELETE FROM responses WHERE {where}", args).rowcount
+                self._bytes -= freed
+                return count
+            except sqlite3.Error:
+                return 0
+
+    def _evict(self) -> None:
+        # Borra por lotes los menos usados hasta quedar por debajo del 90 % del tope
+        target = int(self.max_bytes * 0.9)
+        while self._bytes > target:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 32"
+            ).fetchall()
+            if not rows:
+                self._bytes = 0
+                return
+            for key, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._bytes -= size
+                if self._bytes <= target:
+                    break
+
+    def __len__(self) -> int:
+        if self._conn is None:
+            return 0
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,185 @@
+# src/API/endpoints.py
+"""Resolución de endpoints con nombres alternativos (pruebas/exams, intentos/results).
+
+La API no es consistente con los nombres de las colecciones, así que la app
+probaba varias rutas en cada llamada. EndpointResolver aprende qué alias
+responde para cada base URL, lo guarda en disco con TTL y manda las llamadas
+siguientes directo a esa ruta; solo vuelve a sondear cuando la colección
+misma deja de existir (404 u otro 4xx), no ante caídas de red, errores 5xx ni
+respuestas que el llamador rechaza.
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+import json
+import os
+import threading
+import time
+
+from ..utils.storage import app_data_dir
+
+# Nombre lógico → alias posibles, en orden de preferencia
+ALIASES: Dict[str, Tuple[str, ...]] = {
+    "catalog": ("pruebas", "exams", "Exams", "Pruebas"),
+    "attempts": ("intentos", "results"),
+}
+
+DEFAULT_TTL = 7 * 24 * 3600.0
+
+Result = Tuple[bool, Any, int, Optional[str]]
+
+
+class EndpointStore:
+    """Mapa persistente {base_url: {nombre: {"alias", "learned_at"}}} en un JSON."""
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = DEFAULT_TTL) -> None:
+        try:
+            self.path: Optional[Path] = path or app_data_dir() / "endpoints.json"
+        except OSError:
+            self.path = None  # sin carpeta de datos: los alias se aprenden solo en memoria
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, Dict[str, Any]]] = self._read()
+
+    def _read(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if self.path is None:
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        # Solo alias de colecciones: se descartan entradas de versiones
+        # anteriores que guardaban aquí pistas por prueba ("preguntas:<id>")
+        return {
+            base_url: {name: item for name, item in names.items() if name in ALIASES}
+            for base_url, names in data.items()
+            if isinstance(names, dict)
+        }
+
+    def _write(self) -> None:
+        if self.path is None:
+            return
+        tmp = f"{self.path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(self._data, fh)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # sin disco escribible: la resolución sigue funcionando en memoria
+
+    def get(self, base_url: str, name: str) -> Optional[str]:
+        with self._lock:
+            item = self._data.get(base_url, {}).get(name)
+        if not item:
+            return None
+        if time.time() - float(item.get("learned_at", 0)) > self.ttl:
+            return None
+        return item.get("alias")
+
+    def set(self, base_url: str, name: str, alias: str) -> None:
+        with self._lock:
+            current = self._data.setdefault(base_url, {}).get(name)
+            if current and current.get("alias") == alias:
+                return
+            self._data[base_url][name] = {"alias": alias, "learned_at": time.time()}
+            self._write()
+
+    def forget(self, base_url: str, name: str) -> None:
+        with self._lock:
+            if self._data.get(base_url, {}).pop(name, None) is not None:
+                self._write()
+
+
+class EndpointResolver:
+    """Enruta llamadas por nombre lógico al alias que ya se sabe que funciona."""
+
+    def __init__(self, api, store: Optional[EndpointStore] = None) -> None:
+        self.api = api
+        self.store = store or _default_store()
+
+    def known(self, name: str) -> Optional[str]:
+        return self.store.get(self.api.base_url, name)
+
+    def _paths(self, aliases: Sequence[str], suffixes: Sequence[str]):
+        return [(alias, f"{alias}{suffix}") for alias in aliases for suffix in suffixes]
+
+    def get(
+        self,
+        name: str,
+        *,
+        suffixes: Sequence[str] = ("",),
+        params: Optional[Dict[str, Any]] = None,
+        accept: Optional[Callable[[Result], bool]] = None,
+    ) -> Tuple[Optional[str], Result]:
+        """GET sobre el alias conocido (o sondeando todos a la vez si no hay).
+
+        suffixes permite pedir varias rutas por alias, p. ej. ("/12", "") para
+        detalle y lista. Gana la primera ruta aceptada en el orden declarado
+        (alias de ALIASES, luego suffixes), no la que responde más rápido, así
+        el alias aprendido es estable entre ejecuciones. Devuelve
+        (alias_ganador, resultado); alias None si nada fue aceptado.
+        """
+        accept = accept or (lambda r: r[0])
+        alias = self.known(name)
+        if alias is not None:
+            candidates = self._paths([alias], suffixes)
+            idx, result = self.api.get_many([p for _, p in candidates], params=params,
+                                            first_success=True, accept=accept, ordered=True)
+            if idx >= 0:
+                return alias, result
+            # Que el contenido no sirva (p. ej. un id que no existe) no dice nada
+            # del alias: solo se olvida si la ruta de la colección ya no existe
+            if not self._route_gone(alias):
+                return None, result
+            self.store.forget(self.api.base_url, name)
+
+        candidates = self._paths(ALIASES[name], suffixes)
+        idx, result = self.api.get_many([p for _, p in candidates], params=params,
+                                        first_success=True, accept=accept, ordered=True)
+        if idx < 0:
+            return None, result
+        alias = candidates[idx][0]
+        self.store.set(self.api.base_url, name, alias)
+        return alias, result
+
+    def _route_gone(self, alias: str) -> bool:
+        """True si la colección responde con un error que no es pasajero (404, 4xx).
+
+        Red caída (0), 429 y 5xx son problemas del servidor, no del alias.
+        """
+        ok, _data, status, _err = self.api.get(alias, params={"page": 1, "limit": 1})
+        if ok or status == 0:
+            return False
+        return 400 <= status < 500 and status != 429
+
+    def post(
+        self, name: str, *, json: Any = None, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[str], Result]:
+        """POST (no idempotente, así que en serie): alias conocido primero, luego el resto."""
+        known = self.known(name)
+        aliases = [known] if known else []
+        aliases += [a for a in ALIASES[name] if a != known]
+        result: Result = (False, None, 0, "no endpoints")
+        for alias in aliases:
+            result = self.api.post(alias, json=json, headers=headers)
+            if result[0]:
+                self.store.set(self.api.base_url, name, alias)
+                return alias, result
+            if result[2] == 0:
+                break  # sin red: probar otro alias no ayuda
+        return None, result
+
+
+_store: Optional[EndpointStore] = None
+_store_lock = threading.Lock()
+
+
+def _default_store() -> EndpointStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = EndpointStore()
+        return _store
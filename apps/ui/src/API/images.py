@@ -0,0 +1,267 @@
+# src/API/images.py
+"""Caché local de imágenes de opciones (pruebaPanel).
+
+- Descarga en segundo plano con concurrencia acotada; cada URL se pide una
+  sola vez aunque varias preguntas la usen (single-flight por URL).
+- Almacenamiento direccionado por contenido: el archivo se llama como el
+  sha256 de los bytes ya escalados, así dos URLs con la misma imagen ocupan
+  un solo archivo. Un índice SQLite mapea url → digest y lleva accessed_at
+  para desalojar lo menos usado cuando la carpeta supera max_bytes.
+- Si Pillow está instalado la imagen se reescala a la altura de pantalla
+  (42 px, x2 para pantallas densas) antes de guardarla; sin Pillow se guarda
+  tal cual y Flet la escala al pintar.
+- En escritorio/móvil Flet recibe la ruta del archivo local (base64 se
+  reenviaría entero en cada repintado). En modo web el navegador no puede
+  abrir rutas del servidor: ahí se entrega src_base64 si la imagen no pasa
+  de BASE64_MAX_BYTES. Si no está (o es más grande) se usa la URL remota.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+import base64
+import hashlib
+import io
+import os
+import sqlite3
+import threading
+import time
+
+try:
+    from PIL import Image  # opcional: solo para pre-escalar
+except ModuleNotFoundError:
+    Image = None  # type: ignore
+
+from ..utils.storage import app_data_dir
+from .crud import PoolConfig, RestClient
+
+DISPLAY_HEIGHT = 42
+SCALE = 2                      # píxeles físicos por píxel lógico al pre-escalar
+BASE64_MAX_BYTES = 96 * 1024   # modo web: por encima de esto se usa la URL remota
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    url         TEXT PRIMARY KEY,
+    digest      TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS images_accessed ON images(accessed_at);
+CREATE INDEX IF NOT EXISTS images_digest ON images(digest);
+"""
+
+
+def downscale(data: bytes, height: int = DISPLAY_HEIGHT * SCALE) -> Tuple[bytes, str]:
+    """Reescala a `height` px de alto (sin agrandar); devuelve (bytes, extensión)."""
+    if Image is None:
+        return data, _sniff_ext(data)
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if img.height <= height:
+                return data, _sniff_ext(data)
+            width = max(1, round(img.width * height / img.height))
+            small = img.resize((width, height), Image.LANCZOS)
+            out = io.BytesIO()
+            if small.mode in ("RGBA", "LA", "P"):
+                small.save(out, format="PNG", optimize=True)
+                return out.getvalue(), "png"
+            small.convert("RGB").save(out, format="JPEG", quality=85)
+            return out.getvalue(), "jpg"
+    except Exception:
+        return data, _sniff_ext(data)  # formato que Pillow no entiende: se guarda tal cual
+
+
+def _sniff_ext(data: bytes) -> str:
+    if data.startswith(b"\x89PNG"):
+        return "png"
+    if data.startswith(b"\xff\xd8"):
+        return "jpg"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    return "img"
+
+
+class ImageCache:
+    """Archivos por digest + índice url → digest, acotado por max_bytes."""
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        *,
+        max_bytes: int = 64 * 1024 * 1024,
+        concurrency: int = 4,
+        timeout: float = 12.0,
+        memory_items: int = 256,
+    ) -> None:
+        self.root: Optional[Path] = root
+        self.max_bytes = max_bytes
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.memory_items = memory_items
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._memory: "OrderedDict[Tuple[str, bool], Dict[str, str]]" = OrderedDict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._session = None
+        self._bytes = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self.root = root or app_data_dir("images")   # mkdir: puede fallar sin disco
+            conn = sqlite3.connect(str(self.root / "index.sqlite3"), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._bytes = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM images)"
+            ).fetchone()[0]
+            self._conn = conn
+        except (OSError, sqlite3.Error):
+            self._conn = None  # sin disco: las opciones usan la URL remota como antes
+
+    # -------- consulta (hilo de UI) ----------
+    def props(self, url: str, *, web: bool = False) -> Optional[Dict[str, str]]:
+        """Kwargs para ft.Image: {"src": ruta local}, o {"src_base64": ...} con web=True
+        (page.web); None si aún no está o no se puede entregar así."""
+        key = (url, web)
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is not None:
+                self._memory.move_to_end(key)
+                return hit
+        path = self.path_for(url)
+        if path is None:
+            return None
+        if web:
+            try:
+                data = path.read_bytes()
+            except OSError:
+                return None
+            if len(data) > BASE64_MAX_BYTES:
+                return None
+            props = {"src_base64": base64.b64encode(data).decode("ascii")}
+        else:
+            props = {"src": str(path)}
+        with self._lock:
+            self._memory[key] = props
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+        return props
+
+    def path_for(self, url: str) -> Optional[Path]:
+        if self._conn is None:
+            return None
+        with self._lock:
+            try:
+                row = self._conn.execute("SELECT digest FROM images WHERE url = ?", (url,)).fetchone()
+                if row is None:
+                    return None
+                self._conn.execute("UPDATE images SET accessed_at = ? WHERE url = ?", (time.time(), url))
+            except sqlite3.Error:
+                return None
+        path = self.root / row[0]
+        return path if path.exists() else None
+
+    # -------- descarga ----------
+    def prefetch(self, urls: Iterable[str]) -> Dict[str, Future]:
+        """Encola la descarga de las URLs que falten; devuelve {url: Future[bool]}."""
+        futures: Dict[str, Future] = {}
+        if self._conn is None:
+            return futures
+        for url in dict.fromkeys(u for u in urls if u):
+            with self._lock:
+                fut = self._inflight.get(url)
+                if fut is None:
+                    cached = self._conn.execute("SELECT 1 FROM images WHERE url = ?", (url,)).fetchone()
+                    if cached is not None:
+                        continue
+                    fut = self._get_executor().submit(self._fetch, url)
+                    self._inflight[url] = fut
+            futures[url] = fut
+        return futures
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="img-fetch")
+            self._session = RestClient._build_session(
+                PoolConfig(pool_connections=self.concurrency, pool_maxsize=self.concurrency)
+            )
+        return self._executor
+
+    def _fetch(self, url: str) -> bool:
+        try:
+            resp = self._session.request(method="GET", url=url, timeout=self.timeout)
+            if resp.status_code != 200 or not resp.content:
+                return False
+            data, ext = downscale(resp.content)
+            self._store(url, data, ext)
+            return True
+        except Exception:
+            return False  # la opción cae a la URL remota; se reintenta en la próxima carga
+        finally:
+            with self._lock:
+                self._inflight.pop(url, None)
+
+    def _store(self, url: str, data: bytes, ext: str) -> None:
+        digest = f"{hashlib.sha256(data).hexdigest()}.{ext}"
+        path = self.root / digest
+        if not path.exists():
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        with self._lock:
+            try:
+                known = self._conn.execute("SELECT 1 FROM images WHERE digest = ? LIMIT 1", (digest,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO images (url, digest, size, accessed_at) VALUES (?, ?, ?, ?)",
+                    (url, digest, len(data), time.time()),
+                )
+                if known is None:
+                    self._bytes += len(data)
+                if self._bytes > self.max_bytes:
+                    self._evict()
+            except sqlite3.Error:
+                pass
+
+    def _evict(self) -> None:
+        # Menos usados primero hasta el 90 % del tope; un archivo se borra
+        # cuando ninguna URL lo referencia
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute("SELECT url, digest, size FROM images ORDER BY accessed_at").fetchall()
+        for url, digest, size in rows:
+            if self._bytes <= target:
+                break
+            self._conn.execute("DELETE FROM images WHERE url = ?", (url,))
+            self._memory.pop((url, False), None)
+            self._memory.pop((url, True), None)
+            if self._conn.execute("SELECT 1 FROM images WHERE digest = ? LIMIT 1", (digest,)).fetchone() is None:
+                self._bytes -= size
+                try:
+                    (self.root / digest).unlink()
+                except OSError:
+                    pass
+
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        if self._conn is None:
+            return 0
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+
+
+_images: Optional[ImageCache] = None
+_images_lock = threading.Lock()
+
+
+def option_images() -> ImageCache:
+    """ImageCache compartida de la app."""
+    global _images
+    with _images_lock:
+        if _images is None:
+            _images = ImageCache()
+        return _images
+
@@ -0,0 +1,172 @@
+# src/API/jsonstream.py
+"""Decodificación JSON rápida e incremental.
+
+- loads: usa orjson si está instalado (mucho más rápido), si no json estándar.
+- JsonArrayParser: recibe el cuerpo de un array JSON de nivel superior en
+  trozos de bytes y entrega cada elemento apenas se completa. Solo guarda en
+  memoria el elemento en curso, así un listado de exámenes de varios MB no se
+  mantiene entero como bytes + texto + árbol de objetos.
+"""
+from __future__ import annotations
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List
+import json
+import re
+
+try:
+    import orjson as _orjson
+except ModuleNotFoundError:
+    _orjson = None
+
+JSON_BACKEND = "orjson" if _orjson is not None else "json"
+
+
+def loads(data: Any) -> Any:
+    """json.loads con el backend más rápido disponible (acepta bytes o str)."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+# Caracteres estructurales que interesan fuera / dentro de un string
+_STRUCT = re.compile(rb'["\[\]{},]')
+_IN_STRING = re.compile(rb'["\\]')
+_WS = b" \t\r\n"
+
+
+class JsonArrayParser:
+    """Parser incremental de un array JSON: feed(chunk) devuelve los elementos completos."""
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._pos = 0            # siguiente byte por examinar en _buf
+        self._start = -1         # inicio del elemento en curso (-1 = ninguno)
+        self._depth = 0          # profundidad dentro del elemento en curso
+        self._in_string = False
+        self._escape = False
+        self._opened = False     # ya se vio el '[' de nivel superior
+        self._closed = False     # ya se vio el ']' de nivel superior
+
+    @property
+    def done(self) -> bool:
+        return self._closed
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        if self._closed or not chunk:
+            return []
+        self._buf += chunk
+        out: List[Any] = []
+        buf = self._buf
+        pos = self._pos
+        end = len(buf)
+
+        if not self._opened:
+            while pos < end and buf[pos] in _WS:
+                pos += 1
+            if pos == end:
+                self._compact(pos)
+                return out
+            if buf[pos:pos + 1] != b"[":
+                raise ValueError("el cuerpo no es un array JSON")
+            self._opened = True
+            pos += 1
+
+        while pos < end:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    pos += 1
+                    continue
+                m = _IN_STRING.search(buf, pos)
+                if m is None:
+                    pos = end
+                    break
+                pos = m.start()
+                if buf[pos] == 0x5C:  # backslash
+                    self._escape = True
+                else:
+                    self._in_string = False
+                pos += 1
+                continue
+
+            if self._start < 0:
+                # fuera de un elemento: saltar espacios y comas, detectar ']'
+                c = buf[pos]
+                if c in _WS or c == 0x2C:
+                    pos += 1
+                    continue
+                if c == 0x5D:  # ']'
+                    self._closed = True
+                    pos += 1
+                    break
+                self._start = pos
+
+            m = _STRUCT.search(buf, pos)
+            if m is None:
+                pos = end
+                break
+            pos = m.start()
+            c = buf[pos]
+            if c == 0x22:  # '"'
+                self._in_string = True
+                pos += 1
+                continue
+            if c in (0x5B, 0x7B):  # '[' '{'
+                self._depth += 1
+                pos += 1
+                continue
+            if c in (0x5D, 0x7D):  # ']' '}'
+                if self._depth == 0:
+                    # ']' que cierra el array tras un escalar
+                    out.append(loads(bytes(buf[self._start:pos]).strip()))
+                    self._start = -1
+                    self._closed = True
+                    pos += 1
+                    break
+                self._depth -= 1
+                pos += 1
+                if self._depth == 0:
+                    out.append(loads(bytes(buf[self._start:pos])))
+                    self._start = -1
+                continue
+            # ','
+            if self._depth == 0:
+                out.append(loads(bytes(buf[self._start:pos]).strip()))
+                self._start = -1
+            pos += 1
+
+        self._compact(pos)
+        return out
+
+    def close(self) -> None:
+        """Verifica que el array haya terminado."""
+        if not self._closed:
+            raise ValueError("array JSON incompleto")
+
+    def _compact(self, pos: int) -> None:
+        # Descarta lo ya procesado; solo queda el elemento en curso
+        cut = self._start if self._start >= 0 else pos
+        if cut > 0:
+            del self._buf[:cut]
+            pos -= cut
+            if self._start >= 0:
+                self._start = 0
+        self._pos = pos
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    parser = JsonArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            return
+    parser.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    parser = JsonArrayParser()
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+        if parser.done:
+            return
+    parser.close()
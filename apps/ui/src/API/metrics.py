@@ -0,0 +1,293 @@
+# src/API/metrics.py
+"""Instrumentación de peticiones HTTP: hooks y agregador de latencias.
+
+RestClient / AsyncRestClient llaman a sus hooks en cada petición:
+    hook.before(event)   antes de enviar
+    hook.after(event)    con respuesta (cualquier estado HTTP o hit de caché)
+    hook.error(event)    error de red / circuito abierto / deadline
+El evento (RequestEvent) trae método, plantilla de ruta ("pruebas/{id}"),
+estado, bytes enviados/recibidos, tiempos (conexión DNS+TCP+TLS, TTFB, total)
+y el resultado de la caché.
+
+MetricsAggregator es un hook que acumula, por endpoint, histogramas
+log-lineales estilo HDR (error relativo ~2 %) y se puede volcar como JSON o
+como texto OpenMetrics. METRICS es la instancia que usan los clientes
+compartidos de get_client / get_async_client.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import json
+import math
+import re
+import threading
+import time
+
+# Segmentos que parecen identificadores: números, uuids, hashes
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{8,})$")
+
+
+def path_template(path: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """'pruebas/12/preguntas' → 'pruebas/{id}/preguntas'; agrega los nombres de params."""
+    path = path.split("?", 1)[0].strip("/")
+    segments = ["{id}" if _ID_SEGMENT.match(s) else s for s in path.split("/")]
+    template = "/".join(segments)
+    if params:
+        template += "?" + "&".join(f"{k}=" for k in sorted(params))
+    return template
+
+
+@dataclass
+class RequestEvent:
+    method: str
+    path: str
+    template: str
+    url: str
+    status: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    connect_s: Optional[float] = None   # DNS + TCP + TLS (None si se reutilizó el socket)
+    ttfb_s: Optional[float] = None      # hasta recibir las cabeceras de la respuesta
+    total_s: float = 0.0
+    cache: str = "bypass"               # hit | stale | stale-if-error | revalidated | miss | bypass
+    error: Optional[str] = None
+    started_at: float = 0.0
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+class RequestHook:
+    """Base para hooks de instrumentación: sobreescribe lo que necesites."""
+
+    def before(self, event: RequestEvent) -> None:
+        pass
+
+    def after(self, event: RequestEvent) -> None:
+        pass
+
+    def error(self, event: RequestEvent) -> None:
+        pass
+
+
+class PhaseTimer:
+    """Mide conexión y TTFB con la extensión "trace" de httpx/httpcore.
+
+    Sync:  client.request(..., extensions={"trace": timer.trace})
+    Async: client.request(..., extensions={"trace": timer.atrace})
+    """
+
+    def __init__(self) -> None:
+        self.t0 = time.perf_counter()
+        self.connect_s: Optional[float] = None
+        self.ttfb_s: Optional[float] = None
+        self._connect_start: Optional[float] = None
+
+    def mark(self, name: str) -> None:
+        now = time.perf_counter()
+        if name.endswith("connect_tcp.started"):
+            self._connect_start = now
+        elif name.endswith(("connect_tcp.complete", "start_tls.complete")):
+            if self._connect_start is not None:
+                self.connect_s = now - self._connect_start
+        elif name.endswith("receive_response_headers.complete"):
+            self.ttfb_s = now - self.t0
+
+    def trace(self, name: str, info: Any) -> None:
+        self.mark(name)
+
+    async def atrace(self, name: str, info: Any) -> None:
+        self.mark(name)
+
+
+def body_size(body: Any) -> int:
+    """Bytes de un cuerpo de petición (bytes, str o None)."""
+    if not body:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    try:
+        return len(body)
+    except TypeError:
+        return 0  # iterables / generadores: tamaño desconocido
+
+
+def emit(hooks: List[RequestHook], phase: str, event: RequestEvent) -> None:
+    """Llama a hook.<phase>(event) en todos los hooks; un hook roto no rompe la petición."""
+    for hook in hooks:
+        try:
+            getattr(hook, phase)(event)
+        except Exception:
+            pass
+
+
+class LatencyHistogram:
+    """Histograma log-lineal de segundos (buckets de razón 1.04, de 10 µs a ~1 h)."""
+
+    MIN = 1e-5
+    RATIO = 1.04
+    _LOG_RATIO = math.log(RATIO)
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        v = max(seconds, self.MIN)
+        idx = int(math.log(v / self.MIN) / self._LOG_RATIO)
+        self.counts[idx] = self.counts.get(idx, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def _upper(self, idx: int) -> float:
+        return self.MIN * (self.RATIO ** (idx + 1))
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q / 100.0 * self.count))
+        seen = 0
+        for idx in sorted(self.counts):
+            seen += self.counts[idx]
+            if seen >= rank:
+                return min(self._upper(idx), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": (self.total / self.count) if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+    def cumulative(self, bounds: List[float]) -> List[Tuple[float, int]]:
+        """Conteos acumulados por límite superior (para buckets de OpenMetrics)."""
+        out = []
+        items = sorted(self.counts.items())
+        i = 0
+        acc = 0
+        for b in bounds:
+            while i < len(items) and self._upper(items[i][0]) <= b:
+                acc += items[i][1]
+                i += 1
+            out.append((b, acc))
+        return out
+
+
+class _EndpointStats:
+    def __init__(self) -> None:
+        self.total = LatencyHistogram()
+        self.ttfb = LatencyHistogram()
+        self.connect = LatencyHistogram()
+        self.errors = 0
+        self.statuses: Dict[str, int] = {}
+        self.cache: Dict[str, int] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+
+# Límites (segundos) de los buckets exportados en OpenMetrics
+OPENMETRICS_BOUNDS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+
+
+class MetricsAggregator(RequestHook):
+    """Acumula latencias y contadores por (método, plantilla de ruta)."""
+
+    def __init__(self) -> None:
+        self._stats: Dict[Tuple[str, str], _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def _for(self, event: RequestEvent) -> _EndpointStats:
+        key = (event.method, event.template)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _EndpointStats()
+        return stats
+
+    def after(self, event: RequestEvent) -> None:
+        with self._lock:
+            stats = self._for(event)
+            stats.total.record(event.total_s)
+            if event.ttfb_s is not None:
+                stats.ttfb.record(event.ttfb_s)
+            if event.connect_s is not None:
+                stats.connect.record(event.connect_s)
+            klass = f"{event.status // 100}xx"
+            stats.statuses[klass] = stats.statuses.get(klass, 0) + 1
+            stats.cache[event.cache] = stats.cache.get(event.cache, 0) + 1
+            stats.bytes_in += event.bytes_in
+            stats.bytes_out += event.bytes_out
+
+    def error(self, event: RequestEvent) -> None:
+        with self._lock:
+            stats = self._for(event)
+            stats.total.record(event.total_s)
+            stats.errors += 1
+            stats.bytes_out += event.bytes_out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    # -------- volcado ----------
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                f"{method} {template}": {
+                    "total": s.total.summary(),
+                    "ttfb": s.ttfb.summary(),
+                    "connect": s.connect.summary(),
+                    "errors": s.errors,
+                    "statuses": dict(s.statuses),
+                    "cache": dict(s.cache),
+                    "bytes_in": s.bytes_in,
+                    "bytes_out": s.bytes_out,
+                }
+                for (method, template), s in sorted(self._stats.items())
+            }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_openmetrics(self) -> str:
+        def esc(v: str) -> str:
+            return v.replace("\\", "\\\\").replace('"', '\\"')
+
+        lines = [
+            "# TYPE mtg_http_request_duration_seconds histogram",
+            "# UNIT mtg_http_request_duration_seconds seconds",
+        ]
+        with self._lock:
+            items = sorted(self._stats.items())
+            for (method, template), s in items:
+                labels = f'method="{esc(method)}",endpoint="{esc(template)}"'
+                for bound, acc in s.total.cumulative(OPENMETRICS_BOUNDS):
+                    lines.append(f'mtg_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {acc}')
+                lines.append(f'mtg_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {s.total.count}')
+                lines.append(f"mtg_http_request_duration_seconds_count{{{labels}}} {s.total.count}")
+                lines.append(f"mtg_http_request_duration_seconds_sum{{{labels}}} {s.total.total}")
+            lines.append("# TYPE mtg_http_request_errors counter")
+            for (method, template), s in items:
+                labels = f'method="{esc(method)}",endpoint="{esc(template)}"'
+                lines.append(f"mtg_http_request_errors_total{{{labels}}} {s.errors}")
+            lines.append("# TYPE mtg_http_response_bytes counter")
+            for (method, template), s in items:
+                labels = f'method="{esc(method)}",endpoint="{esc(template)}"'
+                lines.append(f"mtg_http_response_bytes_total{{{labels}}} {s.bytes_in}")
+            lines.append("# TYPE mtg_http_cache_lookups counter")
+            for (method, template), s in items:
+                for outcome, n in sorted(s.cache.items()):
+                    labels = f'method="{esc(method)}",endpoint="{esc(template)}",outcome="{esc(outcome)}"'
+                    lines.append(f"mtg_http_cache_lookups_total{{{labels}}} {n}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsAggregator()
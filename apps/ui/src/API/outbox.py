@@ -0,0 +1,318 @@
+# src/API/outbox.py
+"""Cola local durable (outbox) para envíos POST que no deben perderse.
+
+finalizar() de una prueba no espera a la red: encola el intento aquí y
+devuelve el resumen. Un hilo en segundo plano entrega la cola:
+
+- Cada fila tiene una clave de idempotencia (uuid4) que viaja en la cabecera
+  Idempotency-Key y en el campo client_key del cuerpo.
+- Antes de reintentar una fila que ya se intentó enviar se consulta
+  <coleccion>?client_key=<clave>: si el servidor ya la tiene (la respuesta se
+  perdió por el camino) se da por entregada y no se duplica el intento.
+- Como mucho `concurrency` envíos a la vez; los fallos transitorios (red,
+  429, 5xx) se reprograman con backoff exponencial + jitter de RetryPolicy.
+  Un 4xx definitivo deja la fila en estado "dead" para inspección.
+- SQLite con synchronous=FULL: lo que enqueue() aceptó sobrevive a un cierre
+  abrupto, y al volver a abrir la app se entrega lo que quedó pendiente.
+- Un error de SQLite al registrar el resultado no tumba el worker: se anota
+  en el log, la fila queda como estaba y se retoma en una pasada posterior
+  (si ya se había entregado, la verificación por client_key lo detecta).
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from ..utils.storage import app_data_dir
+from .crud import PoolConfig, RestClient
+from .endpoints import ALIASES, EndpointResolver
+from .metrics import METRICS
+from .retry import RetryPolicy
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    key        TEXT PRIMARY KEY,
+    base_url   TEXT NOT NULL,
+    name       TEXT NOT NULL,
+    payload    TEXT NOT NULL,
+    attempts   INTEGER NOT NULL DEFAULT 0,
+    next_at    REAL NOT NULL,
+    created_at REAL NOT NULL,
+    state      TEXT NOT NULL DEFAULT 'pending',
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox(state, next_at);
+"""
+
+# Backoff del outbox: mucho más largo que el de una petición interactiva
+OUTBOX_POLICY = RetryPolicy(base_delay=2.0, max_delay=300.0, max_retry_after=3600.0)
+DB_ERROR_PAUSE = 1.0   # pausa del worker tras un error de SQLite (evita re-enviar en bucle)
+
+log = logging.getLogger(__name__)
+
+# (key, base_url, name, payload, attempts)
+Item = Tuple[str, str, str, str, int]
+
+
+class OutboxUnavailable(RuntimeError):
+    """No hay disco utilizable para la cola."""
+
+
+class Outbox:
+    """Cola SQLite de POSTs pendientes con un hilo de entrega."""
+
+    def __init__(
+        self,
+        base_url: str,
+        path: Optional[Path] = None,
+        *,
+        concurrency: int = 2,
+        policy: RetryPolicy = OUTBOX_POLICY,
+        idle_poll: float = 30.0,
+    ) -> None:
+        self.base_url = base_url
+        self.path: Optional[Path] = path
+        self.concurrency = max(1, concurrency)
+        self.policy = policy
+        self.idle_poll = idle_poll
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._idle = threading.Condition(self._lock)
+        self._in_flight: Set[str] = set()
+        self._clients: Dict[str, RestClient] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop = False
+        self._conn: Optional[sqlite3.Connection] = None
+        self._delivered = 0
+        try:
+            # app_data_dir() crea la carpeta: sin disco utilizable el outbox queda
+            # no disponible (enqueue() lanza OutboxUnavailable) en vez de romper
+            self.path = path or app_data_dir() / "outbox.sqlite3"
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        except (OSError, sqlite3.Error):
+            self._conn = None
+
+    @property
+    def available(self) -> bool:
+        return self._conn is not None
+
+    # -------- API pública ----------
+    def enqueue(self, name: str, payload: Dict[str, Any]) -> str:
+        """Guarda el envío y despierta al worker; devuelve la clave de idempotencia."""
+        if self._conn is None:
+            raise OutboxUnavailable(f"outbox no disponible en {self.path}")
+        key = str(uuid.uuid4())
+        body = dict(payload, client_key=key)
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT INTO outbox (key, base_url, name, payload, next_at, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, self.base_url, name, json.dumps(body, ensure_ascii=False), now, now),
+                )
+            except sqlite3.Error as ex:
+                raise OutboxUnavailable(str(ex)) from ex
+        self.start()
+        self._wake.set()
+        return key
+
+    def pending(self) -> int:
+        """Filas aún por entregar (sin contar las "dead")."""
+        if self._conn is None:
+            return 0
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outbox WHERE state = 'pending'").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        if self._conn is None:
+            return {"available": False}
+        with self._lock:
+            rows = dict(self._conn.execute("SELECT state, COUNT(*) FROM outbox GROUP BY state").fetchall())
+            return {
+                "available": True,
+                "pending": rows.get("pending", 0),
+                "dead": rows.get("dead", 0),
+                "in_flight": len(self._in_flight),
+                "delivered": self._delivered,
+            }
+
+    def start(self) -> None:
+        """Arranca el hilo de entrega (idempotente)."""
+        if self._conn is None:
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop = False
+            self._thread = threading.Thread(target=self._run, name="outbox", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """Fuerza un intento inmediato de todo lo pendiente y espera a que se vacíe la cola.
+
+        Devuelve False si al vencer timeout todavía quedan filas pendientes.
+        """
+        if self._conn is None:
+            return True
+        with self._lock:
+            self._conn.execute("UPDATE outbox SET next_at = ? WHERE state = 'pending'", (time.time(),))
+        self.start()
+        self._wake.set()
+        deadline = time.monotonic() + timeout
+        with self._idle:
+            while True:
+                left = self._conn.execute("SELECT COUNT(*) FROM outbox WHERE state = 'pending'").fetchone()[0]
+                remaining = deadline - time.monotonic()
+                if left == 0 or remaining <= 0:
+                    return left == 0
+                self._idle.wait(remaining)
+
+    # -------- worker ----------
+    def _claim(self) -> Tuple[List[Item], Optional[float]]:
+        """Filas vencidas (hasta concurrency) y el próximo next_at pendiente."""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, base_url, name, payload, attempts FROM outbox"
+                " WHERE state = 'pending' AND next_at <= ? ORDER BY next_at LIMIT ?",
+                (now, self.concurrency + len(self._in_flight)),
+            ).fetchall()
+            due = [r for r in rows if r[0] not in self._in_flight][: self.concurrency]
+            try:
+                for key, *_ in due:
+                    self._in_flight.add(key)
+                    # Se cuenta el intento ANTES de enviar: si la app muere a mitad
+                    # del POST, al reanudar se verifica en el servidor antes de repetir
+                    self._conn.execute("UPDATE outbox SET attempts = attempts + 1 WHERE key = ?", (key,))
+                nxt = self._conn.execute(
+                    "SELECT MIN(next_at) FROM outbox WHERE state = 'pending' AND next_at > ?", (now,)
+                ).fetchone()[0]
+            except sqlite3.Error:
+                self._in_flight.difference_update(key for key, *_ in due)
+                raise
+        return due, nxt
+
+    def _run(self) -> None:
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="outbox-send") as pool:
+            while not self._stop:
+                self._wake.clear()
+                try:
+                    due, nxt = self._claim()
+                except sqlite3.Error as ex:
+                    log.warning("outbox: no se pudieron tomar filas pendientes: %s", ex)
+                    self._wake.wait(DB_ERROR_PAUSE)
+                    continue
+                if due:
+                    saved = list(pool.map(self._deliver_one, due))
+                    with self._idle:
+                        self._idle.notify_all()
+                    if not all(saved):
+                        self._wake.wait(DB_ERROR_PAUSE)
+                    continue
+                with self._idle:
+                    self._idle.notify_all()
+                wait = self.idle_poll if nxt is None else max(0.0, min(self.idle_poll, nxt - time.time()))
+                self._wake.wait(wait)
+
+    def _deliver_one(self, item: Item) -> bool:
+        """Entrega una fila y registra el resultado; False si SQLite no lo pudo guardar."""
+        key, base_url, name, payload, attempts = item
+        try:
+            outcome, error = self._deliver(key, base_url, name, json.loads(payload), attempts)
+        except Exception as ex:  # nunca tumbar el worker
+            outcome, error = "retry", f"{type(ex).__name__}: {ex}"
+        with self._lock:
+            self._in_flight.discard(key)
+            try:
+                if outcome == "sent":
+                    self._conn.execute("DELETE FROM outbox WHERE key = ?", (key,))
+                    self._delivered += 1
+                elif outcome == "dead":
+                    self._conn.execute("UPDATE outbox SET state = 'dead', last_error = ? WHERE key = ?", (error, key))
+                else:
+                    delay = self.policy.backoff(attempts)
+                    self._conn.execute(
+                        "UPDATE outbox SET next_at = ?, last_error = ? WHERE key = ?",
+                        (time.time() + delay, error, key),
+                    )
+            except sqlite3.Error as ex:
+                # La fila queda como estaba: una pasada posterior la retoma
+                log.warning("outbox: no se pudo registrar %s de %s: %s", outcome, key, ex)
+                return False
+        return True
+
+    def _client(self, base_url: str) -> RestClient:
+        # Cliente propio y sin caché: la verificación por client_key nunca
+        # debe responderse con una lista vieja guardada
+        with self._lock:
+            client = self._clients.get(base_url)
+            if client is None:
+                client = RestClient(base_url, pool=PoolConfig(pool_connections=1, pool_maxsize=self.concurrency),
+                                    hooks=[METRICS])
+                self._clients[base_url] = client
+            return client
+
+    def _already_delivered(self, api: RestClient, resolver: EndpointResolver, name: str, key: str) -> Optional[bool]:
+        """¿El servidor ya tiene el envío con esta clave? None = no se pudo saber."""
+        known = resolver.known(name)
+        for alias in [known] if known else ALIASES[name]:
+            ok, data, status, _err = api.get(alias, params={"client_key": key})
+            if ok and isinstance(data, list):
+                return any(isinstance(d, dict) and d.get("client_key") == key for d in data)
+            if status in (0, 429) or status >= 500:
+                return None
+        return False  # 404 (MockAPI responde así a un filtro sin resultados)
+
+    def _deliver(self, key: str, base_url: str, name: str, body: Dict[str, Any], attempts: int) -> Tuple[str, Optional[str]]:
+        """Un intento de entrega → ("sent" | "retry" | "dead", error)."""
+        api = self._client(base_url)
+        resolver = EndpointResolver(api)
+        if attempts > 0:
+            found = self._already_delivered(api, resolver, name, key)
+            if found is None:
+                return "retry", "no se pudo verificar el envío previo"
+            if found:
+                return "sent", None
+
+        _alias, (ok, _data, status, err) = resolver.post(name, json=body, headers={"Idempotency-Key": key})
+        if ok or status == 409:  # 409: el servidor ya registró esta clave
+            return "sent", None
+        error = f"HTTP {status} {err or ''}".strip()
+        if status in (0, 408, 429) or status >= 500:
+            return "retry", error
+        return "dead", error
+
+
+_outbox: Optional[Outbox] = None
+_outbox_lock = threading.Lock()
+
+
+def get_outbox() -> Outbox:
+    """Outbox compartido del proceso (arranca el worker con lo pendiente de sesiones previas)."""
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            from ..utils.config import api_base_url
+
+            _outbox = Outbox(api_base_url())
+            _outbox.start()
+        return _outbox
@@ -0,0 +1,154 @@
+# src/API/retry.py
+"""Política de reintentos y circuit breaker por host para RestClient / AsyncRestClient.
+
+- Solo se reintentan métodos idempotentes (GET, PUT, DELETE, ...) ante errores
+  de red o estados transitorios (429, 502, 503, 504).
+- Backoff exponencial con tope y "full jitter": espera aleatoria en
+  [0, min(max_delay, base_delay * 2**intento)], así un salón completo no
+  reintenta al mismo tiempo.
+- Retry-After (segundos o fecha HTTP) se respeta si no supera max_retry_after.
+- El circuit breaker es por host y compartido en todo el proceso: tras
+  failure_threshold fallos seguidos se abre y las peticiones fallan al instante
+  durante reset_timeout; luego deja pasar una sola petición de prueba.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Optional
+import random
+import threading
+import time
+
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES: FrozenSet[int] = frozenset({429, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """El circuito del host está abierto: no se intenta la petición."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"circuit open for {host} (retry in {retry_in:.1f}s)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convierte la cabecera Retry-After a segundos (None si no es válida)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def is_failure_status(status: int) -> bool:
+    """Estados que cuentan como fallo del servidor para el circuit breaker."""
+    return status == 0 or status == 429 or status >= 500
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 3
+    base_delay: float = 0.3
+    max_delay: float = 8.0
+    max_retry_after: float = 30.0
+    retry_statuses: FrozenSet[int] = RETRY_STATUSES
+    retry_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+
+    def should_retry(self, method: str, status: int, attempt: int, retry_after: Optional[float] = None) -> bool:
+        """attempt empieza en 0; status 0 = error de red."""
+        if attempt + 1 >= self.max_attempts:
+            return False
+        if method.upper() not in self.retry_methods:
+            return False
+        if status != 0 and status not in self.retry_statuses:
+            return False
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return False  # el servidor pide esperar demasiado: mejor fallar ya
+        return True
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = random.uniform(0.0, cap)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+@dataclass
+class CircuitBreaker:
+    failure_threshold: int = 5
+    reset_timeout: float = 15.0
+    failures: int = 0
+    opened_at: Optional[float] = None
+    _probing: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_request(self, host: str) -> bool:
+        """Lanza CircuitOpenError si no se debe intentar la petición.
+
+        Devuelve True si esta petición es la prueba del estado half-open: quien
+        la hace debe cerrar con record_success/record_failure o, si termina de
+        otra forma (cancelada, deadline, excepción ajena a la red), release_probe.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return False
+            elapsed = time.monotonic() - self.opened_at
+            if elapsed < self.reset_timeout:
+                raise CircuitOpenError(host, self.reset_timeout - elapsed)
+            if self._probing:
+                raise CircuitOpenError(host, 0.0)
+            self._probing = True  # half-open: solo una petición de prueba
+            return True
+
+    def release_probe(self) -> None:
+        """La prueba terminó sin veredicto: deja pasar a la siguiente."""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(host: str) -> CircuitBreaker:
+    """CircuitBreaker compartido del host (todas las sesiones del proceso)."""
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker()
+        return breaker
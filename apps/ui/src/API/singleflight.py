@@ -0,0 +1,124 @@
+# src/API/singleflight.py
+"""Single-flight: peticiones GET idénticas y simultáneas comparten una sola ida a la red.
+
+El primer llamador (líder) ejecuta la petición; los que llegan mientras está
+en vuelo esperan y reciben el mismo resultado (o la misma excepción).
+Se comparte el objeto Response; cada llamador lo decodifica por su cuenta,
+así nadie recibe un dict mutado por otro.
+"""
+from __future__ import annotations
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+import asyncio
+import threading
+
+# Cabeceras que cambian la respuesta de un GET condicional: forman parte de la clave
+_VARY_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+
+def flight_key(
+    method: str,
+    url: str,
+    params: Optional[Mapping[str, Any]] = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Tuple[str, str, str, Tuple[Optional[str], ...]]:
+    query = urlencode(sorted((str(k), str(v)) for k, v in params.items())) if params else ""
+    vary = tuple((headers or {}).get(h) for h in _VARY_HEADERS)
+    return method.upper(), url, query, vary
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Versión para hilos (RestClient)."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+class _AsyncCall:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """Versión asyncio (AsyncRestClient). Debe usarse desde un solo event loop.
+
+    La petición compartida sigue mientras quede algún llamador esperándola;
+    cuando se cancela el último (cancel(group), deadline) se cancela también.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _AsyncCall] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        call = self._calls.get(key)
+        if call is None or call.task.done():
+            call = self._calls[key] = _AsyncCall(asyncio.ensure_future(fn()))
+            call.task.add_done_callback(lambda t, k=key: self._forget(k, t))
+        else:
+            self.coalesced += 1
+        call.waiters += 1
+        try:
+            # shield: si un llamador se cancela, la petición compartida sigue para los demás
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # nadie más la espera: abortar la ida a la red
+                call.task.cancel()
+                self._forget(key, call.task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        call = self._calls.get(key)
+        if call is not None and call.task is task:
+            del self._calls[key]
+
+    def in_flight(self) -> int:
+        return len(self._calls)
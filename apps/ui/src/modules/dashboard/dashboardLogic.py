@@ -1,20 +1,34 @@
 """Dashboard logic: fetch available tests (pruebas) from API."""
 from __future__ import annotations
 import flet as ft
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
+import threading
 
-from ...API.crud import RestClient
+from ...API.cache import persistent_cache
+from ...API.crud import get_client
+from ...API.endpoints import EndpointResolver
+from ...utils.config import api_base_url
+from ...utils.search_index import SearchIndex
 
 # Base URL for MockAPI (same as login/register)
-URL_API = "https://69069a11b1879c890ed7a77d.mockapi.io/"
+URL_API = api_base_url()
+
+# Tamaño de página al pedir el catálogo (?page=&limit= de MockAPI)
+CATALOG_PAGE_SIZE = 100
 
 
 class DashboardLogic:
     def __init__(self, page: ft.Page, user: dict | None = None):
         self.page = page
         self.user = user or {}
-        self.api = RestClient(base_url=URL_API)
+        self.api = get_client(URL_API)
+        # catálogo de pruebas: caché compartida (memoria + disco) que entrega la última
+        # copia al instante y la refresca en segundo plano; también sirve sin red
+        self.api.enable_cache(persistent_cache())
+        self.endpoints = EndpointResolver(self.api)
         self._exams_data: Dict[str, Dict[str, Any]] = {}  # Cache de datos completos de exámenes
+        # Índice de búsqueda sobre _exams_data; se actualiza por lote al cargar
+        self.search_index = SearchIndex()
 
     def _normalize_item(self, raw: Dict[str, Any]) -> Dict[str, Any]:
         """Map arbitrary payload to UI-friendly keys.
@@ -52,20 +66,81 @@ class DashboardLogic:
     def cargaPruebas(self) -> List[Dict[str, Any]]:
         """Fetch list of exams/pruebas from API, trying common variants.
 
-        Tries, in order: pruebas, exams, Exams, Pruebas.
+        Goes straight to the collection name learned in previous runs; if
+        unknown (or it stops answering) tries pruebas, exams, Exams and
+        Pruebas concurrently and remembers the first that answers with a list.
+        """
+        return [item for batch in self.iter_pruebas() for item in batch]
+
+    def iter_pruebas(
+        self, batch_size: int = 20, cancel: Optional[threading.Event] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Igual que cargaPruebas pero entrega el catálogo normalizado por lotes.
+
+        El catálogo se pide por páginas de CATALOG_PAGE_SIZE; el primer lote
+        sale con la primera página y los siguientes a medida que llegan.
+        Pensado para correr fuera del hilo de UI: la vista pinta cada lote
+        en cuanto llega. Si cancel se activa (el usuario salió del dashboard)
+        se deja de normalizar y de entregar lotes.
+        """
+        alias, (ok, data, status, err) = self.endpoints.get(
+            "catalog",
+            params={"page": 1, "limit": CATALOG_PAGE_SIZE},
+            accept=lambda r: r[0] and isinstance(r[1], list),
+        )
+        if alias is None:
+            return
+        exams_data: Dict[str, Dict[str, Any]] = {}
+        # Se reemplaza (no se muta) para que get_exam_data nunca vea un dict a medias
+        self._exams_data = exams_data
+        failed: List[Any] = []  # páginas que fallaron: el catálogo quedó incompleto
+
+        def raw_items() -> Iterator[Any]:
+            yield from data
+            # Página llena: puede haber más. Un backend que ignora page/limit
+            # devuelve la colección entera (más larga que el límite) y no entra aquí
+            if len(data) == CATALOG_PAGE_SIZE:
+                yield from self.api.iter_pages(
+                    alias, page_size=CATALOG_PAGE_SIZE, start_page=2, on_error=failed.append
+                )
+
+        def publish(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            self.search_index.update({item["id"]: item["full_data"] for item in batch if item["id"]})
+            return batch
+
+        source = raw_items()
+        batch: List[Dict[str, Any]] = []
+        try:
+            for raw in source:
+                if cancel is not None and cancel.is_set():
+                    return
+                item = self._normalize_item(raw)
+                if item["id"]:
+                    if item["id"] in exams_data:
+                        break  # la página 2 repite la 1: el backend no pagina
+                    # Guardar también los datos completos en el objeto para acceso rápido
+                    exams_data[item["id"]] = item["full_data"]
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    yield publish(batch)
+                    batch = []
+            if cancel is not None and cancel.is_set():
+                return
+            if batch:
+                yield publish(batch)
+            # Catálogo completo: lo que ya no vino sale del índice
+            if not failed:
+                self.search_index.retain(exams_data)
+        finally:
+            source.close()  # deja de pedir páginas si el consumidor cortó
+
+    def buscar(self, texto: str, limit: Optional[int] = None) -> List[str]:
+        """IDs de las pruebas que coinciden con texto, de la más a la menos relevante.
+
+        Solo consulta el índice en memoria (sin red); vacío si texto no tiene palabras.
         """
-        items: List[Dict[str, Any]] = []
-
-        for path in ("pruebas", "exams", "Exams", "Pruebas"):
-            ok, data, status, err = self.api.get(path)
-            if ok and isinstance(data, list):
-                items = [self._normalize_item(d) for d in data]
-                # Guardar también los datos completos en el objeto para acceso rápido
-                self._exams_data = {item["id"]: item["full_data"] for item in items if item["id"]}
-                break
-
-        return items
-    
+        return self.search_index.search(texto, limit=limit)
+
     def get_exam_data(self, exam_id: str) -> Dict[str, Any] | None:
         """Obtiene los datos completos de un examen por su ID"""
         if hasattr(self, "_exams_data"):
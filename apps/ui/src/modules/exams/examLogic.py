@@ -1,10 +1,14 @@
 # src/modules/exams/examLogic.py
 from __future__ import annotations
 from typing import Any, Dict, List, Optional
-from ...API.crud import RestClient
+from ...API.cache import persistent_cache
+from ...API.crud import get_client
+from ...API.endpoints import EndpointResolver
+from ...utils.config import api_base_url
+from ...utils.countdown import Countdown
 
 # Base URL for MockAPI
-URL_API = "https://69069a11b1879c890ed7a77d.mockapi.io/"
+URL_API = api_base_url()
 
 
 class ExamLogic:
@@ -15,7 +19,11 @@ class ExamLogic:
     
     def __init__(self, exam_id: str, exam_data: Optional[Dict[str, Any]] = None):
         self.exam_id = exam_id
-        self.api = RestClient(base_url=URL_API)
+        self.api = get_client(URL_API)
+        # catálogo de pruebas: caché compartida (memoria + disco) que entrega la última
+        # copia al instante y la refresca en segundo plano; también sirve sin red
+        self.api.enable_cache(persistent_cache())
+        self.endpoints = EndpointResolver(self.api)
         self.exam_data: Dict[str, Any] = {}
         self.questions: List[Dict[str, Any]] = []
         self.current_question_idx = 0
@@ -23,6 +31,9 @@ class ExamLogic:
         self.user_answers: Dict[int, Dict[str, Any]] = {}  # {idx: {"answer": "a", "correct": True}}
         self.show_result = False  # Si True, muestra la respuesta correcta y si quedó bien
         self.total_correct = 0
+        # Tiempo límite: solo si la prueba trae duracion_seg; la vista lo corre
+        # con page.run_task(self.timer.run, ...)
+        self.timer: Optional[Countdown] = None
         
         # Si se proporcionan datos directamente, usarlos
         if exam_data:
@@ -30,6 +41,7 @@ class ExamLogic:
             questions = exam_data.get("questions", []) or exam_data.get("preguntas", [])
             if questions and len(questions) > 0:
                 self.questions = questions
+            self._setup_timer()
     
     def load_exam(self) -> bool:
         """
@@ -44,36 +56,48 @@ class ExamLogic:
         if not self.exam_id:
             return False
         
-        # Si no tenemos datos, intentar cargar desde la API
-        # Primero intentar obtener de la lista completa
-        for endpoint in ["exams", "pruebas"]:
-            ok, data_list, status, err = self.api.get(endpoint)
-            
-            if ok and isinstance(data_list, list):
-                # Buscar el examen por ID en la lista
-                for exam in data_list:
-                    exam_id_str = str(exam.get("id", ""))
-                    if exam_id_str == str(self.exam_id):
-                        self.exam_data = exam
-                        questions = exam.get("questions", []) or exam.get("preguntas", [])
-                        if questions and len(questions) > 0:
-                            self.questions = questions
-                            return True
-        
-        # Fallback: intentar cargar directamente por ID (puede que funcione en algunos casos)
-        for endpoint in ["exams", "pruebas"]:
-            url = f"{endpoint}/{self.exam_id}"
-            ok, data, status, err = self.api.get(url)
-            
-            if ok and isinstance(data, dict):
-                self.exam_data = data
-                # Normalizar las preguntas
-                questions = data.get("questions", []) or data.get("preguntas", [])
-                if questions and len(questions) > 0:
-                    self.questions = questions
-                    return True
-        
-        return False
+        # Si no tenemos datos, intentar cargar desde la API.
+        # Se consultan a la vez el detalle por ID y la lista completa de la
+        # colección del catálogo (ya aprendida, o sondeando sus alias);
+        # gana la primera respuesta que traiga el examen con preguntas.
+        alias, (ok, data, status, err) = self.endpoints.get(
+            "catalog",
+            suffixes=(f"/{self.exam_id}", ""),
+            accept=lambda r: r[0] and self._find_exam(r[1]) is not None,
+        )
+        if alias is None:
+            return False
+
+        exam = self._find_exam(data)
+        self.exam_data = exam
+        self.questions = exam.get("questions", []) or exam.get("preguntas", [])
+        self._setup_timer()
+        return True
+
+    def _setup_timer(self) -> None:
+        """Crea (o ajusta) la cuenta regresiva si el examen trae duracion_seg; sin ella no hay límite."""
+        try:
+            seconds = int(self.exam_data.get("duracion_seg") or 0)
+        except (TypeError, ValueError):
+            seconds = 0
+        if seconds <= 0:
+            return
+        if self.timer is None:
+            self.timer = Countdown(seconds)
+        elif not self.timer.running:
+            self.timer.reset(seconds)
+
+    def _find_exam(self, data: Any) -> Optional[Dict[str, Any]]:
+        """Extrae el examen (con preguntas) de una respuesta de lista o de detalle."""
+        candidates = data if isinstance(data, list) else [data]
+        for exam in candidates:
+            if not isinstance(exam, dict):
+                continue
+            if isinstance(data, list) and str(exam.get("id", "")) != str(self.exam_id):
+                continue
+            if exam.get("questions") or exam.get("preguntas"):
+                return exam
+        return None
     
     def get_current_question(self) -> Optional[Dict[str, Any]]:
         """Obtiene la pregunta actual"""
@@ -5,6 +5,7 @@ from ..login.login import LoginLogic
 from ..dashboard.dashboardLogic import DashboardLogic
 from ...views.dashboard import DashboardUI
 from ...views.examView import ExamViewUI
+from ...utils.update_scheduler import request_update
 
 class AuthController:
     def __init__(self, page: ft.Page):
@@ -18,7 +19,7 @@ class AuthController:
         self.page.views.append(
             ft.View(route="/login", controls=[login_logic.ui])
         )
-        self.page.update()
+        request_update(self.page)
 
     def show_register(self, e=None):
         self.page.views.clear()
@@ -30,7 +31,7 @@ class AuthController:
         self.page.views.append(
             ft.View(route="/register", controls=[reg_logic.ui])
         )
-        self.page.update()
+        request_update(self.page)
 
     # Navegación que puede llamar RegisterLogic
     def ir_login(self, e=None):
@@ -57,7 +58,7 @@ class AuthController:
         view = ft.View(route="/dashboard", controls=[dash_ui])
 
         self.page.views.append(view)
-        self.page.update()
+        request_update(self.page)
     
     def show_exam(self, exam_id: str, user_obj=None, exam_data: dict = None):
         """Muestra la vista de examen para realizar una prueba"""
@@ -67,7 +68,7 @@ class AuthController:
                 bgcolor=ft.Colors.RED,
             )
             self.page.snack_bar.open = True
-            self.page.update()
+            request_update(self.page)
             return
         
         # Crear la vista de examen
@@ -82,12 +83,12 @@ class AuthController:
         # Agregar la vista usando el sistema de views
         view = ft.View(route=f"/exam/{exam_id}", controls=[exam_ui])
         self.page.views.append(view)
-        self.page.update()
+        request_update(self.page)
 
     def vefCredencialesUser(self, e=None, email=None, password=None):
         try:
             self.page.snack_bar = ft.SnackBar(ft.Text("Probando login..."))
             self.page.snack_bar.open = True
-            self.page.update()
+            request_update(self.page)
         except Exception:
             pass
@@ -1,19 +1,25 @@
 import flet as ft
-from ...API.crud import RestClient
+from ...API.crud import get_async_client, get_client
+from ...utils.config import api_base_url
 from ...views.session import LoginUI
 from ...views.dashboard import DashboardUI
 from ...views.loading_overlay import LoadingOverlay
 from ..dashboard.dashboardLogic import DashboardLogic
 from ..login.register import RegisterLogic
+from ...utils.task_scheduler import tasks_for
+from ...utils.update_scheduler import request_update
 
-URL_API = "https://69069a11b1879c890ed7a77d.mockapi.io/"
+URL_API = api_base_url()
+USERS_PAGE_SIZE = 50  # resultados de users?search= por página
 
 class LoginLogic:
     def __init__(self, page: ft.Page, router=None):
         self.page = page
         self.router = router
         self._busy = False
-        self.api = RestClient(base_url=URL_API)
+        self.api = get_client(URL_API)
+        self.async_api = get_async_client(URL_API)
+        self.tasks = tasks_for(page)
 
         # Intentar leer el usuario recordado; si client_storage no está listo, seguir sin bloquear
         try:
@@ -44,21 +50,21 @@ class LoginLogic:
             self.page.snack_bar = ft.SnackBar(ft.Text(msg))
         
         self.page.snack_bar.open = True
-        self.page.update()
+        request_update(self.page)
     
     def show_loading(self, message: str = "Verificando credenciales..."):
         """Muestra el overlay de carga"""
         # Primero agregar al overlay si no está (esto lo agrega a la página)
         if self.loading_overlay not in self.page.overlay:
             self.page.overlay.append(self.loading_overlay)
-            self.page.update()  # Actualizar para que se agregue a la página
+            request_update(self.page)
         
         # Ahora sí podemos actualizar el mensaje y mostrarlo
         self.loading_overlay.visible = True
         self.loading_overlay.loading_text.value = message
         self.loading_overlay.message = message
         self.loading_overlay.show()
-        self.page.update()
+        request_update(self.page)
     
     def _remove_overlay(self):
         """Remueve el overlay completamente de forma inmediata"""
@@ -70,7 +76,7 @@ class LoginLogic:
             if hasattr(self.page, 'overlay') and self.loading_overlay in self.page.overlay:
                 self.page.overlay.remove(self.loading_overlay)
             # Forzar update
-            self.page.update()
+            request_update(self.page)
         except Exception as e:
             print(f"Error removiendo overlay: {e}")
     
@@ -80,6 +86,9 @@ class LoginLogic:
 
     # === Navegación ===
     def ir_register(self, e=None):
+        # Abortar la búsqueda de usuario si aún está en vuelo (o por empezar)
+        self.tasks.cancel_owner(self)
+        self.async_api.cancel("login")
         if self.router and hasattr(self.router, "show_register"):
             self.router.show_register()
         else:
@@ -99,7 +108,7 @@ class LoginLogic:
         dash_ui = DashboardUI(self.page, user=user_obj, logic=dash_logic, controller=self.router)
         view = ft.View(route="/dashboard", controls=[dash_ui])
         self.page.views.append(view)
-        self.page.update()
+        request_update(self.page)
 
     # === Verificación de credenciales ===
     def vefCredencialesUser(self, e, user_val: str | None = None, pwd_val: str | None = None):
@@ -115,7 +124,7 @@ class LoginLogic:
             self.ui.user.error_text = None if user else "Ingresa tu usuario"
         if getattr(self.ui, "password", None) is not None:
             self.ui.password.error_text = None if pwd else "Ingresa tu contraseña"
-        self.page.update()
+        request_update(self.page)
 
         if not user or not pwd:
             return
@@ -127,33 +136,40 @@ class LoginLogic:
         
         # Mostrar overlay de carga
         self.show_loading("Verificando credenciales...")
-        self.page.update()
+        request_update(self.page)
 
         # 1) Buscar por username
         self.loading_overlay.loading_text.value = "Buscando usuario..."
         self.loading_overlay.message = "Buscando usuario..."
-        self.page.update()
+        request_update(self.page)
         
-        # Pequeño delay para que se vea la animación de "Buscando usuario..."
-        import threading
-        import time
-        
-        # Usar threading para no bloquear, pero esperar un poco
-        def delayed_search():
-            time.sleep(0.8)  # Esperar 0.8 segundos para que se vea la animación
+        # Pequeño delay (0.8 s) para que se vea la animación de "Buscando usuario..."
+        # La búsqueda corre en el event loop de Flet (sin hilo extra)
+        async def delayed_search():
             try:
-                ok_u, users, status_u, err_u = self.api.get("users", params={"search": user})
-                # Procesar resultado en el hilo principal usando async wrapper
-                async def process_search():
+                # Recorre los resultados por páginas y se detiene en cuanto aparece el username
+                failed = []
+                seen = 0
+                usr = None
+                async for u in self.async_api.iter_pages(
+                    "users", params={"search": user}, page_size=USERS_PAGE_SIZE,
+                    on_error=failed.append, group="login", deadline=15,
+                ):
+                    seen += 1
+                    if isinstance(u, dict) and u.get("username") == user:
+                        usr = u
+                        break
+                if failed and seen == 0:
+                    ok_u, users, status_u, err_u = failed[0]
+                    if err_u == "cancelled":
+                        return  # el usuario salió del login; no tocar la UI
                     self._process_user_search(ok_u, users, status_u, err_u, user, pwd)
-                self.page.run_task(process_search)
+                    return
+                self._process_user_search(True, [usr] if usr else [], 200, None, user, pwd)
             except Exception as ex:
-                # Manejar error usando async wrapper
-                async def handle_error():
-                    self._handle_search_error(ex)
-                self.page.run_task(handle_error)
-        
-        threading.Thread(target=delayed_search, daemon=True).start()
+                self._handle_search_error(ex)
+
+        self.tasks.call_later(0.8, delayed_search, owner=self)
     
     def _handle_search_error(self, ex):
         """Maneja errores en la búsqueda de usuario"""
@@ -161,7 +177,7 @@ class LoginLogic:
         self._busy = False
         if getattr(self.ui, "login_btn", None) is not None:
             self.ui.login_btn.disabled = False
-        self.page.update()
+        request_update(self.page)
         C = getattr(ft, "Colors", None) or getattr(ft, "colors", None)
         self.page.snack_bar = ft.SnackBar(
             ft.Text(f"Error inesperado: {ex}", color=getattr(C, "WHITE", "#FFFFFF")),
@@ -169,7 +185,7 @@ class LoginLogic:
             duration=5000,
         )
         self.page.snack_bar.open = True
-        self.page.update()
+        request_update(self.page)
     
     def _process_user_search(self, ok_u, users, status_u, err_u, user, pwd):
         """Procesa el resultado de la búsqueda de usuario"""
@@ -194,7 +210,7 @@ class LoginLogic:
                     self.page.overlay.append(self.loading_overlay)
                 self.loading_overlay.visible = True
                 self.loading_overlay.opacity = 1.0
-                self.page.update()
+                request_update(self.page)
                 
                 # Mostrar error en la animación (X roja con mensaje)
                 # Duración suficiente para que se vea bien
@@ -206,22 +222,16 @@ class LoginLogic:
                     self._busy = False
                     if getattr(self.ui, "login_btn", None) is not None:
                         self.ui.login_btn.disabled = False
-                    self.page.update()
+                    request_update(self.page)
                 
                 # Resetear después de que se oculte el error
-                try:
-                    reset_timer = ft.Timer(interval=duration + 100, once=True, on_tick=lambda e: reset_busy())
-                    self.page.overlay.append(reset_timer)
-                except:
-                    import threading
-                    import time
-                    threading.Thread(target=lambda: (time.sleep((duration + 100) / 1000.0), reset_busy()), daemon=True).start()
+                self.tasks.call_later((duration + 100) / 1000.0, reset_busy, owner=self)
                 return
 
             # 3) Comparar contraseña (en tu registro usas 'password_hash' con la contraseña en claro)
             self.loading_overlay.loading_text.value = "Verificando contraseña..."
             self.loading_overlay.message = "Verificando contraseña..."
-            self.page.update()
+            request_update(self.page)
             
             if str(usr.get("password_hash", "")) != str(pwd):
                 # Asegurarse de que el overlay esté visible y mostrar error
@@ -229,7 +239,7 @@ class LoginLogic:
                     self.page.overlay.append(self.loading_overlay)
                 self.loading_overlay.visible = True
                 self.loading_overlay.opacity = 1.0
-                self.page.update()
+                request_update(self.page)
                 
                 # Mostrar error en la animación (X roja con mensaje)
                 # Duración suficiente para que se vea bien
@@ -241,16 +251,10 @@ class LoginLogic:
                     self._busy = False
                     if getattr(self.ui, "login_btn", None) is not None:
                         self.ui.login_btn.disabled = False
-                    self.page.update()
+                    request_update(self.page)
                 
                 # Resetear después de que se oculte el error
-                try:
-                    reset_timer = ft.Timer(interval=duration + 100, once=True, on_tick=lambda e: reset_busy())
-                    self.page.overlay.append(reset_timer)
-                except:
-                    import threading
-                    import time
-                    threading.Thread(target=lambda: (time.sleep((duration + 100) / 1000.0), reset_busy()), daemon=True).start()
+                self.tasks.call_later((duration + 100) / 1000.0, reset_busy, owner=self)
                 return
 
             # 4) Recordarme
@@ -271,7 +275,7 @@ class LoginLogic:
                 self.page.overlay.append(self.loading_overlay)
             self.loading_overlay.visible = True
             self.loading_overlay.opacity = 1.0
-            self.page.update()
+            request_update(self.page)
             
             # Mostrar animación de éxito con callback para navegar después
             def continue_to_dashboard():
@@ -1,15 +1,17 @@
 # src/modules/login/register_logic.py
 import flet as ft
-from ...API.crud import RestClient
+from ...API.crud import get_client
+from ...utils.config import api_base_url
 from ...views.session import RegisterUI
+from ...utils.update_scheduler import request_update
 
-URL_API = "https://69069a11b1879c890ed7a77d.mockapi.io/"
+URL_API = api_base_url()
 
 class RegisterLogic:
     def __init__(self, page: ft.Page, router=None):
         self.page = page
         self.router = router         # <<--- guardar el router (AuthController)
-        self.api = RestClient(base_url=URL_API)
+        self.api = get_client(URL_API)
         self._busy = False
         self.ui = RegisterUI(page=self.page, controller=self)
 
@@ -17,7 +19,7 @@ class RegisterLogic:
     def _toast(self, msg: str):
         self.page.snack_bar = ft.SnackBar(ft.Text(msg))
         self.page.snack_bar.open = True
-        self.page.update()
+        request_update(self.page)
 
     # ======= Validación =======
     def validar(self) -> bool:
@@ -58,7 +60,7 @@ class RegisterLogic:
         else:
             ui.password_tf.error_text = None
 
-        self.page.update()
+        request_update(self.page)
         return ok
 
     # ======= Navegación =======
@@ -102,7 +104,7 @@ class RegisterLogic:
         self._busy = True
         try:
             ui.registrar_btn.disabled = True
-            self.page.update()
+            request_update(self.page)
 
             ok, data, status, err = self.api.post("users", json=payload)
 
@@ -117,4 +119,4 @@ class RegisterLogic:
         finally:
             self._busy = False
             ui.registrar_btn.disabled = False
-            self.page.update()
+            request_update(self.page)
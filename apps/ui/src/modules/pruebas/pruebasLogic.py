@@ -1,21 +1,70 @@
 # src/modules/pruebas/prueba_logic.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple
-from datetime import timedelta
-import asyncio
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
 import json
+import threading
 from ast import literal_eval
-from ...API.crud import RestClient
+from ...API.crud import get_client
+from ...API.endpoints import EndpointResolver
+from ...API.images import option_images
+from ...API.outbox import OutboxUnavailable, get_outbox
+from ...utils.config import api_base_url
+from ...utils.countdown import Countdown
 
 # Base URL for MockAPI
-URL_API = "https://69069a11b1879c890ed7a77d.mockapi.io/"
+URL_API = api_base_url()
+SHAPE_HINTS_MAX = 256   # pruebas recordadas en _shape_hints
 
-@dataclass
+
+class ShapeHints:
+    """LRU en memoria {(base_url, prueba_id): "embedded" | "nested"}.
+
+    Es una pista por prueba, no una ruta: no va a EndpointStore (endpoints.json
+    solo guarda alias de colecciones) y perderla cuesta a lo sumo un GET extra.
+    """
+
+    def __init__(self, max_items: int = SHAPE_HINTS_MAX) -> None:
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[Tuple[str, Any], str]" = OrderedDict()
+
+    def get(self, base_url: str, prueba_id: Any) -> Optional[str]:
+        key = (base_url, str(prueba_id))
+        with self._lock:
+            shape = self._items.get(key)
+            if shape is not None:
+                self._items.move_to_end(key)
+            return shape
+
+    def set(self, base_url: str, prueba_id: Any, shape: str) -> None:
+        key = (base_url, str(prueba_id))
+        with self._lock:
+            self._items[key] = shape
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+_shape_hints = ShapeHints()
+
+@dataclass(frozen=True)
 class OptionData:
     text: str
     image: Optional[str] = None
 
+class Question(NamedTuple):
+    """Pregunta ya normalizada en cargar(): opciones parseadas y respuesta correcta resuelta."""
+    enunciado: str
+    secuencia: Optional[str]
+    opciones: Tuple[OptionData, ...]
+    correcta_idx: Optional[int]   # índice de la opción correcta, si se conoce
+    correcta_text: Optional[str]  # texto que cuenta como correcto (None = ninguno)
+
 @dataclass
 class ViewModel:
     titulo: str
@@ -23,7 +72,7 @@ class ViewModel:
     idx: int
     enunciado: str
     secuencia: Optional[str]
-    opciones: List[OptionData]
+    opciones: Sequence[OptionData]
     seleccion_actual: Optional[str]
     validada: bool
     aciertos: int
@@ -42,59 +91,99 @@ class PruebaLogic:
     """
     def __init__(self, prueba_id: int, default_duracion_seg: int = 9*60 + 30):
         self.prueba_id = prueba_id
-        self.api = RestClient(base_url=URL_API)
+        self.api = get_client(URL_API)
+        self.endpoints = EndpointResolver(self.api)
         self.data: Dict[str, Any] = {}
-        self.questions: List[Dict[str, Any]] = []
+        self.questions: List[Question] = []
         self.idx = 0
         self.seleccion: Optional[str] = None
         self.user_answers: Dict[int, Dict[str, Any]] = {}
         self.validadas: set[int] = set()
         self.aciertos = 0
-        self.total_seconds = default_duracion_seg
-        self.remaining = default_duracion_seg
-        self._timer_stop = False
+        self.timer = Countdown(default_duracion_seg)
 
     # ---------- Carga ----------
     def cargar(self) -> bool:
         """Fetch the test and questions from the API and normalize fields.
 
-        Strategy:
-          1) GET pruebas/{id} expecting embedded "preguntas" (if present).
-          2) If not embedded, GET pruebas/{id}/preguntas and attach.
+        Las preguntas pueden venir embebidas en pruebas/{id} ("embedded") o en
+        pruebas/{id}/preguntas ("nested"). Se recuerda por prueba (LRU en
+        memoria, ver ShapeHints) qué forma devolvió el servidor:
+          - embedded conocida: solo GET del detalle (y el anidado si faltaran).
+          - nested o desconocida: ambos GET a la vez y se queda el que traiga
+            las preguntas; un solo RTT en vez de dos en serie.
         """
-        ok, payload, status, err = self.api.get(f"pruebas/{self.prueba_id}")
+        detail_path = f"pruebas/{self.prueba_id}"
+        nested_path = f"{detail_path}/preguntas"
+        shape = _shape_hints.get(self.api.base_url, self.prueba_id)
+
+        if shape == "embedded":
+            detail, nested = self.api.get(detail_path), None
+        else:
+            detail, nested = self.api.get_many([detail_path, nested_path])
+
+        ok, payload, status, err = detail
         if not ok or not isinstance(payload, dict):
             return False
 
         data: Dict[str, Any] = payload or {}
 
-        if not data.get("preguntas"):
-            ok_p, preguntas, _st_p, _err_p = self.api.get(f"pruebas/{self.prueba_id}/preguntas")
+        if data.get("preguntas"):
+            learned = "embedded"
+        else:
+            if nested is None:  # la prueba cambió de forma desde la última vez
+                nested = self.api.get(nested_path)
+            ok_p, preguntas, _st_p, _err_p = nested
+            learned = "nested" if ok_p and isinstance(preguntas, list) and preguntas else None
             if ok_p and isinstance(preguntas, list):
                 data["preguntas"] = preguntas
+        if learned is not None:
+            _shape_hints.set(self.api.base_url, self.prueba_id, learned)
 
         self.data = data
         try:
-            self.total_seconds = int(data.get("duracion_seg") or self.total_seconds)
+            self.timer.reset(int(data.get("duracion_seg") or self.timer.total))
         except Exception:
-            pass
-        self.remaining = self.total_seconds
+            self.timer.reset(self.timer.total)
+        self._compilar(data)
+        self._prefetch_imagenes()
+        return True
+
+    def _prefetch_imagenes(self) -> None:
+        """Encola la descarga al caché local de las imágenes de las opciones, en orden de pregunta.
 
-        qs: List[Dict[str, Any]] = []
+        No se espera a ninguna: mientras no estén, las opciones usan la URL remota.
+        """
+        urls = [o.image for q in self.questions for o in q.opciones if o.image]
+        if urls:
+            option_images().prefetch(urls)
+
+    def _compilar(self, data: Dict[str, Any]) -> None:
+        """Normaliza las preguntas una sola vez: view() y la validación solo consultan."""
+        qs: List[Question] = []
         for p in data.get("preguntas", []) or []:
             if not isinstance(p, dict):
                 continue
+            opciones = tuple(self._coerce_to_dict(o) for o in (p.get("opciones") or []))
+            c = p.get("correcta")
+            if c is None:
+                idx, text = None, None
+            elif isinstance(c, int):
+                idx = c if 0 <= c < len(opciones) else None
+                text = opciones[c].text if idx is not None else None
+            else:
+                text = str(c)
+                idx = next((i for i, o in enumerate(opciones) if o.text == text), None)
             qs.append(
-                {
-                    "titulo": data.get("titulo", ""),
-                    "enunciado": p.get("enunciado", ""),
-                    "secuencia": p.get("secuencia"),
-                    "opciones": p.get("opciones", []) or [],
-                    "correcta": p.get("correcta"),
-                }
+                Question(
+                    enunciado=p.get("enunciado", "") or "",
+                    secuencia=p.get("secuencia"),
+                    opciones=opciones,
+                    correcta_idx=idx,
+                    correcta_text=text,
+                )
             )
         self.questions = qs
-        return True
 
     # ---------- Helpers ----------
     def _coerce_to_dict(self, opt: Any) -> OptionData:
@@ -120,20 +209,15 @@ class PruebaLogic:
     def _opt_text(self, opt: Any) -> str:
         return self._coerce_to_dict(opt).text
 
-    def _es_correcta(self, q: Dict[str, Any], value_text: str) -> bool:
-        c = q.get("correcta")
-        if c is None:
-            return False
-        if isinstance(c, int):
-            try:
-                return self._opt_text((q.get("opciones") or [])[c]) == value_text
-            except Exception:
-                return False
-        return str(c) == value_text
+    def _es_correcta(self, q: Question, value_text: str) -> bool:
+        return q.correcta_text is not None and q.correcta_text == value_text
+
+    def tiempo_mmss(self) -> str:
+        """Tiempo restante como mm:ss (lo único que cambia en cada tick)."""
+        return self._mmss()
 
     def _mmss(self) -> str:
-        t = str(timedelta(seconds=self.remaining))
-        return t.split(":")[1] + ":" + t.split(":")[2].zfill(2)
+        return self.timer.mmss()
 
     # ---------- Navegación & selección ----------
     def seleccionar(self, value_text: str) -> None:
@@ -182,8 +266,8 @@ class PruebaLogic:
 
     # ---------- Finalización ----------
     def finalizar(self, motivo: str = "finalizado") -> Dict[str, Any]:
-        """Calcula resumen y persiste intento."""
-        self._timer_stop = True
+        """Calcula resumen y encola el intento para enviarlo (no bloquea en la red)."""
+        self.timer.stop()
         total = len(self.questions)
         contestadas = len(self.user_answers)
         correctas = self.aciertos
@@ -205,51 +289,57 @@ class PruebaLogic:
             ],
         }
 
+        resumen = {
+            "correctas": correctas,
+            "incorrectas": contestadas - correctas,
+            "pendientes": pendientes,
+            "puntaje": score_pct,
+            "motivo": motivo,
+        }
+
+        # El intento va al outbox: el resumen se muestra ya y el envío
+        # (con reintentos, aunque se cierre la app) ocurre en segundo plano
+        try:
+            key = get_outbox().enqueue("attempts", resp_payload)
+            return {"resumen": resumen, "envio": {"estado": "en_cola", "clave": key}}
+        except OutboxUnavailable:
+            pass
+
+        # Sin disco para la cola: envío directo como último recurso
         try:
             self._guardar_intento(resp_payload)
         except Exception as ex:
-            return {
-                "error": str(ex),
-                "resumen": {
-                    "correctas": correctas,
-                    "incorrectas": contestadas - correctas,
-                    "pendientes": pendientes,
-                    "puntaje": score_pct,
-                    "motivo": motivo,
-                },
-            }
-
-        return {"resumen": {
-            "correctas": correctas, "incorrectas": contestadas - correctas,
-            "pendientes": pendientes, "puntaje": score_pct, "motivo": motivo
-        }}
+            return {"error": str(ex), "resumen": resumen}
+        return {"resumen": resumen, "envio": {"estado": "enviado"}}
 
     # ---------- Persistencia API ----------
     def _guardar_intento(self, payload: Dict[str, Any]) -> Tuple[bool, Any]:
-        """Try POST to 'intentos' then fallback to 'results'."""
-        ok, data, status, err = self.api.post("intentos", json=payload)
+        """POST to the attempts collection ('intentos' or 'results', whichever is known to work)."""
+        alias, (ok, data, status, err) = self.endpoints.post("attempts", json=payload)
         if ok:
             return True, data
-        ok2, data2, status2, err2 = self.api.post("results", json=payload)
-        if ok2:
-            return True, data2
-        raise RuntimeError(f"No se pudo guardar intento: HTTP {status} {err or ''} | alt HTTP {status2} {err2 or ''}")
+        raise RuntimeError(f"No se pudo guardar intento: HTTP {status} {err or ''}")
 
     # ---------- Timer ----------
+    @property
+    def total_seconds(self) -> int:
+        return self.timer.total
+
+    @property
+    def remaining(self) -> int:
+        return self.timer.remaining
+
     async def countdown(self, on_tick: Optional[Callable[[], None]] = None,
                         on_timeout: Optional[Callable[[], None]] = None):
-        self._timer_stop = False
-        while self.remaining > 0 and not self._timer_stop:
-            await asyncio.sleep(1)
-            self.remaining -= 1
-            if on_tick:
-                on_tick()
-        if self.remaining <= 0 and not self._timer_stop:
-            if on_timeout:
-                on_timeout()
+        """Cuenta regresiva de la prueba (ver utils.countdown.Countdown)."""
+        await self.timer.run(on_tick, on_timeout)
+
+    def resync(self) -> None:
+        """Recalcula ya el tiempo restante (p. ej. al volver la app a primer plano)."""
+        self.timer.resync()
 
     def stop_timer(self):
-        self._timer_stop = True
+        self.timer.stop()
 
     # ---------- ViewModel ----------
     def view(self) -> ViewModel:
@@ -262,15 +352,14 @@ class PruebaLogic:
             )
 
         q = self.questions[self.idx]
-        opciones = [self._coerce_to_dict(o) for o in (q.get("opciones") or [])]
         total = len(self.questions)
         return ViewModel(
             titulo=self.data.get("titulo", ""),
             total=total,
             idx=self.idx,
-            enunciado=q.get("enunciado") or "",
-            secuencia=q.get("secuencia"),
-            opciones=opciones,
+            enunciado=q.enunciado,
+            secuencia=q.secuencia,
+            opciones=q.opciones,
             seleccion_actual=self.user_answers.get(self.idx, {}).get("seleccion", self.seleccion),
             validada=(self.idx in self.validadas),
             aciertos=self.aciertos,
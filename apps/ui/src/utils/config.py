@@ -0,0 +1,11 @@
+# src/utils/config.py
+"""Configuración de la app tomada del entorno."""
+from __future__ import annotations
+import os
+
+DEFAULT_API_URL = "https://69069a11b1879c890ed7a77d.mockapi.io/"
+
+
+def api_base_url() -> str:
+    """Base URL de la API; MTG_API_URL la sobreescribe (p. ej. el mock local de tools/mock_api)."""
+    return os.getenv("MTG_API_URL") or DEFAULT_API_URL
@@ -0,0 +1,103 @@
+# src/utils/countdown.py
+"""Cuenta regresiva de una prueba contra un fin absoluto.
+
+remaining se recalcula desde el fin en time.monotonic() en cada despertar,
+así el retraso del event loop no se acumula; se duerme justo hasta el próximo
+cambio de segundo y on_tick() solo se llama cuando remaining cambia. El tiempo
+que el equipo pasó suspendido (el reloj de pared avanzó y el monotónico no)
+también se descuenta. resync() fuerza el recálculo desde cualquier hilo, p. ej.
+al volver la app a primer plano.
+"""
+from __future__ import annotations
+from datetime import timedelta
+from typing import Callable, Optional, Tuple
+import asyncio
+import math
+import time
+
+SUSPEND_THRESHOLD = 2.0   # segundos de diferencia pared/monotónico que cuentan como suspensión
+
+
+class Countdown:
+    """Temporizador de una sola corrida; run() es una corrutina para page.run_task."""
+
+    def __init__(self, seconds: int) -> None:
+        self.total = int(seconds)
+        self.remaining = int(seconds)
+        self._stop = False
+        self._deadline: Optional[float] = None   # fin absoluto en time.monotonic()
+        self._wall_anchor: Optional[Tuple[float, float]] = None  # (time.time(), monotonic) del último chequeo
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def reset(self, seconds: int) -> None:
+        """Cambia la duración antes de arrancar (p. ej. al conocer duracion_seg)."""
+        self.total = self.remaining = int(seconds)
+
+    @property
+    def running(self) -> bool:
+        return self._deadline is not None and not self._stop and self.remaining > 0
+
+    def mmss(self) -> str:
+        t = str(timedelta(seconds=self.remaining))
+        return t.split(":")[1] + ":" + t.split(":")[2].zfill(2)
+
+    async def run(self, on_tick: Optional[Callable[[], None]] = None,
+                  on_timeout: Optional[Callable[[], None]] = None) -> None:
+        self._stop = False
+        self._deadline = time.monotonic() + self.remaining
+        self._wall_anchor = (time.time(), time.monotonic())
+        self._wake = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        while not self._stop:
+            left = self._seconds_left()
+            secs = max(0, math.ceil(left))
+            if secs != self.remaining:
+                self.remaining = secs
+                if on_tick:
+                    on_tick()
+            if left <= 0:
+                break
+            # Despertar cuando ceil(left) baje al siguiente entero (+1 ms de margen)
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=left - (secs - 1) + 0.001)
+            except asyncio.TimeoutError:
+                pass
+        if self.remaining <= 0 and not self._stop:
+            if on_timeout:
+                on_timeout()
+
+    def _seconds_left(self) -> float:
+        if self._deadline is None:
+            return float(self.remaining)
+        # Si el equipo se suspendió, el reloj monotónico pudo detenerse mientras
+        # el de pared siguió: ese tiempo también cuenta para la prueba.
+        wall, mono = time.time(), time.monotonic()
+        if self._wall_anchor is not None:
+            lost = (wall - self._wall_anchor[0]) - (mono - self._wall_anchor[1])
+            if lost > SUSPEND_THRESHOLD:
+                self._deadline -= lost
+        self._wall_anchor = (wall, mono)
+        return self._deadline - mono
+
+    def resync(self) -> None:
+        """Recalcula ya el tiempo restante; se puede llamar desde cualquier hilo."""
+        wake, loop = self._wake, self._loop
+        if wake is None or loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wake.set()
+            return
+        try:
+            loop.call_soon_threadsafe(wake.set)
+        except RuntimeError:
+            pass  # el loop ya terminó
+
+    def stop(self) -> None:
+        self._stop = True
+        self.resync()
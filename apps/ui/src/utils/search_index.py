@@ -0,0 +1,195 @@
+# src/utils/search_index.py
+"""Índice invertido en memoria para buscar pruebas mientras se escribe.
+
+- Normaliza sin acentos ni mayúsculas ("Química" y "quimica" son el mismo
+  token) y parte en palabras.
+- Cada token apunta a {doc: peso}; el peso es el del campo más importante
+  donde aparece (título > materia > descripción).
+- Los términos de la consulta se buscan por prefijo sobre el vocabulario
+  ordenado (bisect); una coincidencia exacta pesa más que una parcial. Con
+  varios términos un documento debe cumplirlos todos (AND) y se ordena por
+  la suma de pesos y, a igual puntaje, por orden de llegada.
+- add() compara el texto indexado y no hace nada si no cambió, así recargar
+  el catálogo solo re-indexa lo que cambió; retain() quita lo que ya no está.
+"""
+from __future__ import annotations
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
+import re
+import threading
+import unicodedata
+
+# (campo, peso); nombres del payload de MockAPI en ambas variantes (es/en)
+DEFAULT_FIELDS: Sequence[Tuple[str, float]] = (
+    ("titulo", 3.0),
+    ("exam_name", 3.0),
+    ("materia", 2.0),
+    ("subject", 2.0),
+    ("descripcion", 1.0),
+    ("description", 1.0),
+)
+PREFIX_FACTOR = 0.5   # "quim" → "quimica" pesa la mitad que escribir la palabra entera
+
+_WORD = re.compile(r"\w+")
+
+
+def fold(text: Any) -> str:
+    """Minúsculas y sin diacríticos: "Ñandú Álgebra" → "nandu algebra"."""
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def tokenize(text: Any) -> List[str]:
+    return _WORD.findall(fold(text)) if text else []
+
+
+class SearchIndex:
+    """Tokens → {doc_id: peso}, con búsqueda por prefijo y caché de consultas."""
+
+    def __init__(self, fields: Sequence[Tuple[str, float]] = DEFAULT_FIELDS, cache_size: int = 128) -> None:
+        self.fields = tuple(fields)
+        self.cache_size = cache_size
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[Hashable, float]] = {}
+        self._vocab: List[str] = []                      # tokens ordenados para el prefijo
+        self._docs: Dict[Hashable, Tuple[Tuple[str, ...], Dict[str, float]]] = {}
+        self._order: Dict[Hashable, int] = {}            # desempate: orden de llegada
+        self._seq = 0
+        self._cache: "OrderedDict[Tuple[str, ...], List[Hashable]]" = OrderedDict()
+        self._term_cache: Dict[str, Dict[Hashable, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._docs
+
+    # -------- mantenimiento ----------
+    def add(self, doc_id: Hashable, doc: Mapping[str, Any]) -> bool:
+        """Indexa (o re-indexa) un documento; False si su texto no cambió."""
+        signature = tuple(str(doc.get(name) or "") for name, _ in self.fields)
+        with self._lock:
+            current = self._docs.get(doc_id)
+            if current is not None and current[0] == signature:
+                return False
+            if current is not None:
+                self._unlink(doc_id, current[1])
+            weights: Dict[str, float] = {}
+            for (_, weight), text in zip(self.fields, signature):
+                for token in tokenize(text):
+                    if weights.get(token, 0.0) < weight:
+                        weights[token] = weight
+            for token, weight in weights.items():
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = {}
+                    insort(self._vocab, token)
+                postings[doc_id] = weight
+            self._docs[doc_id] = (signature, weights)
+            if doc_id not in self._order:
+                self._order[doc_id] = self._seq
+                self._seq += 1
+            self._invalidate()
+            return True
+
+    def update(self, docs: Mapping[Hashable, Mapping[str, Any]]) -> int:
+        """add() de varios documentos; devuelve cuántos cambiaron."""
+        with self._lock:
+            return sum(1 for doc_id, doc in docs.items() if doc is not None and self.add(doc_id, doc))
+
+    def remove(self, doc_id: Hashable) -> bool:
+        with self._lock:
+            current = self._docs.pop(doc_id, None)
+            if current is None:
+                return False
+            self._unlink(doc_id, current[1])
+            self._order.pop(doc_id, None)
+            self._invalidate()
+            return True
+
+    def retain(self, doc_ids: Iterable[Hashable]) -> int:
+        """Quita los documentos que no están en doc_ids (p. ej. tras recargar el catálogo)."""
+        keep = set(doc_ids)
+        with self._lock:
+            gone = [doc_id for doc_id in self._docs if doc_id not in keep]
+            for doc_id in gone:
+                self.remove(doc_id)
+            return len(gone)
+
+    def _unlink(self, doc_id: Hashable, weights: Dict[str, float]) -> None:
+        for token in weights:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[token]
+                i = bisect_left(self._vocab, token)
+                if i < len(self._vocab) and self._vocab[i] == token:
+                    del self._vocab[i]
+
+    def _invalidate(self) -> None:
+        self._cache.clear()
+        self._term_cache.clear()
+
+    # -------- consulta ----------
+    def search(self, query: str, limit: Optional[int] = None) -> List[Hashable]:
+        """doc_ids que cumplen todos los términos, del más al menos relevante."""
+        terms = tuple(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        with self._lock:
+            hit = self._cache.get(terms)
+            if hit is None:
+                hit = self._rank(terms)
+                self._cache[terms] = hit
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            else:
+                self._cache.move_to_end(terms)
+        return hit[:limit] if limit is not None else list(hit)
+
+    def _rank(self, terms: Tuple[str, ...]) -> List[Hashable]:
+        per_term = sorted((self._term_scores(t) for t in terms), key=len)
+        scores = dict(per_term[0])
+        for other in per_term[1:]:
+            scores = {d: s + other[d] for d, s in scores.items() if d in other}
+            if not scores:
+                return []
+        # Los pesos son pocos valores distintos: agrupar por puntaje y ordenar
+        # cada grupo por llegada sale mucho más barato que una clave compuesta
+        buckets: Dict[float, List[Hashable]] = {}
+        for doc_id, score in scores.items():
+            bucket = buckets.get(score)
+            if bucket is None:
+                buckets[score] = [doc_id]
+            else:
+                bucket.append(doc_id)
+        by_arrival = self._order.__getitem__
+        ranked: List[Hashable] = []
+        for score in sorted(buckets, reverse=True):
+            ranked.extend(sorted(buckets[score], key=by_arrival))
+        return ranked
+
+    def _term_scores(self, term: str) -> Dict[Hashable, float]:
+        cached = self._term_cache.get(term)
+        if cached is not None:
+            return cached
+        scores: Dict[Hashable, float] = {}
+        vocab = self._vocab
+        i = bisect_left(vocab, term)
+        while i < len(vocab) and vocab[i].startswith(term):
+            token = vocab[i]
+            factor = 1.0 if token == term else PREFIX_FACTOR
+            postings = self._postings[token]
+            if not scores:
+                scores = {doc_id: weight * factor for doc_id, weight in postings.items()}
+            else:
+                for doc_id, weight in postings.items():
+                    score = weight * factor
+                    if scores.get(doc_id, 0.0) < score:
+                        scores[doc_id] = score
+            i += 1
+        self._term_cache[term] = scores
+        return scores
@@ -0,0 +1,17 @@
+# src/utils/storage.py
+"""Ubicación de los archivos locales de la app (cachés, colas, etc.)."""
+from __future__ import annotations
+from pathlib import Path
+import os
+
+
+def app_data_dir(*parts: str) -> Path:
+    """Directorio de datos local de la app (se crea si no existe).
+
+    Usa MTG_DATA_DIR si está definida; si no, ~/.makingthegrade
+    (en Android, HOME apunta al sandbox interno de la app).
+    """
+    base = os.getenv("MTG_DATA_DIR") or str(Path.home() / ".makingthegrade")
+    path = Path(base, *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
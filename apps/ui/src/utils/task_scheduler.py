@@ -0,0 +1,205 @@
+# src/utils/task_scheduler.py
+"""Acciones diferidas de las vistas sin un hilo por clic.
+
+Antes cada vista repetía "page.run_task(async con asyncio.sleep) y, si
+falla, threading.Thread con time.sleep": un hilo del SO por clic, timers
+que no se podían cancelar y callbacks que corrían cuando la vista ya no
+estaba. Aquí hay un TaskScheduler por página:
+
+- call_later / call_at programan sobre el event loop de la página (un
+  TimerHandle de asyncio, no un hilo) y devuelven un Handle cancelable.
+- owner agrupa los handles de una vista: cancel_owner(vista) al salir de
+  ella descarta todo lo que tenía pendiente.
+- debounce(clave, ...) reprograma; throttle(clave, ...) descarta llamadas
+  dentro del intervalo.
+- run_blocking manda trabajo bloqueante (red, disco) a un pool acotado;
+  blocking=True en call_later hace lo mismo al vencer el plazo.
+
+Si la página no tiene loop (pruebas, pyodide) el scheduler levanta uno
+propio en un único hilo.
+"""
+from __future__ import annotations
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+import asyncio
+import inspect
+import threading
+import time
+import weakref
+
+
+class Handle:
+    """Acción programada; cancel() es seguro desde cualquier hilo."""
+
+    __slots__ = ("_scheduler", "owner", "when", "_timer", "cancelled", "done")
+
+    def __init__(self, scheduler: "TaskScheduler", owner: Any, when: float) -> None:
+        self._scheduler = scheduler
+        self.owner = owner
+        self.when = when                       # time.monotonic() de ejecución
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.cancelled = False
+        self.done = False
+
+    @property
+    def pending(self) -> bool:
+        return not (self.cancelled or self.done)
+
+    def cancel(self) -> bool:
+        if not self.pending:
+            return False
+        self.cancelled = True
+        self._scheduler._discard(self)
+        timer = self._timer
+        if timer is not None:
+            self._scheduler.loop.call_soon_threadsafe(timer.cancel)
+        return True
+
+
+class TaskScheduler:
+    """Timers, debounce/throttle y pool de trabajo bloqueante de una página."""
+
+    def __init__(self, page=None, max_workers: int = 2) -> None:
+        self.page = page
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._handles: Set[Handle] = set()
+        self._debounced: Dict[Hashable, Handle] = {}
+        self._throttled: Dict[Hashable, float] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._own_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        loop = getattr(self.page, "loop", None)
+        if loop is not None and not loop.is_closed():
+            return loop
+        with self._lock:
+            if self._own_loop is None:
+                self._own_loop = asyncio.new_event_loop()
+                threading.Thread(target=self._own_loop.run_forever, name="task-scheduler", daemon=True).start()
+            return self._own_loop
+
+    # -------- timers ----------
+    def call_later(self, delay: float, fn: Callable[..., Any], *args: Any,
+                   owner: Any = None, blocking: bool = False) -> Handle:
+        """Ejecuta fn(*args) dentro de delay segundos (en el loop, o en el pool si blocking)."""
+        return self.call_at(time.monotonic() + max(0.0, delay), fn, *args, owner=owner, blocking=blocking)
+
+    def call_at(self, when: float, fn: Callable[..., Any], *args: Any,
+                owner: Any = None, blocking: bool = False) -> Handle:
+        """Igual que call_later pero con un instante absoluto de time.monotonic()."""
+        handle = Handle(self, owner, when)
+        with self._lock:
+            self._handles.add(handle)
+        loop = self.loop
+
+        def arm() -> None:
+            if handle.cancelled:
+                return
+            delay = max(0.0, handle.when - time.monotonic())
+            handle._timer = loop.call_later(delay, self._fire, handle, fn, args, blocking)
+
+        loop.call_soon_threadsafe(arm)
+        return handle
+
+    def _fire(self, handle: Handle, fn: Callable[..., Any], args: tuple, blocking: bool) -> None:
+        if handle.cancelled:
+            return
+        handle.done = True
+        self._discard(handle)
+        if blocking:
+            self.run_blocking(fn, *args)
+        elif inspect.iscoroutinefunction(fn):
+            self.loop.create_task(self._guard_async(fn, args))
+        else:
+            self._guard(fn, args)
+
+    @staticmethod
+    def _guard(fn: Callable[..., Any], args: tuple) -> Any:
+        try:
+            return fn(*args)
+        except Exception as ex:  # un callback roto no debe tumbar el loop de Flet
+            print(f"TaskScheduler: error en {getattr(fn, '__name__', fn)}: {ex}")
+
+    async def _guard_async(self, fn: Callable[..., Any], args: tuple) -> None:
+        try:
+            await fn(*args)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            print(f"TaskScheduler: error en {getattr(fn, '__name__', fn)}: {ex}")
+
+    def _discard(self, handle: Handle) -> None:
+        with self._lock:
+            self._handles.discard(handle)
+
+    # -------- debounce / throttle ----------
+    def debounce(self, key: Hashable, delay: float, fn: Callable[..., Any], *args: Any,
+                 owner: Any = None, blocking: bool = False) -> Handle:
+        """Cancela la llamada pendiente con la misma clave y reprograma."""
+        with self._lock:
+            previous = self._debounced.get(key)
+        if previous is not None:
+            previous.cancel()
+        handle = self.call_later(delay, fn, *args, owner=owner, blocking=blocking)
+        with self._lock:
+            self._debounced[key] = handle
+        return handle
+
+    def throttle(self, key: Hashable, interval: float, fn: Callable[..., Any], *args: Any) -> bool:
+        """Ejecuta fn ya si no se ejecutó en los últimos interval segundos; si no, la descarta."""
+        now = time.monotonic()
+        with self._lock:
+            last = self._throttled.get(key)
+            if last is not None and now - last < interval:
+                return False
+            self._throttled[key] = now
+        self._guard(fn, args)
+        return True
+
+    # -------- trabajo bloqueante ----------
+    def run_blocking(self, fn: Callable[..., Any], *args: Any,
+                     on_done: Optional[Callable[[Any], None]] = None) -> Future:
+        """fn(*args) en el pool acotado; on_done(resultado) vuelve al loop de la página."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ui-work")
+            executor = self._executor
+        future = executor.submit(self._guard, fn, args)
+        if on_done is not None:
+            loop = self.loop
+            future.add_done_callback(
+                lambda f: loop.call_soon_threadsafe(self._guard, on_done, (f.result(),))
+            )
+        return future
+
+    # -------- limpieza ----------
+    def cancel_owner(self, owner: Any) -> int:
+        """Cancela todo lo pendiente de una vista (al navegar fuera de ella)."""
+        with self._lock:
+            mine = [h for h in self._handles if h.owner is owner]
+        return sum(1 for h in mine if h.cancel())
+
+    def cancel_all(self) -> int:
+        with self._lock:
+            handles = list(self._handles)
+        return sum(1 for h in handles if h.cancel())
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._handles)
+
+
+_schedulers: "weakref.WeakKeyDictionary[Any, TaskScheduler]" = weakref.WeakKeyDictionary()
+_schedulers_lock = threading.Lock()
+
+
+def tasks_for(page) -> TaskScheduler:
+    """TaskScheduler de la página (uno por sesión de Flet)."""
+    with _schedulers_lock:
+        sched = _schedulers.get(page)
+        if sched is None:
+            sched = TaskScheduler(page)
+            _schedulers[page] = sched
+        return sched
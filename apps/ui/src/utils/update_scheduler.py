@@ -0,0 +1,142 @@
+# src/utils/update_scheduler.py
+"""Agrupa las llamadas a page.update() en una por frame.
+
+Cada page.update() serializa el árbol de controles modificado y lo manda por
+el canal de Flet; un solo clic llegaba a disparar cinco o seis. Las vistas
+llaman request_update(page) en su lugar: la página queda marcada y se envía
+una sola vez al cerrar el frame (16 ms por defecto) con todo lo acumulado.
+
+flush_now(page) envía ya y cancela el envío programado; hace falta cuando el
+código siguiente necesita los controles montados (p. ej. control.update()
+justo después de agregarlo al overlay).
+
+El envío diferido corre en el event loop de la página; los handlers
+síncronos de Flet corren en hilos, así que el loop está libre para enviar
+aunque el handler siga bloqueado en la red.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Optional
+import logging
+import threading
+import time
+import weakref
+
+FRAME_BUDGET = 0.016
+
+log = logging.getLogger(__name__)
+
+
+class UpdateScheduler:
+    """Coalescing de page.update() para una página."""
+
+    def __init__(self, page, frame: float = FRAME_BUDGET) -> None:
+        self.page = page
+        self.frame = frame
+        self._lock = threading.Lock()
+        self._pending = False
+        self._gen = 0                       # sube en cada envío: invalida timers viejos
+        self._timer: Optional[Any] = None   # asyncio.TimerHandle o threading.Timer del frame
+        self.requested = 0    # llamadas a request()
+        self.suppressed = 0   # absorbidas por un envío ya programado
+        self.flushes = 0      # page.update() reales
+
+    def request(self) -> None:
+        """Marca la página como sucia; el envío ocurre al final del frame."""
+        with self._lock:
+            self.requested += 1
+            if self._pending:
+                self.suppressed += 1
+                return
+            self._pending = True
+            gen = self._gen
+        self._schedule(gen)
+
+    def flush_now(self) -> None:
+        """Envía ya lo pendiente (síncrono) y cancela el envío programado."""
+        with self._lock:
+            self._pending = False
+            self._gen += 1
+            self.flushes += 1
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            self._cancel(timer)
+        self._update()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requested": self.requested,
+                "suppressed": self.suppressed,
+                "flushes": self.flushes,
+                "pending": self._pending,
+            }
+
+    def _schedule(self, gen: int) -> None:
+        loop = getattr(self.page, "loop", None)
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._arm, loop, gen)
+                return
+            except RuntimeError:
+                pass  # loop cerrándose: usar un hilo
+        timer = threading.Timer(self.frame, self._flush, args=(gen,))
+        timer.daemon = True
+        with self._lock:
+            if gen != self._gen:
+                return  # flush_now() se adelantó
+            self._timer = timer
+        timer.start()
+
+    def _arm(self, loop, gen: int) -> None:
+        with self._lock:
+            if gen != self._gen or not self._pending:
+                return  # flush_now() se adelantó
+            self._timer = loop.call_later(self.frame, self._flush, gen)
+
+    def _cancel(self, timer) -> None:
+        if isinstance(timer, threading.Timer):
+            timer.cancel()
+            return
+        loop = getattr(self.page, "loop", None)
+        try:
+            loop.call_soon_threadsafe(timer.cancel)
+        except (AttributeError, RuntimeError):
+            timer.cancel()  # loop cerrado: el handle ya no va a correr
+
+    def _flush(self, gen: int) -> None:
+        with self._lock:
+            if gen != self._gen or not self._pending:
+                return  # flush_now() se adelantó
+            self._pending = False
+            self._gen += 1
+            self._timer = None
+            self.flushes += 1
+        self._update()
+
+    def _update(self) -> None:
+        try:
+            self.page.update()
+        except Exception as ex:  # página desconectada o cerrada entre frames
+            log.warning("UpdateScheduler: no se pudo actualizar la página: %s", ex)
+
+
+_schedulers: "weakref.WeakKeyDictionary[Any, UpdateScheduler]" = weakref.WeakKeyDictionary()
+_schedulers_lock = threading.Lock()
+
+
+def scheduler_for(page) -> UpdateScheduler:
+    """UpdateScheduler de la página (uno por sesión de Flet)."""
+    with _schedulers_lock:
+        sched = _schedulers.get(page)
+        if sched is None:
+            sched = UpdateScheduler(page)
+            _schedulers[page] = sched
+        return sched
+
+
+def request_update(page) -> None:
+    scheduler_for(page).request()
+
+
+def flush_now(page) -> None:
+    scheduler_for(page).flush_now()
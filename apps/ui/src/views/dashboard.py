@@ -1,9 +1,189 @@
 # src/views/dashboard.py
 from __future__ import annotations
 import flet as ft
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional
+import threading
 from .nav_bar import build_navigation_bar
 from .loading_overlay import LoadingOverlay
+from ..utils.task_scheduler import tasks_for
+from ..utils.update_scheduler import request_update
+
+SKELETON_CARDS = 3
+
+# Lista virtualizada: alto fijo por fila para poder calcular qué tarjetas se
+# ven a partir del desplazamiento, sin medir nada en el cliente
+CARD_HEIGHT = 100
+CARD_GAP = 20
+ROW_STRIDE = CARD_HEIGHT + CARD_GAP
+OVERSCAN = 4            # filas extra por arriba y por abajo
+LIST_TOP = 180          # alto aproximado del header + buscador + separaciones antes de la lista
+DEFAULT_VIEWPORT = 800  # hasta recibir el primer evento de scroll
+
+
+class ExamCard(ft.Container):
+    """Tarjeta de prueba reutilizable: se construye una vez y bind() la apunta a otro ítem.
+
+    Igual que OptionCard en examView, solo se tocan los textos que cambian,
+    así desplazar la lista envía unos pocos atributos por tarjeta visible.
+    """
+
+    def __init__(self, on_open: Callable[[str, Optional[dict]], None]):
+        self._on_open = on_open
+        self._item: Optional[Dict[str, Any]] = None
+        self.title_text = ft.Text(
+            "",
+            weight=ft.FontWeight.BOLD,
+            size=17,
+            color=ft.Colors.GREY_900,
+            max_lines=1,
+            overflow=ft.TextOverflow.ELLIPSIS,
+        )
+        self.subtitle_text = ft.Text(
+            "",
+            size=13,
+            color=ft.Colors.GREY_600,
+            max_lines=2,
+            overflow=ft.TextOverflow.ELLIPSIS,
+        )
+        super().__init__(
+            content=ft.Row(
+                controls=[
+                    # Icono con fondo circular
+                    ft.Container(
+                        content=ft.Icon(
+                            name=ft.Icons.QUIZ,
+                            color=ft.Colors.BLUE_600,
+                            size=28,
+                        ),
+                        bgcolor=ft.Colors.BLUE_50,
+                        width=56,
+                        height=56,
+                        border_radius=28,
+                        alignment=ft.alignment.center,
+                    ),
+                    ft.Container(width=16),  # Espaciador
+                    ft.Column(
+                        [self.title_text, self.subtitle_text],
+                        alignment=ft.MainAxisAlignment.CENTER,
+                        spacing=4,
+                        expand=True,
+                    ),
+                    ft.Icon(
+                        name=ft.Icons.CHEVRON_RIGHT,
+                        color=ft.Colors.GREY_400,
+                        size=24,
+                    ),
+                ],
+                alignment=ft.MainAxisAlignment.START,
+                spacing=0,
+            ),
+            bgcolor=ft.Colors.WHITE,
+            border_radius=16,
+            padding=20,
+            ink=True,
+            on_click=self._click,
+            width=500,  # Ancho fijo para pantallas grandes
+            height=CARD_HEIGHT,
+            border=ft.border.all(1, ft.Colors.GREY_200),
+            shadow=ft.BoxShadow(
+                blur_radius=4,
+                color=ft.Colors.BLACK12,
+                offset=ft.Offset(0, 2),
+            ),
+        )
+
+    def _click(self, e):
+        item = self._item
+        if item is not None:
+            self._on_open(str(item["id"]), item.get("full_data"))
+
+    def bind(self, item: Dict[str, Any]) -> None:
+        if item is self._item:
+            return
+        self._item = item
+        titulo = item.get("titulo") or "Prueba"
+        subtitulo = item.get("descripcion") or "Sin descripción"
+        if self.title_text.value != titulo:
+            self.title_text.value = titulo
+        if self.subtitle_text.value != subtitulo:
+            self.subtitle_text.value = subtitulo
+
+
+class VirtualExamList(ft.Column):
+    """Solo existen las tarjetas visibles + OVERSCAN; el resto del alto son dos espaciadores.
+
+    El costo por frame es O(filas visibles): al desplazar se re-apuntan las
+    mismas ExamCard a otros ítems y se ajusta el alto de los espaciadores.
+    extend() agrega ítems a medida que llegan páginas del catálogo.
+    """
+
+    def __init__(self, on_open: Callable[[str, Optional[dict]], None]):
+        super().__init__(spacing=0, horizontal_alignment=ft.CrossAxisAlignment.CENTER)
+        self._on_open = on_open
+        self._lock = threading.RLock()
+        self.items: List[Dict[str, Any]] = []
+        self._rows: List[ft.Container] = []      # pool: contenedor de fila con su ExamCard
+        self._cards: List[ExamCard] = []
+        self._top = ft.Container(height=0)
+        self._bottom = ft.Container(height=0)
+        self._offset = 0.0
+        self._viewport = float(DEFAULT_VIEWPORT)
+        self._window = (0, 0)
+        self.controls = [self._top, self._bottom]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def extend(self, items: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self.items.extend(it for it in items if it.get("id") is not None)
+            self._render(force=True)
+
+    def set_items(self, items: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self.items = [it for it in items if it.get("id") is not None]
+            self._render(force=True)
+
+    def on_viewport(self, offset: float, height: Optional[float] = None) -> bool:
+        """Nuevo desplazamiento (px desde el inicio de la lista); True si cambió algo."""
+        with self._lock:
+            self._offset = max(0.0, offset)
+            if height:
+                self._viewport = height
+            return self._render()
+
+    def _window_for(self) -> tuple:
+        first = max(0, int(self._offset // ROW_STRIDE) - OVERSCAN)
+        count = int(self._viewport // ROW_STRIDE) + 1 + 2 * OVERSCAN
+        first = min(first, max(0, len(self.items) - count))
+        return first, min(count, len(self.items) - first)
+
+    def _render(self, force: bool = False) -> bool:
+        window = self._window_for()
+        if window == self._window and not force:
+            return False
+        first, count = window
+        while len(self._cards) < count:
+            card = ExamCard(self._on_open)
+            self._cards.append(card)
+            self._rows.append(ft.Container(content=card, height=ROW_STRIDE, alignment=ft.alignment.top_center))
+        for i, row in enumerate(self._rows):
+            visible = i < count
+            if visible:
+                self._cards[i].bind(self.items[first + i])
+            if row.visible != visible:
+                row.visible = visible
+        top = first * ROW_STRIDE
+        bottom = max(0, len(self.items) - first - count) * ROW_STRIDE
+        if self._top.height != top:
+            self._top.height = top
+        if self._bottom.height != bottom:
+            self._bottom.height = bottom
+        if len(self.controls) != len(self._rows) + 2:
+            self.controls = [self._top, *self._rows, self._bottom]
+        self._window = window
+        return True
+
 
 
 class DashboardUI(ft.Column):
@@ -63,161 +243,54 @@ class DashboardUI(ft.Column):
             ),
         )
 
-        # factory de tarjeta mejorada con diseño moderno y responsive
-        def card(titulo: str, subtitulo: str | None, bg, on_click):
-            return ft.Container(
-                content=ft.Row(
-                    controls=[
-                        # Icono con fondo circular
-                        ft.Container(
-                            content=ft.Icon(
-                                name=ft.Icons.QUIZ,
-                                color=ft.Colors.BLUE_600,
-                                size=28,
-                            ),
-                            bgcolor=ft.Colors.BLUE_50,
-                            width=56,
-                            height=56,
-                            border_radius=28,
-                            alignment=ft.alignment.center,
-                        ),
-                        ft.Container(width=16),  # Espaciador
-                        ft.Column(
-                            [
-                                ft.Text(
-                                    titulo,
-                                    weight=ft.FontWeight.BOLD,
-                                    size=17,
-                                    color=ft.Colors.GREY_900,
-                                ),
-                                ft.Text(
-                                    subtitulo or "Sin descripción",
-                                    size=13,
-                                    color=ft.Colors.GREY_600,
-                                    max_lines=2,
-                                    overflow=ft.TextOverflow.ELLIPSIS,
-                                ),
-                            ],
-                            alignment=ft.MainAxisAlignment.CENTER,
-                            spacing=4,
-                            expand=True,
-                        ),
-                        ft.Icon(
-                            name=ft.Icons.CHEVRON_RIGHT,
-                            color=ft.Colors.GREY_400,
-                            size=24,
-                        ),
-                    ],
-                    alignment=ft.MainAxisAlignment.START,
-                    spacing=0,
-                ),
-                bgcolor=bg,
-                border_radius=16,
-                padding=20,
-                ink=True,
-                on_click=on_click,
-                width=500,  # Ancho fijo para pantallas grandes
-                border=ft.border.all(1, ft.Colors.GREY_200),
-                shadow=ft.BoxShadow(
-                    blur_radius=4,
-                    color=ft.Colors.BLACK12,
-                    offset=ft.Offset(0, 2),
-                ),
-            )
-
-        # Construye la lista de tarjetas desde la data
-        def build_cards(pruebas: List[Dict[str, Any]] | None):
-            items: List[ft.Control] = []
-            if not pruebas:
-                # Estado vacío mejorado y responsive
-                items.append(
-                    ft.Container(
-                        padding=40,
-                        border_radius=20,
-                        bgcolor=ft.Colors.WHITE,
-                        border=ft.border.all(2, ft.Colors.GREY_300, ft.BorderStyle.DASHED),
-                        content=ft.Column(
-                            [
-                                ft.Icon(
-                                    ft.Icons.INBOX,
-                                    size=64,
-                                    color=ft.Colors.GREY_400,
-                                ),
-                                ft.Container(height=16),
-                                ft.Text(
-                                    "Aún no hay pruebas disponibles",
-                                    weight=ft.FontWeight.BOLD,
-                                    size=18,
-                                    color=ft.Colors.GREY_700,
-                                    text_align=ft.TextAlign.CENTER,
-                                ),
-                                ft.Text(
-                                    "Las pruebas aparecerán aquí cuando estén disponibles",
-                                    size=14,
-                                    color=ft.Colors.GREY_500,
-                                    text_align=ft.TextAlign.CENTER,
-                                ),
-                            ],
-                            spacing=8,
-                            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                        ),
-                        width=500,  # Ancho fijo para pantallas grandes
-                    )
-                )
-                return items
-
-            for p in pruebas:
-                exam_id = p.get("id")
-                # Asegurarse de que el ID sea válido
-                if exam_id is None:
-                    continue
-                
-                # Convertir a string para asegurar compatibilidad
-                exam_id_str = str(exam_id)
-                exam_full_data = p.get("full_data")  # Obtener datos completos
-                
-                # Función auxiliar para capturar el exam_id y datos correctamente
-                def make_click_handler(eid, full_data):
-                    def handler(e):
-                        self._open_exam(eid, full_data)
-                    return handler
-                
-                items.append(
-                    card(
-                        titulo=p.get("titulo", "Prueba"),
-                        subtitulo=p.get("descripcion", ""),
-                        bg=ft.Colors.WHITE,
-                        on_click=make_click_handler(exam_id_str, exam_full_data),
-                    )
-                )
-            return items
+        # Contenido principal con scroll mejorado y responsive
+        # Las tarjetas viven en su propia columna: se montan placeholders al
+        # instante y el catálogo llega por lotes desde un hilo del pool
+        self.cards_column = ft.Column(
+            controls=[self._wrap(self._skeleton_card()) for _ in range(SKELETON_CARDS)],
+            spacing=20,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+        self._showing_skeletons = True
+        self._cancel_load = threading.Event()
+        self._load_future = None
+        # Solo se construyen las tarjetas visibles; el scroll del body la mueve
+        self.exam_list = VirtualExamList(on_open=self._open_exam)
+        self.exam_list.on_viewport(0, self.page.height or DEFAULT_VIEWPORT)
 
-        # Intentar traer pruebas si hay lógica; si no, mostrar vacío
-        pruebas = None
-        if self.logic and hasattr(self.logic, "cargaPruebas"):
-            try:
-                pruebas = self.logic.cargaPruebas()
-            except Exception:
-                pruebas = None
+        # Buscador: filtra en memoria con el índice de DashboardLogic en cada tecla
+        self._items_lock = threading.Lock()
+        self._all_items: List[Dict[str, Any]] = []
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._query = ""
+        self.search_field = ft.TextField(
+            hint_text="Buscar por título o materia",
+            prefix_icon=ft.Icons.SEARCH,
+            width=500,
+            border_radius=12,
+            border_color=ft.Colors.GREY_300,
+            focused_border_color=ft.Colors.BLUE_600,
+            bgcolor=ft.Colors.WHITE,
+            content_padding=ft.padding.symmetric(12, 16),
+            on_change=self._on_search,
+        )
+        self.no_results = ft.Text(
+            "Ninguna prueba coincide con la búsqueda",
+            size=14,
+            color=ft.Colors.GREY_600,
+            visible=False,
+        )
 
-        # Contenido principal con scroll mejorado y responsive
-        # Envolver cada tarjeta en un contenedor que se adapte al ancho
-        cards_list = []
-        for card_item in build_cards(pruebas):
-            cards_list.append(
-                ft.Container(
-                    content=card_item,
-                    alignment=ft.alignment.center,
-                )
-            )
-        
         body_content = ft.Column(
-            controls=[header_container, *cards_list],
+            controls=[header_container, self.search_field, self.cards_column],
             spacing=20,
             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
             scroll=ft.ScrollMode.AUTO,
             expand=True,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=50,
         )
+        self.body_content = body_content
 
         # Container del body con scroll independiente y responsive
         # El scroll debe estar en el Column interno, no en el Container
@@ -256,8 +329,151 @@ class DashboardUI(ft.Column):
             navbar_container  # Navbar fijo (sin expand, queda abajo)
         ]
 
-        self.page.update()
-    
+        request_update(self.page)
+        self._start_loading()
+
+    # -------- carga del catálogo ----------
+    def _start_loading(self):
+        """Trae el catálogo en segundo plano; la vista ya está montada con placeholders."""
+        if not (self.logic and hasattr(self.logic, "cargaPruebas")):
+            self._replace_cards([self._wrap(self._empty_state())])
+            return
+        self._load_future = tasks_for(self.page).run_blocking(self._load_catalog)
+
+    def _load_catalog(self):
+        cancel = self._cancel_load
+        try:
+            if hasattr(self.logic, "iter_pruebas"):
+                batches = self.logic.iter_pruebas(cancel=cancel)
+            else:
+                batches = iter([self.logic.cargaPruebas()])
+            for batch in batches:
+                if cancel.is_set():
+                    return
+                with self._items_lock:
+                    fresh = [it for it in batch if it.get("id") is not None]
+                    self._all_items.extend(fresh)
+                    self._by_id.update((str(it["id"]), it) for it in fresh)
+                    if self._query:
+                        self._apply_filter()  # el índice ya incluye este lote
+                    else:
+                        self.exam_list.extend(fresh)
+                if self._showing_skeletons and self._all_items:
+                    self._replace_cards([self.no_results, self.exam_list])
+                else:
+                    request_update(self.page)
+        except Exception as ex:
+            print(f"[DASH] No se pudo cargar el catálogo: {ex}")
+        if not self._all_items and not cancel.is_set():
+            self._replace_cards([self._wrap(self._empty_state())])
+
+    def _replace_cards(self, cards: List[ft.Control]):
+        self._showing_skeletons = False
+        self.cards_column.controls = cards
+        request_update(self.page)
+
+    # -------- búsqueda ----------
+    def _on_search(self, e):
+        with self._items_lock:
+            self._query = (self.search_field.value or "").strip()
+            self._apply_filter()
+        # Resultados nuevos: volver al inicio de la lista
+        self.exam_list.on_viewport(0)
+        try:
+            self.body_content.scroll_to(offset=0, duration=0)
+        except Exception:
+            pass  # aún no montado
+        request_update(self.page)
+
+    def _apply_filter(self):
+        if not self._query or not hasattr(self.logic, "buscar"):
+            self.exam_list.set_items(self._all_items)
+            self.no_results.visible = False
+            return
+        ids = self.logic.buscar(self._query)
+        found = (self._by_id.get(str(i)) for i in ids)
+        self.exam_list.set_items([it for it in found if it is not None])
+        self.no_results.visible = not len(self.exam_list) and not self._showing_skeletons
+
+    def _on_scroll(self, e: ft.OnScrollEvent):
+        if self._showing_skeletons:
+            return
+        if self.exam_list.on_viewport(e.pixels - LIST_TOP, e.viewport_dimension):
+            request_update(self.page)
+
+    def cancel_loading(self):
+        """Corta la carga en curso (al navegar fuera del dashboard)."""
+        self._cancel_load.set()
+        if self._load_future is not None:
+            self._load_future.cancel()  # si aún no arrancó en el pool
+
+    def will_unmount(self):
+        self.cancel_loading()
+
+    # -------- tarjetas ----------
+    @staticmethod
+    def _wrap(card_item: ft.Control) -> ft.Control:
+        # Envolver cada tarjeta en un contenedor que se adapte al ancho
+        return ft.Container(content=card_item, alignment=ft.alignment.center)
+
+    @staticmethod
+    def _skeleton_card() -> ft.Control:
+        """Placeholder con la silueta de una tarjeta mientras llega el catálogo."""
+        def bar(width, height):
+            return ft.Container(width=width, height=height, bgcolor=ft.Colors.GREY_200, border_radius=6)
+
+        return ft.Container(
+            content=ft.Row(
+                controls=[
+                    ft.Container(bgcolor=ft.Colors.GREY_200, width=56, height=56, border_radius=28),
+                    ft.Container(width=16),
+                    ft.Column([bar(220, 16), bar(300, 12)], spacing=10, expand=True),
+                ],
+                spacing=0,
+            ),
+            bgcolor=ft.Colors.WHITE,
+            border_radius=16,
+            padding=20,
+            width=500,
+            border=ft.border.all(1, ft.Colors.GREY_200),
+        )
+
+    @staticmethod
+    def _empty_state() -> ft.Control:
+        # Estado vacío mejorado y responsive
+        return ft.Container(
+            padding=40,
+            border_radius=20,
+            bgcolor=ft.Colors.WHITE,
+            border=ft.border.all(2, ft.Colors.GREY_300),
+            content=ft.Column(
+                [
+                    ft.Icon(
+                        ft.Icons.INBOX,
+                        size=64,
+                        color=ft.Colors.GREY_400,
+                    ),
+                    ft.Container(height=16),
+                    ft.Text(
+                        "Aún no hay pruebas disponibles",
+                        weight=ft.FontWeight.BOLD,
+                        size=18,
+                        color=ft.Colors.GREY_700,
+                        text_align=ft.TextAlign.CENTER,
+                    ),
+                    ft.Text(
+                        "Las pruebas aparecerán aquí cuando estén disponibles",
+                        size=14,
+                        color=ft.Colors.GREY_500,
+                        text_align=ft.TextAlign.CENTER,
+                    ),
+                ],
+                spacing=8,
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            ),
+            width=500,  # Ancho fijo para pantallas grandes
+        )
+
     def _open_exam(self, exam_id: str, exam_data: dict = None):
         """Abre la vista de examen para realizar la prueba"""
         if not exam_id:
@@ -266,9 +482,12 @@ class DashboardUI(ft.Column):
                 bgcolor=ft.Colors.RED,
             )
             self.page.snack_bar.open = True
-            self.page.update()
+            request_update(self.page)
             return
         
+        # Se sale del dashboard: lo que quede del catálogo ya no se pinta
+        self.cancel_loading()
+
         # Mostrar loading overlay
         self._show_loading()
         
@@ -292,48 +511,31 @@ class DashboardUI(ft.Column):
                         bgcolor=ft.Colors.RED,
                     )
                     self.page.snack_bar.open = True
-                    self.page.update()
+                    request_update(self.page)
             except Exception:
                 self._hide_loading()
         
-        # Pequeño delay para mostrar la animación usando función asíncrona
-        import asyncio
-        async def delayed_navigate():
-            await asyncio.sleep(0.3)
-            navigate()
-        
-        # Ejecutar la función asíncrona
-        try:
-            self.page.run_task(delayed_navigate)
-        except Exception:
-            # Fallback: usar threading y page.run_on_idle si está disponible
-            import threading
-            import time
-            def delayed_navigate_sync():
-                time.sleep(0.3)
-                if hasattr(self.page, "run_on_idle"):
-                    self.page.run_on_idle(navigate)
-                else:
-                    navigate()
-            threading.Thread(target=delayed_navigate_sync, daemon=True).start()
+        # Pequeño delay para mostrar la animación
+        # (navigate carga el examen por red: corre en el pool, no en el event loop)
+        tasks_for(self.page).call_later(0.3, navigate, owner=self, blocking=True)
     
     def _show_loading(self):
         """Muestra el overlay de carga"""
         if self.loading_overlay not in self.page.overlay:
             self.page.overlay.append(self.loading_overlay)
-            self.page.update()
+            request_update(self.page)
         
         self.loading_overlay.visible = True
         self.loading_overlay.show()
-        self.page.update()
+        request_update(self.page)
     
     def _hide_loading(self):
         """Oculta el overlay de carga"""
         try:
             self.loading_overlay.hide()
-            self.page.update()
+            request_update(self.page)
             if self.loading_overlay in self.page.overlay:
                 self.page.overlay.remove(self.loading_overlay)
-            self.page.update()
+            request_update(self.page)
         except Exception:
             pass
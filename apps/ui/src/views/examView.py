@@ -1,10 +1,147 @@
 # src/views/examView.py
 from __future__ import annotations
 import flet as ft
-from typing import Optional
+from typing import Callable, Dict, List, NamedTuple, Optional
 from ..modules.exams.examLogic import ExamLogic
 from .nav_bar import build_navigation_bar
 from .loading_overlay import LoadingOverlay
+from ..utils.task_scheduler import Handle, tasks_for
+from ..utils.update_scheduler import request_update
+
+
+class OptionStyle(NamedTuple):
+    bg_color: str
+    border_color: str
+    icon_name: str
+    icon_color: str
+    icon_visible: bool
+    selected: bool
+    shadow: bool
+    clickable: bool
+
+
+def option_style(is_selected: bool, is_correct_option: bool, is_correct: bool, show_result: bool) -> OptionStyle:
+    """Colores e icono de una opción según selección y resultado."""
+    bg_color = ft.Colors.WHITE
+    border_color = ft.Colors.GREY_300
+    icon_name = ft.Icons.RADIO_BUTTON_UNCHECKED
+    icon_color = ft.Colors.GREY
+    
+    if show_result:
+        # Mostrar resultado
+        if is_correct_option:
+            # Respuesta correcta (verde)
+            bg_color = ft.Colors.GREEN_50
+            border_color = ft.Colors.GREEN
+            icon_name = ft.Icons.CHECK_CIRCLE
+            icon_color = ft.Colors.GREEN
+        elif is_selected and not is_correct:
+            # Respuesta incorrecta seleccionada (rojo)
+            bg_color = ft.Colors.RED_50
+            border_color = ft.Colors.RED
+            icon_name = ft.Icons.CANCEL
+            icon_color = ft.Colors.RED
+    elif is_selected:
+        # Opción seleccionada (azul)
+        bg_color = ft.Colors.BLUE_50
+        border_color = ft.Colors.BLUE
+        icon_name = ft.Icons.RADIO_BUTTON_CHECKED
+        icon_color = ft.Colors.BLUE
+    
+    return OptionStyle(
+        bg_color=bg_color,
+        border_color=border_color,
+        icon_name=icon_name,
+        icon_color=icon_color,
+        icon_visible=show_result or is_selected,
+        selected=is_selected,
+        shadow=is_selected or show_result,
+        clickable=not show_result,
+    )
+
+
+class OptionCard(ft.Container):
+    """Tarjeta de una opción que se construye una vez y luego solo se parchea.
+
+    apply() compara con el último estilo aplicado y toca únicamente las
+    propiedades que cambiaron, así page.update() envía unos pocos atributos
+    (borde, fondo, icono, sombra) en vez de re-serializar la pregunta entera.
+    """
+
+    def __init__(self, key: str, on_pick: Callable[[str], None]):
+        self.key_letter = key
+        self._on_pick = on_pick
+        self._text: Optional[str] = None
+        self._style: Optional[OptionStyle] = None
+
+        self.letter_text = ft.Text(key.upper(), size=16, weight=ft.FontWeight.BOLD)
+        self.letter_badge = ft.Container(
+            content=self.letter_text,
+            width=40,
+            height=40,
+            alignment=ft.alignment.center,
+            border_radius=20,
+        )
+        self.option_text = ft.Text(
+            "",
+            size=15,
+            color=ft.Colors.BLACK87,
+            expand=True,
+            max_lines=3,  # Permitir múltiples líneas en móvil
+            overflow=ft.TextOverflow.VISIBLE,
+        )
+        # El icono siempre ocupa sus 24 px; se oculta con opacidad para no mover el texto
+        self.state_icon = ft.Icon(ft.Icons.RADIO_BUTTON_UNCHECKED, size=24)
+        super().__init__(
+            border_radius=16,
+            padding=ft.padding.symmetric(horizontal=16, vertical=16),  # Padding responsive
+            ink=True,
+            content=ft.Row(
+                controls=[
+                    self.letter_badge,
+                    ft.Container(width=12),  # Espaciador más pequeño en móvil
+                    self.option_text,
+                    self.state_icon,
+                ],
+                alignment=ft.MainAxisAlignment.START,
+                spacing=0,
+                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                wrap=False,
+            ),
+        )
+
+    def _click(self, e):
+        self._on_pick(self.key_letter)
+
+    def apply(self, text: str, style: OptionStyle) -> None:
+        if text != self._text:
+            self.option_text.value = text
+            self._text = text
+        old = self._style
+        if style == old:
+            return
+        if old is None or style.bg_color != old.bg_color or style.border_color != old.border_color:
+            self.bgcolor = style.bg_color
+            self.border = ft.border.all(2, style.border_color)
+            self.letter_badge.bgcolor = style.bg_color if style.bg_color != ft.Colors.WHITE else ft.Colors.GREY_50
+            self.letter_badge.border = ft.border.all(2, style.border_color)
+            self.letter_text.color = style.border_color
+        if old is None or style.icon_name != old.icon_name or style.icon_color != old.icon_color:
+            self.state_icon.name = style.icon_name
+            self.state_icon.color = style.icon_color
+        if old is None or style.icon_visible != old.icon_visible:
+            self.state_icon.opacity = 1.0 if style.icon_visible else 0.0
+        if old is None or style.selected != old.selected:
+            self.option_text.weight = ft.FontWeight.W_500 if style.selected else ft.FontWeight.NORMAL
+        if old is None or style.shadow != old.shadow or style.selected != old.selected:
+            self.shadow = ft.BoxShadow(
+                blur_radius=4 if style.selected else 0,
+                color=ft.Colors.BLACK12 if style.selected else ft.Colors.TRANSPARENT,
+                offset=ft.Offset(0, 2),
+            ) if style.shadow else None
+        if old is None or style.clickable != old.clickable:
+            self.on_click = self._click if style.clickable else None
+        self._style = style
 
 
 class ExamViewUI(ft.Column):
@@ -16,6 +153,7 @@ class ExamViewUI(ft.Column):
         self.exam_id = exam_id
         self.user = user or {}
         self.controller = controller
+        self.tasks = tasks_for(page)
         self.logic = ExamLogic(exam_id=exam_id, exam_data=exam_data)
         
         # Cargar el examen
@@ -52,8 +190,16 @@ class ExamViewUI(ft.Column):
         self.loading_overlay.visible = False
         
         # Temporizador para avance automático
-        self.auto_advance_task = None
-        self.auto_advance_cancelled = False
+        self.auto_advance_task: Optional[Handle] = None
+        # Tiempo límite (solo si el examen trae duracion_seg): arranca al montar
+        # la vista (did_mount) y en cada tick solo se repinta este texto
+        self._timer_enabled = self.logic.timer is not None
+        self.timer_text = ft.Text(
+            self.logic.timer.mmss() if self.logic.timer is not None else "",
+            size=14,
+            weight=ft.FontWeight.BOLD,
+            color=ft.Colors.WHITE,
+        )
         
         # Controles principales mejorados y responsive
         self.title_text = ft.Text(
@@ -79,6 +225,8 @@ class ExamViewUI(ft.Column):
             color=ft.Colors.GREY_900,
         )
         self.options_column = ft.Column(spacing=14)
+        self._option_cards: Dict[str, OptionCard] = {}
+        self._option_keys: List[str] = []
         self.result_container = ft.Container(visible=False)
         self.next_button = ft.ElevatedButton(
             text="Siguiente",
@@ -109,6 +257,36 @@ class ExamViewUI(ft.Column):
         self._build_ui()
         self._update_question()
     
+    # -------- tiempo límite ----------
+    def did_mount(self):
+        if getattr(self, "_timer_enabled", False) and not self.logic.timer.running:
+            self.page.on_app_lifecycle_state_change = self._on_lifecycle
+            self.page.run_task(self.logic.timer.run, self._tick, self._timeout)
+
+    def will_unmount(self):
+        self._stop_timer()
+
+    def _tick(self):
+        # Solo se repinta el control del tiempo (sin page.update)
+        self.timer_text.value = self.logic.timer.mmss()
+        if self.timer_text.page is not None:
+            self.timer_text.update()
+
+    def _timeout(self):
+        self._finish_exam()
+
+    def _on_lifecycle(self, e):
+        # Al volver de segundo plano el tiempo se resincroniza de inmediato
+        if e.state in (ft.AppLifecycleState.RESUME, ft.AppLifecycleState.SHOW):
+            self.logic.timer.resync()
+
+    def _stop_timer(self):
+        self._timer_enabled = False   # una prueba terminada no vuelve a correr al re-montarse
+        if self.logic.timer is not None:
+            self.logic.timer.stop()
+        if self.page is not None and self.page.on_app_lifecycle_state_change == self._on_lifecycle:
+            self.page.on_app_lifecycle_state_change = None
+
     def _build_ui(self):
         """Construye la interfaz de usuario"""
         exam_info = self.logic.get_exam_info()
@@ -141,7 +319,13 @@ class ExamViewUI(ft.Column):
                         content=self.title_text,
                         expand=True,  # Se expande para ocupar el espacio disponible
                     ),
-                    ft.Container(width=48),  # Espaciador para balancear
+                    ft.Row(
+                        controls=[
+                            ft.Icon(ft.Icons.ALARM, size=16, color=ft.Colors.WHITE),
+                            self.timer_text,
+                        ],
+                        spacing=4,
+                    ) if self.logic.timer is not None else ft.Container(width=48),  # Espaciador para balancear
                 ],
                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
@@ -335,8 +519,6 @@ class ExamViewUI(ft.Column):
             self._show_error(f"La pregunta no tiene opciones válidas. Formato recibido: {type(options)}")
             return
         
-        self.options_column.controls = []
-        
         selected_answer = self.logic.selected_answer
         show_result = self.logic.show_result
         correct_answer = question.get("correct", "")
@@ -347,93 +529,23 @@ class ExamViewUI(ft.Column):
         if user_answer_data:
             is_correct = user_answer_data.get("correct", False)
         
-        for key, value in options.items():
-            option_text = str(value)
+        # Reconciliación por clave: una tarjeta por letra que se reutiliza entre
+        # selecciones y preguntas; solo cambian las propiedades que difieren
+        keys = list(options.keys())
+        for key in keys:
+            card = self._option_cards.get(key)
+            if card is None:
+                card = OptionCard(key, self._on_option_click)
+                self._option_cards[key] = card
             is_selected = selected_answer == key
             is_correct_option = key.lower() == str(correct_answer).lower()
-            
-            # Determinar colores y estilo
-            bg_color = ft.Colors.WHITE
-            border_color = ft.Colors.GREY_300
-            text_color = ft.Colors.BLACK87
-            icon_name = ft.Icons.RADIO_BUTTON_UNCHECKED
-            icon_color = ft.Colors.GREY
-            
-            if show_result:
-                # Mostrar resultado
-                if is_correct_option:
-                    # Respuesta correcta (verde)
-                    bg_color = ft.Colors.GREEN_50
-                    border_color = ft.Colors.GREEN
-                    icon_name = ft.Icons.CHECK_CIRCLE
-                    icon_color = ft.Colors.GREEN
-                elif is_selected and not is_correct:
-                    # Respuesta incorrecta seleccionada (rojo)
-                    bg_color = ft.Colors.RED_50
-                    border_color = ft.Colors.RED
-                    icon_name = ft.Icons.CANCEL
-                    icon_color = ft.Colors.RED
-            elif is_selected:
-                # Opción seleccionada (azul)
-                bg_color = ft.Colors.BLUE_50
-                border_color = ft.Colors.BLUE
-                icon_name = ft.Icons.RADIO_BUTTON_CHECKED
-                icon_color = ft.Colors.BLUE
-            
-            # Badge de letra mejorado
-            letter_badge = ft.Container(
-                content=ft.Text(
-                    key.upper(),
-                    size=16,
-                    weight=ft.FontWeight.BOLD,
-                    color=border_color,
-                ),
-                width=40,
-                height=40,
-                alignment=ft.alignment.center,
-                bgcolor=bg_color if bg_color != ft.Colors.WHITE else ft.Colors.GREY_50,
-                border=ft.border.all(2, border_color),
-                border_radius=20,
-            )
-            
-            option_card = ft.Container(
-                bgcolor=bg_color,
-                border=ft.border.all(2, border_color),
-                border_radius=16,
-                padding=ft.padding.symmetric(horizontal=16, vertical=16),  # Padding responsive
-                ink=True,
-                on_click=None if show_result else (lambda e, k=key: self._on_option_click(k)),
-                content=ft.Row(
-                    controls=[
-                        letter_badge,
-                        ft.Container(width=12),  # Espaciador más pequeño en móvil
-                        ft.Text(
-                            option_text,
-                            size=15,
-                            color=text_color,
-                            weight=ft.FontWeight.W_500 if is_selected else ft.FontWeight.NORMAL,
-                            expand=True,
-                            max_lines=3,  # Permitir múltiples líneas en móvil
-                            overflow=ft.TextOverflow.VISIBLE,
-                        ),
-                        ft.Icon(
-                            name=icon_name,
-                            color=icon_color,
-                            size=24,  # Icono ligeramente más pequeño
-                        ) if show_result or is_selected else ft.Container(width=24),
-                    ],
-                    alignment=ft.MainAxisAlignment.START,
-                    spacing=0,
-                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                    wrap=False,
-                ),
-                shadow=ft.BoxShadow(
-                    blur_radius=4 if is_selected else 0,
-                    color=ft.Colors.BLACK12 if is_selected else ft.Colors.TRANSPARENT,
-                    offset=ft.Offset(0, 2),
-                ) if is_selected or show_result else None,
+            card.apply(
+                str(options[key]),
+                option_style(is_selected, is_correct_option, is_correct, show_result),
             )
-            self.options_column.controls.append(option_card)
+        if keys != self._option_keys:
+            self.options_column.controls = [self._option_cards[k] for k in keys]
+            self._option_keys = keys
         
         # Mostrar resultado si está validado
         if show_result:
@@ -459,7 +571,7 @@ class ExamViewUI(ft.Column):
         # Deshabilitar botón siguiente si no hay respuesta seleccionada
         self.next_button.disabled = not selected_answer and not show_result
         
-        self.page.update()
+        request_update(self.page)
     
     def _show_result(self, is_correct: bool, correct_key: str, correct_text: str):
         """Muestra el resultado de la validación mejorado"""
@@ -565,32 +677,9 @@ class ExamViewUI(ft.Column):
                 self._show_snackbar("Por favor selecciona una respuesta antes de validar.", ft.Colors.ORANGE)
                 return
             
-            # Mostrar animación de carga al validar
+            # Mostrar animación de carga al validar y actualizar tras un pequeño delay
             self._show_loading("Validando respuesta...")
-            
-            # Actualizar después de un pequeño delay
-            import asyncio
-            async def update_after_validation():
-                await asyncio.sleep(0.4)  # Pequeño delay para mostrar la animación
-                self._update_question()
-                self._hide_loading()
-                
-                # Iniciar temporizador automático para avanzar después de 2.5 segundos
-                self._start_auto_advance()
-            
-            try:
-                self.page.run_task(update_after_validation)
-            except Exception:
-                # Fallback si falla run_task
-                import threading
-                import time
-                def delayed_update():
-                    time.sleep(0.4)
-                    self._update_question()
-                    self._hide_loading()
-                    # Iniciar temporizador automático
-                    self._start_auto_advance()
-                threading.Thread(target=delayed_update, daemon=True).start()
+            self.tasks.call_later(0.4, self._after_validation, owner=self)
         else:
             # Cancelar el avance automático si el usuario hace clic manualmente
             self._cancel_auto_advance()
@@ -601,101 +690,46 @@ class ExamViewUI(ft.Column):
             else:
                 # Mostrar animación de carga al cambiar de pregunta
                 self._show_loading("Cargando siguiente pregunta...")
-                
-                # Actualizar después de un pequeño delay
-                import asyncio
-                async def update_after_navigation():
-                    await asyncio.sleep(0.4)  # Pequeño delay para mostrar la animación
-                    if self.logic.continue_after_result():
-                        self._update_question()
-                    else:
-                        self._finish_exam()
-                    self._hide_loading()
-                
-                try:
-                    self.page.run_task(update_after_navigation)
-                except Exception:
-                    # Fallback si falla run_task
-                    import threading
-                    import time
-                    def delayed_navigate():
-                        time.sleep(0.4)
-                        if self.logic.continue_after_result():
-                            self._update_question()
-                        else:
-                            self._finish_exam()
-                        self._hide_loading()
-                    threading.Thread(target=delayed_navigate, daemon=True).start()
+                self.tasks.call_later(0.4, self._advance, owner=self)
+    
+    def _after_validation(self):
+        self._update_question()
+        self._hide_loading()
+        
+        # Iniciar temporizador automático para avanzar después de 2.5 segundos
+        self._start_auto_advance()
+    
+    def _advance(self):
+        """Pasa a la siguiente pregunta (o finaliza) y oculta el loading"""
+        if self.logic.continue_after_result():
+            self._update_question()
+        else:
+            self._finish_exam()
+        self._hide_loading()
     
     def _start_auto_advance(self):
         """Inicia el temporizador automático para avanzar a la siguiente pregunta"""
         # Cancelar cualquier temporizador anterior
         self._cancel_auto_advance()
-        self.auto_advance_cancelled = False
-        
-        import asyncio
-        async def auto_advance():
-            # Esperar 2.5 segundos
-            await asyncio.sleep(2.5)
-            
-            # Verificar que no se haya cancelado
-            if not self.auto_advance_cancelled and self.logic.show_result:
-                # Avanzar automáticamente a la siguiente pregunta
-                if self.logic.is_last_question():
-                    self._finish_exam()
-                else:
-                    # Mostrar animación de carga al cambiar de pregunta
-                    self._show_loading("Cargando siguiente pregunta...")
-                    
-                    # Actualizar después de un pequeño delay
-                    async def update_after_navigation():
-                        await asyncio.sleep(0.4)
-                        if self.logic.continue_after_result():
-                            self._update_question()
-                            # Reiniciar el temporizador para la siguiente pregunta si es necesario
-                            # (solo si se valida automáticamente, pero aquí ya avanzamos)
-                        else:
-                            self._finish_exam()
-                        self._hide_loading()
-                    
-                    try:
-                        self.page.run_task(update_after_navigation)
-                    except Exception:
-                        # Fallback
-                        import threading
-                        import time
-                        def delayed_navigate():
-                            time.sleep(0.4)
-                            if self.logic.continue_after_result():
-                                self._update_question()
-                            else:
-                                self._finish_exam()
-                            self._hide_loading()
-                        threading.Thread(target=delayed_navigate, daemon=True).start()
-        
-        try:
-            self.auto_advance_task = self.page.run_task(auto_advance)
-        except Exception:
-            # Fallback si falla run_task
-            import threading
-            import time
-            def delayed_advance():
-                time.sleep(2.5)
-                if not self.auto_advance_cancelled and self.logic.show_result:
-                    if self.logic.is_last_question():
-                        self._finish_exam()
-                    else:
-                        if self.logic.continue_after_result():
-                            self._update_question()
-                        else:
-                            self._finish_exam()
-            threading.Thread(target=delayed_advance, daemon=True).start()
+        self.auto_advance_task = self.tasks.call_later(2.5, self._auto_advance, owner=self)
+    
+    def _auto_advance(self):
+        self.auto_advance_task = None
+        if not self.logic.show_result:
+            return
+        # Avanzar automáticamente a la siguiente pregunta
+        if self.logic.is_last_question():
+            self._finish_exam()
+        else:
+            # Mostrar animación de carga al cambiar de pregunta
+            self._show_loading("Cargando siguiente pregunta...")
+            self.tasks.call_later(0.4, self._advance, owner=self)
     
     def _cancel_auto_advance(self):
         """Cancela el temporizador automático"""
-        self.auto_advance_cancelled = True
-        # Nota: No podemos cancelar directamente la tarea de asyncio desde aquí,
-        # pero la bandera auto_advance_cancelled evitará que se ejecute
+        if self.auto_advance_task is not None:
+            self.auto_advance_task.cancel()
+            self.auto_advance_task = None
     
     def _on_prev_click(self, e):
         """Maneja el click en el botón anterior"""
@@ -705,30 +739,20 @@ class ExamViewUI(ft.Column):
         if self.logic.previous_question():
             # Mostrar animación de carga al cambiar de pregunta
             self._show_loading("Cargando pregunta anterior...")
-            
-            # Actualizar después de un pequeño delay
-            import asyncio
-            async def update_after_navigation():
-                await asyncio.sleep(0.4)  # Pequeño delay para mostrar la animación
-                self._update_question()
-                self._hide_loading()
-            
-            try:
-                self.page.run_task(update_after_navigation)
-            except Exception:
-                # Fallback si falla run_task
-                import threading
-                import time
-                def delayed_update():
-                    time.sleep(0.4)
-                    self._update_question()
-                    self._hide_loading()
-                threading.Thread(target=delayed_update, daemon=True).start()
+            self.tasks.call_later(0.4, self._after_prev, owner=self)
+    
+    def _after_prev(self):
+        self._update_question()
+        self._hide_loading()
     
+
     def _finish_exam(self):
         """Finaliza el examen y muestra los resultados"""
-        # Cancelar el avance automático si está activo
+        # Nada de lo ya programado por esta vista (validación, avance) debe
+        # correr después de finalizar: reabriría el diálogo o seguiría avanzando
+        self.tasks.cancel_owner(self)
         self._cancel_auto_advance()
+        self._stop_timer()
         
         # Ocultar loading si está activo
         self._hide_loading()
@@ -786,7 +810,7 @@ class ExamViewUI(ft.Column):
         
         self.page.dialog = dialog
         dialog.open = True
-        self.page.update()
+        request_update(self.page)
     
     def _go_back_from_dialog(self, e=None):
         """Cierra el diálogo y regresa al dashboard"""
@@ -794,31 +818,11 @@ class ExamViewUI(ft.Column):
         try:
             if self.page.dialog:
                 self.page.dialog.open = False
-                self.page.update()
+                request_update(self.page)
         except Exception:
             pass
         
-        # Mostrar animación de carga
-        self._show_loading("Regresando al dashboard...")
-        
-        # Pequeño delay para mostrar la animación, luego regresar
-        import asyncio
-        async def go_back_after_delay():
-            await asyncio.sleep(0.5)
-            # No ocultar loading aquí, se ocultará cuando cambie la vista
-            self._go_back()
-        
-        try:
-            self.page.run_task(go_back_after_delay)
-        except Exception:
-            # Fallback si falla run_task
-            import threading
-            import time
-            def delayed_go_back():
-                time.sleep(0.5)
-                # No ocultar loading aquí, se ocultará cuando cambie la vista
-                self._go_back()
-            threading.Thread(target=delayed_go_back, daemon=True).start()
+        self._go_back_with_loading()
     
     def _go_back_with_loading(self):
         """Regresa al dashboard con animación de carga"""
@@ -826,26 +830,15 @@ class ExamViewUI(ft.Column):
         self._show_loading("Regresando al dashboard...")
         
         # Pequeño delay para mostrar la animación, luego regresar
-        import asyncio
-        async def go_back_after_delay():
-            await asyncio.sleep(0.5)
-            # No ocultar loading aquí, se ocultará cuando cambie la vista
-            self._go_back()
-        
-        try:
-            self.page.run_task(go_back_after_delay)
-        except Exception:
-            # Fallback si falla run_task
-            import threading
-            import time
-            def delayed_go_back():
-                time.sleep(0.5)
-                # No ocultar loading aquí, se ocultará cuando cambie la vista
-                self._go_back()
-            threading.Thread(target=delayed_go_back, daemon=True).start()
+        # (no ocultar loading aquí, se ocultará cuando cambie la vista)
+        self.tasks.call_later(0.5, self._go_back, owner=self)
     
+
     def _go_back(self, e=None):
         """Regresa al dashboard"""
+        # Nada de lo programado por esta vista debe correr cuando ya no está
+        self.tasks.cancel_owner(self)
+        self._stop_timer()
         try:
             # Ocultar loading antes de cambiar de vista
             self._hide_loading()
@@ -862,7 +855,7 @@ class ExamViewUI(ft.Column):
                             bgcolor=ft.Colors.RED,
                         )
                         self.page.snack_bar.open = True
-                        self.page.update()
+                        request_update(self.page)
                 except Exception:
                     pass
         except Exception as ex:
@@ -874,7 +867,7 @@ class ExamViewUI(ft.Column):
                         bgcolor=ft.Colors.RED,
                     )
                     self.page.snack_bar.open = True
-                    self.page.update()
+                    request_update(self.page)
             except Exception:
                 pass
     
@@ -928,7 +921,7 @@ class ExamViewUI(ft.Column):
             ),
             navbar_container  # Navbar fijo (sin expand, queda abajo)
         ]
-        self.page.update()
+        request_update(self.page)
     
     def _show_error(self, message: str):
         """Muestra un mensaje de error (método legacy)"""
@@ -941,18 +934,18 @@ class ExamViewUI(ft.Column):
             bgcolor=color,
         )
         self.page.snack_bar.open = True
-        self.page.update()
+        request_update(self.page)
     
     def _show_loading(self, message: str = "Procesando..."):
         """Muestra el overlay de carga"""
         if self.loading_overlay not in self.page.overlay:
             self.page.overlay.append(self.loading_overlay)
-            self.page.update()
+            request_update(self.page)
         
         self.loading_overlay.update_message(message)
         self.loading_overlay.visible = True
         self.loading_overlay.show()
-        self.page.update()
+        request_update(self.page)
     
     def _hide_loading(self):
         """Oculta el overlay de carga"""
@@ -967,7 +960,7 @@ class ExamViewUI(ft.Column):
                 if hasattr(self.page, 'overlay') and self.loading_overlay in self.page.overlay:
                     self.page.overlay.remove(self.loading_overlay)
                 
-                self.page.update()
+                request_update(self.page)
         except Exception:
             # Ignorar errores si la página ya cambió de vista
             pass
@@ -1,4 +1,6 @@
 import flet as ft
+from ..utils.task_scheduler import tasks_for
+from ..utils.update_scheduler import request_update
 
 class LoadingOverlay(ft.Container):
     """Overlay de carga animado para mostrar durante el proceso de login"""
@@ -105,7 +107,7 @@ class LoadingOverlay(ft.Container):
     def show(self):
         """Muestra el overlay con animación"""
         self.opacity = 1.0
-        # No hacer self.update() aquí - el código que llama debe hacer page.update()
+        # No hacer self.update() aquí - el código que llama debe hacer request_update(page)
         
     def hide(self):
         """Oculta el overlay con animación"""
@@ -121,13 +123,13 @@ class LoadingOverlay(ft.Container):
         C = getattr(ft, "colors", None) or getattr(ft, "Colors", None)
         self.loading_text.color = getattr(C, "GREY_800", "#1F2937")
         self.loading_text.weight = ft.FontWeight.W_500
-        # No hacer self.update() aquí - el código que llama debe hacer page.update()
+        # No hacer self.update() aquí - el código que llama debe hacer request_update(page)
         
     def update_message(self, new_message: str):
         """Actualiza el mensaje de carga"""
         self.loading_text.value = new_message
         self.message = new_message
-        # No hacer self.update() aquí - el código que llama debe hacer page.update()
+        # No hacer self.update() aquí - el código que llama debe hacer request_update(page)
     
     def show_error(self, duration: int = 2000):
         """Muestra un error con X roja y mensaje 'Credenciales Inválidas'"""
@@ -151,36 +153,21 @@ class LoadingOverlay(ft.Container):
         self.loading_text.color = ERROR_COLOR
         self.loading_text.weight = ft.FontWeight.W_600
         
-        # Forzar actualización múltiple
-        self.page.update()
-        self.page.update()
+        request_update(self.page)
         
         # Auto-ocultar después de la duración especificada
         def auto_hide(e=None):
             try:
                 self.hide()
-                self.page.update()
+                request_update(self.page)
                 # Remover del overlay después de ocultar
                 if self in self.page.overlay:
                     self.page.overlay.remove(self)
-                self.page.update()
+                request_update(self.page)
             except:
                 pass
         
-        try:
-            hide_timer = ft.Timer(interval=duration, once=True, on_tick=auto_hide)
-            self.page.overlay.append(hide_timer)
-        except:
-            # Si el timer falla, usar threading
-            import threading
-            def delayed_hide():
-                import time
-                time.sleep(duration / 1000.0)
-                try:
-                    self.page.run_task(auto_hide)
-                except:
-                    auto_hide()
-            threading.Thread(target=delayed_hide, daemon=True).start()
+        tasks_for(self.page).call_later(duration / 1000.0, auto_hide, owner=self)
     
     def show_success(self, duration: int = 1500, callback=None):
         """Muestra un éxito con check verde y mensaje '¡Inicio de sesión exitoso!'"""
@@ -206,9 +193,7 @@ class LoadingOverlay(ft.Container):
         self.loading_text.color = SUCCESS_COLOR
         self.loading_text.weight = ft.FontWeight.W_600
         
-        # Forzar actualización múltiple
-        self.page.update()
-        self.page.update()
+        request_update(self.page)
         
         # Ejecutar callback después de la duración especificada (sin ocultar el overlay)
         # El overlay se ocultará cuando se cambie de vista en el callback
@@ -220,18 +205,4 @@ class LoadingOverlay(ft.Container):
             except Exception:
                 pass
         
-        try:
-            callback_timer = ft.Timer(interval=duration, once=True, on_tick=execute_callback)
-            self.page.overlay.append(callback_timer)
-        except:
-            # Si el timer falla, usar threading
-            import threading
-            def delayed_callback():
-                import time
-                time.sleep(duration / 1000.0)
-                try:
-                    self.page.run_task(execute_callback)
-                except:
-                    execute_callback()
-            threading.Thread(target=delayed_callback, daemon=True).start()
-
+        tasks_for(self.page).call_later(duration / 1000.0, execute_callback, owner=self)
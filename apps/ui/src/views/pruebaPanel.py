@@ -1,11 +1,29 @@
 # src/views/prueba_panel.py
 import flet as ft
-from .dashboard import Dashboard  # para back
+from typing import Optional
+from .dashboard import DashboardUI  # para back
+from ..API.images import option_images
+from ..modules.dashboard.dashboardLogic import DashboardLogic
 from ..modules.pruebas.pruebasLogic import PruebaLogic, ViewModel, OptionData
+from ..utils.update_scheduler import request_update
 
-def PruebaPanelUI(page: ft.Page, prueba_id: int) -> ft.Control:
+def PruebaPanelUI(page: ft.Page, prueba_id: int, user: Optional[dict] = None, controller=None) -> ft.Control:
     logic = PruebaLogic(prueba_id=prueba_id)
 
+    def _back(page: ft.Page, logic: PruebaLogic):
+        logic.stop_timer()
+        page.on_app_lifecycle_state_change = None
+        # Usa el router si existe (como ExamViewUI); si no, monta el dashboard
+        # completo igual que LoginLogic.continuar
+        if controller and hasattr(controller, "show_dashboard"):
+            controller.show_dashboard(user_obj=user)
+            return
+        page.views.clear()
+        dash_logic = DashboardLogic(page, user=user)
+        dash_ui = DashboardUI(page, user=user, logic=dash_logic, controller=controller)
+        page.views.append(ft.View(route="/dashboard", controls=[dash_ui]))
+        request_update(page)
+
     if not logic.cargar():
         return ft.Container(
             content=ft.Column(
@@ -81,7 +99,9 @@ def PruebaPanelUI(page: ft.Page, prueba_id: int) -> ft.Control:
             ft.Text(value_text, size=14, selectable=False, expand=True),
         ]
         if img_url:
-            content_controls.append(ft.Image(src=img_url, height=42, fit=ft.ImageFit.CONTAIN))
+            # Copia local pre-escalada si ya se descargó; si no, la URL remota
+            src = option_images().props(img_url, web=bool(page.web)) or {"src": img_url}
+            content_controls.append(ft.Image(**src, height=42, fit=ft.ImageFit.CONTAIN))
 
         return ft.Container(
             bgcolor=bg,
@@ -124,7 +144,7 @@ def PruebaPanelUI(page: ft.Page, prueba_id: int) -> ft.Control:
         options_col.controls = [option_card(o, vm) for o in vm.opciones]
         set_btn_label(btn_next, vm)
 
-        page.update()
+        request_update(page)
 
     # ---- Handlers (UI -> lógica) ----
     def on_select(value_text: str):
@@ -156,6 +176,7 @@ def PruebaPanelUI(page: ft.Page, prueba_id: int) -> ft.Control:
         result = logic.finalizar(motivo)
         resumen = result.get("resumen", {})
         err = result.get("error")
+        en_cola = result.get("envio", {}).get("estado") == "en_cola"
 
         dlg = ft.AlertDialog(
             modal=True,
@@ -168,26 +189,22 @@ def PruebaPanelUI(page: ft.Page, prueba_id: int) -> ft.Control:
                     ft.Text(f"Sin responder: {resumen.get('pendientes', 0)}"),
                     ft.Text(f"Puntaje: {resumen.get('puntaje', 0.0):.1f}%"),
                     ft.Text(f"Estado: {resumen.get('motivo', motivo)}"),
-                    *( [ft.Text(f"⚠️ Error guardando intento: {err}", color=ft.Colors.RED)] if err else [] )
+                    *( [ft.Text(f"⚠️ Error guardando intento: {err}", color=ft.Colors.RED)] if err else [] ),
+                    *( [ft.Text("Intento guardado; se enviará automáticamente en cuanto haya conexión.",
+                                size=12, color=ft.Colors.GREY_700)] if en_cola else [] ),
                 ],
             ),
             actions=[ft.TextButton("Volver al dashboard", on_click=lambda e: _back(page, logic))],
         )
         page.dialog = dlg
         dlg.open = True
-        page.update()
+        request_update(page)
         render(logic.view())
 
     def _snack(msg: str, color=None):
         page.snack_bar = ft.SnackBar(ft.Text(msg, color=color))
         page.snack_bar.open = True
-        page.update()
-
-    def _back(page: ft.Page, logic: PruebaLogic):
-        logic.stop_timer()
-        page.clean()
-        Dashboard(page)
-        page.update()
+        request_update(page)
 
     # ---- UI Layout ----
     header = ft.Container(
@@ -291,15 +308,21 @@ def PruebaPanelUI(page: ft.Page, prueba_id: int) -> ft.Control:
     # ---- Primer render + timer ----
     render(logic.view())
 
-    # Ticks: solo actualiza mm:ss en la UI
+    # Ticks: solo se repinta el control del tiempo (sin ViewModel ni page.update)
     def _tick():
-        vm = logic.view()
-        timer_text.value = vm.tiempo_mmss
-        page.update()
+        timer_text.value = logic.tiempo_mmss()
+        if timer_text.page is not None:
+            timer_text.update()
 
     def _timeout():
         _snack("Tiempo agotado.")
         on_finish("tiempo agotado")
 
+    # Al volver de segundo plano el timer se resincroniza de inmediato
+    def _on_lifecycle(e):
+        if e.state in (ft.AppLifecycleState.RESUME, ft.AppLifecycleState.SHOW):
+            logic.resync()
+
+    page.on_app_lifecycle_state_change = _on_lifecycle
     page.run_task(logic.countdown, _tick, _timeout)
     return center_wrapper
@@ -1,5 +1,6 @@
 import flet as ft
 from ..utils.buttonLogin import ButtonLogin
+from ..utils.update_scheduler import request_update
 
 # ======================================
 #            REGISTER  (UI)
@@ -395,7 +396,7 @@ class LoginUI(ft.Column):
             self.user.error_text = "El usuario debe tener al menos 3 caracteres"
         else:
             self.user.error_text = None
-        self.page.update()
+        request_update(self.page)
         if self.user.error_text:
             self._alert(self.user.error_text)
             return False
@@ -409,7 +410,7 @@ class LoginUI(ft.Column):
             self.password.error_text = "La contraseña debe tener al menos 6 caracteres"
         else:
             self.password.error_text = None
-        self.page.update()
+        request_update(self.page)
         if self.password.error_text:
             self._alert(self.password.error_text)
             return False
@@ -425,12 +426,12 @@ class LoginUI(ft.Column):
             val = (self.user.value or "").strip()
             if val and len(val) >= 3 and self.user.error_text:
                 self.user.error_text = None
-                self.page.update()
+                request_update(self.page)
         elif which == "password":
             val = self.password.value or ""
             if val and len(val) >= 6 and self.password.error_text:
                 self.password.error_text = None
-                self.page.update()
+                request_update(self.page)
 
     # --------- ALERTAS ----------
     def _alert(self, msg: str):
@@ -439,9 +440,9 @@ class LoginUI(ft.Column):
             bgcolor=self._ERROR_COLOR,
         )
         self.page.snack_bar.open = True
-        self.page.update()
+        request_update(self.page)
 
     def _info(self, msg: str):
         self.page.snack_bar = ft.SnackBar(ft.Text(msg))
         self.page.snack_bar.open = True
-        self.page.update()
+        request_update(self.page)
@@ -1,4 +1,5 @@
 import flet as ft
+from ..utils.update_scheduler import request_update
 
 YELLOW = "#FCE44D"
 INK = "#0F172A"
@@ -116,7 +117,7 @@ class SplashUI(ft.Container):
             # Los timers deben estar en el árbol de controles para funcionar
             self.page.overlay.append(self._timer_breath)
             self.page.overlay.append(self._timer_dots)
-            self.page.update()
+            request_update(self.page)
         except Exception:
             pass
 
@@ -0,0 +1,43 @@
+"""Fixtures compartidas: datos locales aislados y un MockAPI en un hilo."""
+import asyncio
+import os
+import tempfile
+import threading
+
+# Las clases de lógica crean archivos locales (endpoints.json, caché): aislarlos
+os.environ.setdefault("MTG_DATA_DIR", tempfile.mkdtemp(prefix="mtg-tests-"))
+
+import pytest
+
+from tools.mock_api.dataset import DatasetConfig
+from tools.mock_api.server import FaultConfig, MockAPI
+
+
+@pytest.fixture
+def mock_api(request):
+    """MockAPI local en un puerto libre; entrega (api, base_url).
+
+    Las fallas se pasan con indirect parametrize: {"latency": 0.5}.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    api = MockAPI(DatasetConfig(users=5, pruebas=5, preguntas=3), FaultConfig(**getattr(request, "param", {})))
+    host, port = asyncio.run_coroutine_threadsafe(api.start("127.0.0.1", 0), loop).result(5)
+    try:
+        yield api, f"http://{host}:{port}/"
+    finally:
+        asyncio.run_coroutine_threadsafe(_shutdown(api), loop).result(5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        loop.close()
+
+
+async def _shutdown(api: MockAPI) -> None:
+    await api.stop()
+    # conexiones keep-alive que los clientes dejaron abiertas
+    current = asyncio.current_task()
+    pending = [t for t in asyncio.all_tasks() if t is not current]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,49 @@
+"""ResponseCache en RestClient: rutas sin TTL e invalidación por escritura."""
+from src.API.cache import ResponseCache
+from src.API.crud import RestClient
+from src.API.diskcache import DiskCache
+
+
+def test_uncacheable_get_skips_the_cache(mock_api):
+    _, base_url = mock_api
+    client = RestClient(base_url)
+    cache = client.enable_cache(ResponseCache())
+    lookups = []
+    original = cache.lookup
+    cache.lookup = lambda key: lookups.append(key) or original(key)
+
+    ok, _, _, _ = client.get("users", params={"search": "ana"})
+    assert ok
+    assert lookups == []
+    assert cache.stats()["misses"] == 0
+
+    client.get("pruebas")
+    assert len(lookups) == 1 and cache.stats()["misses"] == 1
+
+
+def test_write_invalidates_only_that_collection(tmp_path):
+    base = "http://api.test"
+    cache = ResponseCache(ttls={"*": 60.0}, disk=DiskCache(tmp_path / "cache.sqlite3"))
+    for path in ("pruebas", "pruebas/1", "pruebasX", "pruebas_old/2"):
+        cache.store(cache.key(f"{base}/{path}"), path, 200, b"[]", {})
+    cache.store(cache.key(f"{base}/pruebas", {"page": 1}), "pruebas", 200, b"[]", {})
+
+    assert cache.invalidate_path(f"{base}/pruebas") == 3
+    remaining = {k for k in cache._entries}
+    assert remaining == {f"{base}/pruebasX", f"{base}/pruebas_old/2"}
+
+    # el nivel en disco aplica el mismo límite
+    assert cache.disk.get(f"{base}/pruebasX") is not None
+    assert cache.disk.get(f"{base}/pruebas/1") is None
+    assert cache.disk.get(f"{base}/pruebas?page=1") is None
+
+
+def test_unusable_data_dir_degrades_to_memory(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("MTG_DATA_DIR", str(blocker / "data"))
+
+    disk = DiskCache()
+    assert not disk.available
+    assert disk.get("k") is None
+    assert ResponseCache(disk=disk).disk is disk
@@ -0,0 +1,39 @@
+import asyncio
+
+from src.modules.exams.examLogic import ExamLogic
+from src.utils.countdown import Countdown
+
+
+def test_countdown_ticks_and_times_out():
+    timer = Countdown(1)
+    ticks, timeouts = [], []
+    asyncio.run(asyncio.wait_for(timer.run(lambda: ticks.append(timer.remaining), lambda: timeouts.append(1)), 3))
+    assert ticks == [0]
+    assert timeouts == [1]
+
+
+def test_stop_ends_the_run_without_timeout():
+    timer = Countdown(60)
+    timeouts = []
+
+    async def main():
+        task = asyncio.ensure_future(timer.run(None, lambda: timeouts.append(1)))
+        await asyncio.sleep(0.05)
+        timer.stop()
+        await asyncio.wait_for(task, 1)
+
+    asyncio.run(main())
+    assert timeouts == []
+    assert timer.remaining == 60
+    assert timer.mmss() == "01:00"
+
+
+def test_exam_logic_takes_duration_from_exam_data():
+    logic = ExamLogic("1", exam_data={"id": "1", "duracion_seg": 90, "preguntas": [{"pregunta": "?"}]})
+    assert logic.timer.total == 90
+    assert logic.timer.mmss() == "01:30"
+
+
+def test_exam_without_duration_has_no_time_limit():
+    logic = ExamLogic("1", exam_data={"id": "1", "preguntas": [{"pregunta": "?"}]})
+    assert logic.timer is None
@@ -0,0 +1,81 @@
+"""EndpointResolver: cuándo se olvida un alias y cuál se aprende."""
+import json
+import time
+
+from src.API.crud import RestClient
+from src.API.endpoints import EndpointResolver, EndpointStore
+
+
+def _resolver(base_url, tmp_path):
+    return EndpointResolver(RestClient(base_url), store=EndpointStore(tmp_path / "endpoints.json"))
+
+
+def test_rejected_200_keeps_learned_alias(mock_api, tmp_path):
+    _, base_url = mock_api
+    resolver = _resolver(base_url, tmp_path)
+    resolver.store.set(resolver.api.base_url, "catalog", "exams")
+
+    # Un id que no existe: el detalle da 404 y la lista no lo trae
+    alias, result = resolver.get(
+        "catalog",
+        suffixes=("/9999", ""),
+        accept=lambda r: r[0] and isinstance(r[1], dict),
+    )
+    assert alias is None
+    assert resolver.known("catalog") == "exams"
+
+
+def test_missing_collection_is_forgotten_and_reprobed(mock_api, tmp_path):
+    _, base_url = mock_api
+    resolver = _resolver(base_url, tmp_path)
+    resolver.store.set(resolver.api.base_url, "catalog", "Pruebas")  # el mock no la sirve
+
+    alias, (ok, data, status, _) = resolver.get("catalog", accept=lambda r: r[0] and isinstance(r[1], list))
+    assert ok and alias == "pruebas"
+    assert resolver.known("catalog") == "pruebas"
+
+
+def test_probe_prefers_declared_order_over_speed(tmp_path):
+    api = RestClient("http://order.test")
+
+    def fake_request(method, path, **kw):
+        # "pruebas" (preferido) tarda; "exams" responde al instante
+        if path == "pruebas":
+            time.sleep(0.2)
+        if path in ("pruebas", "exams"):
+            return True, [], 200, None
+        return False, None, 404, "Not found"
+
+    api._request = fake_request
+    resolver = EndpointResolver(api, store=EndpointStore(tmp_path / "endpoints.json"))
+    alias, _ = resolver.get("catalog")
+    assert alias == "pruebas"
+    assert resolver.known("catalog") == "pruebas"
+
+
+def test_store_keeps_only_route_aliases(tmp_path):
+    path = tmp_path / "endpoints.json"
+    path.write_text(json.dumps({
+        "http://api/": {
+            "catalog": {"alias": "exams", "learned_at": time.time()},
+            "preguntas:7": {"alias": "nested", "learned_at": time.time()},
+        },
+    }))
+    store = EndpointStore(path)
+    assert store.get("http://api/", "catalog") == "exams"
+    assert store.get("http://api/", "preguntas:7") is None
+
+    store.set("http://api/", "attempts", "results")
+    assert "preguntas:7" not in json.loads(path.read_text())["http://api/"]
+
+
+def test_store_without_data_dir_works_in_memory(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("MTG_DATA_DIR", str(blocker / "data"))
+
+    store = EndpointStore()
+    store.set("http://api/", "catalog", "exams")
+    assert store.get("http://api/", "catalog") == "exams"
+    store.forget("http://api/", "catalog")
+    assert store.get("http://api/", "catalog") is None
@@ -0,0 +1,38 @@
+"""ImageCache.props: ruta local en escritorio, base64 en modo web."""
+import base64
+
+from src.API.images import BASE64_MAX_BYTES, ImageCache
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+
+def test_props_by_platform(tmp_path):
+    cache = ImageCache(tmp_path)
+    cache._store("http://img/a.png", PNG, "png")
+
+    local = cache.props("http://img/a.png")
+    assert set(local) == {"src"}
+    assert local["src"].startswith(str(tmp_path))
+
+    web = cache.props("http://img/a.png", web=True)
+    assert base64.b64decode(web["src_base64"]) == PNG
+
+    assert cache.props("http://img/missing.png", web=True) is None
+
+
+def test_web_skips_images_too_big_to_inline(tmp_path):
+    cache = ImageCache(tmp_path)
+    cache._store("http://img/big.png", PNG + b"\x00" * BASE64_MAX_BYTES, "png")
+    assert cache.props("http://img/big.png", web=True) is None   # la vista usa la URL remota
+    assert "src" in cache.props("http://img/big.png")
+
+
+def test_unusable_data_dir_falls_back_to_remote(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("MTG_DATA_DIR", str(blocker / "data"))
+
+    cache = ImageCache()
+    assert cache.prefetch(["http://img/a.png"]) == {}
+    assert cache.props("http://img/a.png") is None
+    assert len(cache) == 0
@@ -0,0 +1,59 @@
+import sqlite3
+import time
+
+import pytest
+
+from src.API.outbox import Outbox, OutboxUnavailable
+
+
+class FlakyConnection:
+    """Envuelve la conexión y hace fallar los primeros `times` DELETE."""
+
+    def __init__(self, conn, times=1):
+        self.conn = conn
+        self.times = times
+
+    def execute(self, sql, *args):
+        if sql.startswith("DELETE") and self.times > 0:
+            self.times -= 1
+            raise sqlite3.OperationalError("disk I/O error")
+        return self.conn.execute(sql, *args)
+
+
+def test_db_error_while_recording_keeps_the_worker_alive(mock_api, tmp_path):
+    api, base_url = mock_api
+    outbox = Outbox(base_url, tmp_path / "outbox.sqlite3", concurrency=1)
+    flaky = outbox._conn = FlakyConnection(outbox._conn)
+    try:
+        # El POST llega al servidor pero el DELETE local de la fila falla
+        first = outbox.enqueue("attempts", {"prueba_id": "1", "score": 1})
+        worker = outbox._thread
+        deadline = time.monotonic() + 5
+        while flaky.times and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert flaky.times == 0
+
+        second = outbox.enqueue("attempts", {"prueba_id": "1", "score": 2})
+        assert outbox.flush(timeout=10)
+        # El mismo hilo sigue vivo (start() habría reemplazado uno muerto)
+        assert outbox._thread is worker and worker.is_alive()
+        assert outbox.pending() == 0
+
+        # Ambos llegaron por la ruta resuelta de "attempts", y la fila cuyo DELETE
+        # falló se verificó por client_key en vez de enviarse dos veces
+        keys = [i.get("client_key") for i in api.data["intentos"]]
+        assert keys.count(first) == 1
+        assert keys.count(second) == 1
+    finally:
+        outbox.stop()
+
+
+def test_unusable_data_dir_makes_the_outbox_unavailable(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("MTG_DATA_DIR", str(blocker / "data"))
+
+    outbox = Outbox("http://127.0.0.1:9")
+    assert not outbox.available
+    with pytest.raises(OutboxUnavailable):
+        outbox.enqueue("attempts", {"n": 1})
@@ -0,0 +1,15 @@
+"""PruebaLogic: pistas de forma por prueba (embedded/nested)."""
+from src.modules.pruebas.pruebasLogic import ShapeHints
+
+
+def test_shape_hints_are_bounded_lru():
+    hints = ShapeHints(max_items=2)
+    hints.set("http://api/", 1, "embedded")
+    hints.set("http://api/", 2, "nested")
+    assert hints.get("http://api/", "1") == "embedded"   # 1 pasa a ser el más reciente
+    hints.set("http://api/", 3, "nested")
+
+    assert len(hints) == 2
+    assert hints.get("http://api/", 2) is None
+    assert hints.get("http://api/", 1) == "embedded"
+    assert hints.get("http://other/", 1) is None
@@ -0,0 +1,68 @@
+"""CircuitBreaker: la prueba half-open se libera aunque no termine en éxito o fallo."""
+import asyncio
+
+import pytest
+
+from src.API.crud import AsyncRestClient, RestClient
+from src.API.retry import CircuitBreaker, CircuitOpenError, NO_RETRY
+
+
+def _half_open(breaker: CircuitBreaker) -> None:
+    breaker.failure_threshold = 1
+    breaker.reset_timeout = 0.0
+    breaker.record_failure()
+    assert breaker.state == "half_open"
+
+
+def test_only_one_probe_while_half_open():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.before_request("h") is True
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("h")
+    breaker.release_probe()
+    assert breaker.before_request("h") is True
+
+
+def test_cancelled_async_probe_releases_breaker():
+    client = AsyncRestClient("http://probe-cancel.test", retry=NO_RETRY)
+    _half_open(client.breaker)
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    async def run():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client._send_with_retry("POST", hang), timeout=0.05)
+
+    asyncio.run(run())
+    assert client.breaker.before_request("probe-cancel.test") is True
+
+
+def test_unexpected_error_in_sync_probe_releases_breaker():
+    client = RestClient("http://probe-error.test", retry=NO_RETRY)
+    _half_open(client.breaker)
+
+    def boom():
+        raise ValueError("no es un error de red")
+
+    with pytest.raises(ValueError):
+        client._send_with_retry("GET", boom)
+    assert client.breaker.before_request("probe-error.test") is True
+
+
+@pytest.mark.parametrize("mock_api", [{"latency": 0.5}], indirect=True)
+def test_post_past_deadline_does_not_lock_the_host(mock_api):
+    _, base_url = mock_api
+    client = AsyncRestClient(base_url, retry=NO_RETRY)
+    _half_open(client.breaker)
+
+    async def run():
+        ok, _, _, err = await client.post("users", json={"name": "x"}, deadline=0.05)
+        assert not ok and err == "deadline exceeded"
+        ok, _, status, _ = await client.get("users", deadline=5)
+        assert ok and status == 200
+        assert client.breaker.state == "closed"
+        await client.aclose()
+
+    asyncio.run(run())
@@ -0,0 +1,22 @@
+"""SearchIndex: campos por defecto y sus pesos."""
+from src.utils.search_index import SearchIndex
+
+
+def _index():
+    index = SearchIndex()
+    index.add("es", {"titulo": "Parcial 1", "materia": "Química", "descripcion": "Enlaces"})
+    index.add("en", {"exam_name": "Midterm", "subject": "Biology", "description": "Cell structure"})
+    index.add("mix", {"titulo": "Química orgánica", "description": "Biology review"})
+    return index
+
+
+def test_search_on_materia():
+    # título (3.0) antes que materia (2.0)
+    assert _index().search("quimica") == ["mix", "es"]
+
+
+def test_search_on_description():
+    index = _index()
+    assert index.search("cell") == ["en"]
+    # subject (2.0) antes que description (1.0)
+    assert index.search("biology") == ["en", "mix"]
@@ -0,0 +1,80 @@
+"""AsyncSingleFlight: la petición compartida vive mientras alguien la espere."""
+import asyncio
+
+import pytest
+
+from src.API.crud import AsyncRestClient
+from src.API.retry import NO_RETRY
+from src.API.singleflight import AsyncSingleFlight
+
+
+def test_shared_call_survives_one_waiter_and_dies_with_the_last():
+    async def run():
+        flight = AsyncSingleFlight()
+        started, cancelled = asyncio.Event(), asyncio.Event()
+
+        async def fetch():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        first = asyncio.ensure_future(flight.do("k", fetch))
+        second = asyncio.ensure_future(flight.do("k", fetch))
+        await started.wait()
+        assert flight.coalesced == 1
+
+        first.cancel()
+        await asyncio.sleep(0.01)
+        assert not cancelled.is_set()       # second todavía la espera
+        assert flight.in_flight() == 1
+
+        second.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert flight.in_flight() == 0
+        for task in (first, second):
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("mock_api", [{"latency": 1.0}], indirect=True)
+def test_deadline_aborts_the_shared_get(mock_api):
+    _, base_url = mock_api
+
+    async def run():
+        client = AsyncRestClient(base_url, retry=NO_RETRY)
+        try:
+            ok, _data, status, err = await client.get("pruebas", deadline=0.05)
+            assert (ok, status, err) == (False, 0, "deadline exceeded")
+            await asyncio.sleep(0)
+            assert client._flight.in_flight() == 0
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_client_of_a_previous_loop_is_closed(mock_api):
+    _, base_url = mock_api
+    client = AsyncRestClient(base_url, retry=NO_RETRY)
+
+    async def fetch():
+        ok, *_ = await client.get("pruebas")
+        assert ok
+        return client._client
+
+    first = asyncio.run(fetch())        # loop ya cerrado cuando llega el segundo
+
+    async def again():
+        second = await fetch()
+        await asyncio.sleep(0.05)
+        await client.aclose()
+        return second
+
+    second = asyncio.run(again())
+    assert second is not first
+    assert first.is_closed
@@ -0,0 +1,72 @@
+"""UpdateScheduler: coalescing por frame y flush_now()."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.utils.update_scheduler import UpdateScheduler
+
+
+class FakePage:
+    def __init__(self, loop=None):
+        self.loop = loop
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+
+
+def _settle(loop):
+    """Espera a que el loop procese lo encolado hasta ahora."""
+    asyncio.run_coroutine_threadsafe(asyncio.sleep(0), loop).result(5)
+
+
+def test_requests_in_a_frame_coalesce(loop):
+    page = FakePage(loop)
+    sched = UpdateScheduler(page, frame=0.02)
+    for _ in range(5):
+        sched.request()
+    time.sleep(0.1)
+    assert page.updates == 1
+    assert sched.stats()["suppressed"] == 4
+
+
+@pytest.mark.parametrize("with_loop", [True, False])
+def test_flush_now_is_synchronous_and_cancels_the_frame(loop, with_loop):
+    page = FakePage(loop if with_loop else None)
+    sched = UpdateScheduler(page, frame=0.05)
+    sched.request()
+    if with_loop:
+        _settle(loop)   # el timer del frame ya quedó armado
+    assert sched._timer is not None
+
+    sched.flush_now()
+    assert page.updates == 1            # enviado antes de volver
+    assert sched._timer is None
+    assert not sched.stats()["pending"]
+
+    time.sleep(0.15)                    # el frame vencido no vuelve a enviar
+    assert page.updates == 1
+    assert sched.stats()["flushes"] == 1
+
+
+def test_flush_now_before_the_timer_is_armed(loop):
+    page = FakePage(loop)
+    sched = UpdateScheduler(page, frame=0.02)
+    sched.request()
+    sched.flush_now()                   # _arm aún está en la cola del loop
+    time.sleep(0.1)
+    assert page.updates == 1
+    assert sched._timer is None
@@ -0,0 +1,57 @@
+# tools/bench/__main__.py
+"""Micro-benchmarks con líneas base en JSON.
+
+Desde apps/ui:
+
+    python -m tools.bench run --save tools/bench/baseline.json     # guardar línea base
+    python -m tools.bench run --save /tmp/actual.json              # después de un cambio
+    python -m tools.bench compare tools/bench/baseline.json /tmp/actual.json --threshold 10
+    python -m tools.bench run --compare tools/bench/baseline.json  # medir y comparar de una vez
+
+compare termina con código 1 si algún benchmark empeoró más que el umbral (%).
+"""
+from __future__ import annotations
+import argparse
+import sys
+
+from . import suite  # noqa: F401  (registra los benchmarks)
+from .runner import compare, load, run, save
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(prog="python -m tools.bench", description="Micro-benchmarks de la capa de lógica")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    r = sub.add_parser("run", help="ejecutar los benchmarks")
+    r.add_argument("-k", "--filter", help="solo benchmarks cuyo nombre contenga este texto")
+    r.add_argument("--scale", type=float, default=1.0, help="multiplica las iteraciones (0.1 = rápido)")
+    r.add_argument("--save", metavar="ARCHIVO", help="guardar resultados en JSON")
+    r.add_argument("--compare", metavar="BASE", help="comparar contra una línea base al terminar")
+    r.add_argument("--threshold", type=float, default=10.0, help="umbral de regresión en %% (def. 10)")
+
+    c = sub.add_parser("compare", help="comparar dos resultados guardados")
+    c.add_argument("baseline")
+    c.add_argument("current")
+    c.add_argument("--threshold", type=float, default=10.0, help="umbral de regresión en %% (def. 10)")
+
+    args = p.parse_args(argv)
+    if args.cmd == "run":
+        results = run(args.filter, args.scale)
+        if args.save:
+            save(args.save, results)
+        if not args.compare:
+            return 0
+        baseline = load(args.compare)
+    else:
+        baseline, results = load(args.baseline), load(args.current)
+
+    print()
+    regressions = compare(baseline, results, args.threshold / 100.0)
+    if regressions:
+        print(f"\n{len(regressions)} regresión(es) sobre {args.threshold:g}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+# tools/bench/runner.py
+"""Runner mínimo de micro-benchmarks (estilo pytest-benchmark, sin dependencias).
+
+Cada benchmark registrado con @bench prepara sus datos y devuelve la función a
+medir. Se ejecuta `number` veces por ronda y `rounds` rondas; se reporta el
+tiempo por llamada (mínimo, mediana, media, desviación). La comparación con
+una línea base usa el mínimo de las rondas, la medida menos sensible al ruido
+de otros procesos.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    number: int
+    rounds: int
+    group: str
+
+
+REGISTRY: Dict[str, Benchmark] = {}
+
+
+def bench(name: str, *, number: int = 1000, rounds: int = 7, group: str = "logic"):
+    """Registra un benchmark: la función decorada devuelve el callable a medir."""
+
+    def deco(setup: Callable[[], Callable[[], Any]]):
+        REGISTRY[name] = Benchmark(name, setup, number, rounds, group)
+        return setup
+
+    return deco
+
+
+def measure(b: Benchmark, scale: float = 1.0) -> Dict[str, Any]:
+    fn = b.setup()
+    number = max(1, int(b.number * scale))
+    fn()  # calentamiento: cachés, imports perezosos, conexiones
+    per_call: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(b.rounds):
+            t0 = time.perf_counter()
+            for _ in range(number):
+                fn()
+            per_call.append((time.perf_counter() - t0) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {
+        "group": b.group,
+        "number": number,
+        "rounds": b.rounds,
+        "min": min(per_call),
+        "median": statistics.median(per_call),
+        "mean": statistics.fmean(per_call),
+        "stdev": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+    }
+
+
+def run(filter_: Optional[str] = None, scale: float = 1.0, log: Callable[[str], None] = print) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name, b in REGISTRY.items():
+        if filter_ and filter_ not in name:
+            continue
+        results[name] = res = measure(b, scale)
+        log(f"{name:<40} {fmt_time(res['median']):>10}/op  (min {fmt_time(res['min'])}, ±{fmt_time(res['stdev'])})")
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "benchmarks": results,
+    }
+
+
+def fmt_time(seconds: float) -> str:
+    for unit, factor in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """Devuelve los nombres cuyo mínimo empeoró más de threshold (fracción, 0.10 = 10 %)."""
+    base = baseline.get("benchmarks", {})
+    cur = current.get("benchmarks", {})
+    regressions: List[str] = []
+    print(f"{'benchmark':<40} {'base':>10} {'actual':>10} {'cambio':>8}")
+    for name in sorted(set(base) | set(cur)):
+        if name not in base or name not in cur:
+            print(f"{name:<40} {'—' if name not in base else fmt_time(base[name]['min']):>10} "
+                  f"{'—' if name not in cur else fmt_time(cur[name]['min']):>10}")
+            continue
+        b, c = base[name]["min"], cur[name]["min"]
+        change = (c - b) / b if b else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESIÓN"
+        elif change < -threshold:
+            flag = "  mejora"
+        print(f"{name:<40} {fmt_time(b):>10} {fmt_time(c):>10} {change * 100:>+7.1f}%{flag}")
+    return regressions
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def save(path: str, data: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2)
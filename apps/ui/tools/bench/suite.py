@@ -0,0 +1,197 @@
+# tools/bench/suite.py
+"""Benchmarks de la capa de lógica y de RestClient.
+
+Los benchmarks de red usan el MockAPI local (tools/mock_api) levantado en un
+hilo del mismo proceso, sin latencia inyectada: se mide el costo del cliente.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import os
+import tempfile
+import threading
+
+from .runner import bench
+
+# Las clases de lógica crean archivos locales (endpoints.json, caché): aislarlos
+os.environ.setdefault("MTG_DATA_DIR", tempfile.mkdtemp(prefix="mtg-bench-"))
+
+
+def _question(n: int, opciones: List[Any]) -> Dict[str, Any]:
+    return {
+        "enunciado": f"¿Cuánto es {n} + {n}?",
+        "secuencia": str(n),
+        "opciones": opciones,
+        "correcta": 1,
+    }
+
+
+def _prueba_logic(opciones: List[Any], n_questions: int = 20):
+    from src.modules.pruebas.pruebasLogic import PruebaLogic
+
+    logic = PruebaLogic(1)
+    logic.data = {
+        "titulo": "Prueba de Matemáticas",
+        "preguntas": [_question(i, list(opciones)) for i in range(n_questions)],
+    }
+    logic._compilar(logic.data)
+    return logic
+
+
+# -------- PruebaLogic ----------
+JSON_OPTIONS = ['{"text": "Opción %d", "image": null}' % i for i in range(4)]
+REPR_OPTIONS = ["{'text': 'Opción %d', 'image': None}" % i for i in range(4)]
+DICT_OPTIONS = [{"text": f"Opción {i}", "image": None} for i in range(4)]
+
+
+@bench("prueba.coerce_to_dict[json]", number=5000)
+def coerce_json() -> Callable[[], Any]:
+    logic = _prueba_logic(JSON_OPTIONS, 1)
+    coerce = logic._coerce_to_dict
+    return lambda: [coerce(o) for o in JSON_OPTIONS]
+
+
+@bench("prueba.coerce_to_dict[repr]", number=2000)
+def coerce_repr() -> Callable[[], Any]:
+    logic = _prueba_logic(REPR_OPTIONS, 1)
+    coerce = logic._coerce_to_dict
+    return lambda: [coerce(o) for o in REPR_OPTIONS]
+
+
+@bench("prueba.coerce_to_dict[dict]", number=20000)
+def coerce_dict() -> Callable[[], Any]:
+    logic = _prueba_logic(DICT_OPTIONS, 1)
+    coerce = logic._coerce_to_dict
+    return lambda: [coerce(o) for o in DICT_OPTIONS]
+
+
+@bench("prueba.compilar[20 preguntas, repr]", number=200)
+def prueba_compilar() -> Callable[[], Any]:
+    logic = _prueba_logic(REPR_OPTIONS)
+    return lambda: logic._compilar(logic.data)
+
+
+@bench("prueba.view[repr options]", number=2000)
+def prueba_view() -> Callable[[], Any]:
+    logic = _prueba_logic(REPR_OPTIONS)
+    return logic.view
+
+
+@bench("prueba.view[dict options]", number=10000)
+def prueba_view_dict() -> Callable[[], Any]:
+    logic = _prueba_logic(DICT_OPTIONS)
+    return logic.view
+
+
+# -------- ExamLogic ----------
+def _exam_logic(n_questions: int = 50):
+    from src.modules.exams.examLogic import ExamLogic
+
+    questions = [
+        {"text": f"Pregunta {i}", "options": {"a": "1", "b": "2", "c": "3", "d": "4"}, "correct": "b"}
+        for i in range(n_questions)
+    ]
+    return ExamLogic("1", {"id": "1", "total_points": 100, "questions": questions})
+
+
+@bench("exam.validate_and_show_result", number=20000)
+def exam_validate() -> Callable[[], Any]:
+    logic = _exam_logic()
+
+    def run() -> bool:
+        logic.show_result = False
+        logic.selected_answer = "b"
+        logic.total_correct = 0
+        return logic.validate_and_show_result()
+
+    return run
+
+
+@bench("exam.get_final_score", number=20000)
+def exam_final_score() -> Callable[[], Any]:
+    logic = _exam_logic()
+    for i in range(len(logic.questions)):
+        logic.user_answers[i] = {"answer": "b", "correct": i % 3 != 0}
+    logic.total_correct = sum(1 for a in logic.user_answers.values() if a["correct"])
+    return logic.get_final_score
+
+
+# -------- DashboardLogic ----------
+@bench("dashboard.normalize_item[50k]", number=1, rounds=5)
+def dashboard_normalize() -> Callable[[], Any]:
+    from src.modules.dashboard.dashboardLogic import DashboardLogic
+
+    logic = DashboardLogic(None)
+    items = [
+        {"id": str(i), "exam_name": f"Prueba {i}", "description": "Descripción " * 4, "questions": []}
+        if i % 2
+        else {"id": str(i), "titulo": f"Prueba {i}", "descripcion": "Descripción " * 4}
+        for i in range(50_000)
+    ]
+    normalize = logic._normalize_item
+    return lambda: [normalize(d) for d in items]
+
+
+# -------- RestClient contra el mock local ----------
+_mock_url: Optional[str] = None
+_mock_lock = threading.Lock()
+
+
+def local_mock_url() -> str:
+    """Levanta (una vez) el MockAPI local en un hilo y devuelve su base URL."""
+    global _mock_url
+    with _mock_lock:
+        if _mock_url is not None:
+            return _mock_url
+        from tools.mock_api.server import MockAPI
+
+        ready = threading.Event()
+        box: Dict[str, Any] = {}
+
+        def serve() -> None:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            api = MockAPI()
+            box["addr"] = loop.run_until_complete(api.start("127.0.0.1", 0))
+            ready.set()
+            loop.run_forever()
+
+        threading.Thread(target=serve, name="bench-mock-api", daemon=True).start()
+        ready.wait(10)
+        host, port = box["addr"]
+        _mock_url = f"http://{host}:{port}"
+        return _mock_url
+
+
+@bench("restclient.request[GET users/1]", number=300, group="http")
+def request_small() -> Callable[[], Any]:
+    from src.API.crud import RestClient
+
+    api = RestClient(local_mock_url())
+    return lambda: api._request("GET", "users/1")
+
+
+@bench("restclient.request[GET pruebas]", number=50, group="http")
+def request_catalog() -> Callable[[], Any]:
+    from src.API.crud import RestClient
+
+    api = RestClient(local_mock_url())
+    return lambda: api._request("GET", "pruebas")
+
+
+@bench("restclient.request[GET pruebas, cached]", number=2000, group="http")
+def request_cached() -> Callable[[], Any]:
+    from src.API.cache import ResponseCache
+    from src.API.crud import RestClient
+
+    api = RestClient(local_mock_url(), cache=ResponseCache())
+    return lambda: api._request("GET", "pruebas")
+
+
+@bench("restclient.request[POST intentos]", number=300, group="http")
+def request_post() -> Callable[[], Any]:
+    from src.API.crud import RestClient
+
+    api = RestClient(local_mock_url())
+    payload = {"prueba_id": 1, "correctas": 10, "respuestas": [{"pregunta_idx": i} for i in range(20)]}
+    return lambda: api._request("POST", "intentos", json=payload)
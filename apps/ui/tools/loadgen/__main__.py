@@ -0,0 +1,59 @@
+# tools/loadgen/__main__.py
+"""Generador de carga: N estudiantes simulados contra la API (idealmente el mock local).
+
+Desde apps/ui:
+
+    python -m tools.mock_api --port 8800 --latency 0.05 --jitter 0.05 &
+    python -m tools.loadgen --base-url http://127.0.0.1:8800/ --students 500 \\
+        --processes 4 --ramp 10 --think lognormal:2,0.6 --think-scale 0.1
+"""
+from __future__ import annotations
+import argparse
+import json
+
+from .runner import LoadConfig, format_report, run
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(prog="python -m tools.loadgen", description="Carga de estudiantes simultáneos")
+    p.add_argument("--base-url", default="http://127.0.0.1:8800/")
+    p.add_argument("--students", type=int, default=LoadConfig.students)
+    p.add_argument("--processes", type=int, default=LoadConfig.processes)
+    p.add_argument("--ramp", type=float, default=LoadConfig.ramp, help="segundos para repartir los inicios")
+    p.add_argument("--flow", choices=("prueba", "exam", "mixed"), default=LoadConfig.flow)
+    p.add_argument(
+        "--think",
+        default=LoadConfig.think,
+        help="const:s | uniform:a,b | exp:media | lognormal:mediana,sigma (segundos)",
+    )
+    p.add_argument("--think-scale", type=float, default=LoadConfig.think_scale, help="0 = sin pausas")
+    p.add_argument("--users", type=int, default=LoadConfig.users, help="usuarios estudianteN existentes")
+    p.add_argument("--cold", action="store_true", help="vaciar la caché antes de cada catálogo")
+    p.add_argument("--seed", type=int, default=LoadConfig.seed)
+    p.add_argument("--json", metavar="ARCHIVO", help="guardar el reporte completo en JSON")
+    return p.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    cfg = LoadConfig(
+        base_url=args.base_url,
+        students=args.students,
+        processes=max(1, args.processes),
+        ramp=args.ramp,
+        flow=args.flow,
+        think=args.think,
+        think_scale=args.think_scale,
+        users=args.users,
+        cold=args.cold,
+        seed=args.seed,
+    )
+    report = run(cfg)
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
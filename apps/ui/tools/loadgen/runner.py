@@ -0,0 +1,280 @@
+# tools/loadgen/runner.py
+"""Simulación de estudiantes sin UI sobre las clases de lógica reales.
+
+Cada estudiante recorre:
+    login       GET users?search=<usuario> (misma consulta que LoginLogic)
+    catalogo    DashboardLogic.cargaPruebas()
+    cargar      PruebaLogic.cargar()                 (flujo "prueba")
+    responder   view() + seleccionar() + validar_actual() + siguiente(), por pregunta
+    finalizar   PruebaLogic.finalizar()                (encola el intento en el outbox)
+o, en el flujo "exam", ExamLogic.load_exam / validate_and_show_result /
+get_final_score. Entre pasos hay un tiempo de "pensar" aleatorio.
+
+Los estudiantes de un proceso corren en hilos y comparten el RestClient del
+proceso (como las vistas de una misma app); repartirlos en varios procesos da
+varios pools de conexiones independientes.
+"""
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import os
+import random
+import tempfile
+import time
+
+# (paso, segundos, ok, error)
+Sample = Tuple[str, float, bool, Optional[str]]
+
+
+@dataclass
+class LoadConfig:
+    base_url: str
+    students: int = 50
+    processes: int = 1
+    ramp: float = 0.0            # segundos en los que se reparten los inicios
+    flow: str = "prueba"         # prueba | exam | mixed
+    think: str = "lognormal:1.0,0.6"
+    think_scale: float = 1.0     # multiplica los tiempos de pensar (0 = sin pausas)
+    users: int = 200             # usuarios estudianteN que existen en la API
+    cold: bool = False           # vaciar la caché antes del catálogo (dispositivos fríos)
+    seed: int = 1
+
+
+def think_sampler(spec: str, rng: random.Random) -> Callable[[], float]:
+    """'const:1', 'uniform:a,b', 'exp:media', 'lognormal:mediana,sigma' → función que da segundos."""
+    kind, _, raw = spec.partition(":")
+    args = [float(x) for x in raw.split(",") if x.strip()]
+    if kind == "const":
+        return lambda: args[0] if args else 0.0
+    if kind == "uniform":
+        return lambda: rng.uniform(args[0], args[1])
+    if kind == "exp":
+        return lambda: rng.expovariate(1.0 / args[0]) if args[0] > 0 else 0.0
+    if kind == "lognormal":
+        import math
+        mu = math.log(args[0]) if args and args[0] > 0 else 0.0
+        sigma = args[1] if len(args) > 1 else 0.5
+        return lambda: rng.lognormvariate(mu, sigma)
+    raise ValueError(f"distribución de think-time desconocida: {spec!r}")
+
+
+class Student:
+    def __init__(self, n: int, cfg: LoadConfig, flow: str, out: List[Sample]) -> None:
+        self.n = n
+        self.cfg = cfg
+        self.flow = flow
+        self.out = out
+        self.rng = random.Random(cfg.seed * 100_003 + n)
+        self._think = think_sampler(cfg.think, self.rng)
+        self.username = f"estudiante{(n % max(1, cfg.users)) + 1}"
+
+    def think(self) -> None:
+        if self.cfg.think_scale > 0:
+            time.sleep(self._think() * self.cfg.think_scale)
+
+    def step(self, name: str, fn: Callable[[], Any], check: Callable[[Any], bool] = bool) -> Any:
+        t0 = time.perf_counter()
+        try:
+            result = fn()
+            ok, err = check(result), None
+        except Exception as ex:  # un estudiante que falla no tumba la corrida
+            result, ok, err = None, False, f"{type(ex).__name__}: {ex}"
+        self.out.append((name, time.perf_counter() - t0, ok, None if ok else (err or "fallo")))
+        return result if ok else None
+
+    def run(self) -> None:
+        from src.API.cache import persistent_cache
+        from src.API.crud import get_client
+        from src.modules.dashboard.dashboardLogic import DashboardLogic
+        from src.utils.config import api_base_url
+
+        api = get_client(api_base_url())
+        users = self.step(
+            "login",
+            lambda: api.get("users", params={"search": self.username, "page": 1, "limit": 50}),
+            lambda r: r[0] and any(u.get("username") == self.username for u in (r[1] or [])),
+        )
+        if users is None:
+            return
+        user = next(u for u in users[1] if u.get("username") == self.username)
+        self.think()
+
+        dash = DashboardLogic(None, user)
+        if self.cfg.cold:
+            persistent_cache().invalidate()
+        pruebas = self.step("catalogo", dash.cargaPruebas)
+        if not pruebas:
+            return
+        elegida = self.rng.choice(pruebas)
+        self.think()
+
+        if self.flow == "exam":
+            self._run_exam(elegida)
+        else:
+            self._run_prueba(elegida)
+
+    def _run_prueba(self, elegida: Dict[str, Any]) -> None:
+        from src.modules.pruebas.pruebasLogic import PruebaLogic
+
+        logic = PruebaLogic(elegida["id"])
+        if self.step("cargar", logic.cargar) is None:
+            return
+        for _ in range(len(logic.questions)):
+            self.think()
+
+            def answer() -> bool:
+                vm = logic.view()
+                if vm.opciones:
+                    logic.seleccionar(self.rng.choice(vm.opciones).text)
+                validated = logic.validar_actual()
+                logic.siguiente()
+                return validated
+
+            self.step("responder", answer)
+        self.step("finalizar", logic.finalizar, lambda r: "error" not in r)
+
+    def _run_exam(self, elegida: Dict[str, Any]) -> None:
+        from src.modules.exams.examLogic import ExamLogic
+
+        logic = ExamLogic(str(elegida["id"]))
+        if self.step("cargar", logic.load_exam) is None:
+            return
+        for _ in range(len(logic.questions)):
+            self.think()
+
+            def answer() -> bool:
+                q = logic.get_current_question() or {}
+                keys = list((q.get("options") or {}).keys())
+                if keys:
+                    logic.select_answer(self.rng.choice(keys))
+                validated = logic.validate_and_show_result()
+                logic.continue_after_result()
+                return validated
+
+            self.step("responder", answer)
+        self.step("finalizar", logic.get_final_score, lambda r: "score_percent" in r)
+
+
+def run_worker(cfg_dict: Dict[str, Any], student_ids: List[int]) -> Dict[str, Any]:
+    """Punto de entrada de cada proceso: corre sus estudiantes en hilos."""
+    cfg = LoadConfig(**cfg_dict)
+    # La URL se lee al importar los módulos de lógica: fijarla antes
+    os.environ["MTG_API_URL"] = cfg.base_url
+    os.environ.setdefault("MTG_DATA_DIR", tempfile.mkdtemp(prefix="mtg-loadgen-"))
+
+    from src.API.crud import PoolConfig, configure_pool
+
+    # Un socket por estudiante simultáneo del proceso, sin bloquear en el pool
+    configure_pool(PoolConfig(pool_connections=4, pool_maxsize=max(4, len(student_ids))))
+
+    samples: List[Sample] = []
+    rng = random.Random(cfg.seed)
+    start = time.perf_counter()
+
+    def one(n: int) -> None:
+        if cfg.ramp > 0:
+            time.sleep(rng.uniform(0.0, cfg.ramp))
+        flow = cfg.flow if cfg.flow != "mixed" else ("exam" if n % 2 else "prueba")
+        local: List[Sample] = []
+        Student(n, cfg, flow, local).run()
+        samples.extend(local)  # list.extend es atómico con el GIL
+
+    with ThreadPoolExecutor(max_workers=max(1, len(student_ids)), thread_name_prefix="student") as pool:
+        list(pool.map(one, student_ids))
+
+    # Los intentos se envían en segundo plano: esperar a que el outbox se vacíe
+    # para que sus POST entren en la medición y el proceso no termine antes
+    from src.API.metrics import METRICS
+    from src.API.outbox import get_outbox
+
+    t0 = time.perf_counter()
+    drained = get_outbox().flush(timeout=120.0)
+    samples.append(("outbox", time.perf_counter() - t0, drained, None if drained else "quedaron intentos sin enviar"))
+
+    return {
+        "samples": samples,
+        "elapsed": time.perf_counter() - start,
+        "http": METRICS.snapshot(),
+    }
+
+
+def run(cfg: LoadConfig) -> Dict[str, Any]:
+    """Reparte los estudiantes entre procesos y agrega los resultados."""
+    ids = list(range(cfg.students))
+    chunks = [ids[i::cfg.processes] for i in range(cfg.processes)] if cfg.processes > 1 else [ids]
+    chunks = [c for c in chunks if c]
+    start = time.perf_counter()
+    if len(chunks) == 1:
+        results = [run_worker(asdict(cfg), chunks[0])]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            results = list(pool.map(run_worker, [asdict(cfg)] * len(chunks), chunks))
+    wall = time.perf_counter() - start
+    return summarize(cfg, results, wall)
+
+
+def summarize(cfg: LoadConfig, results: List[Dict[str, Any]], wall: float) -> Dict[str, Any]:
+    from src.API.metrics import LatencyHistogram
+
+    steps: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, Dict[str, int]] = {}
+    for res in results:
+        for name, secs, ok, err in res["samples"]:
+            s = steps.setdefault(name, {"hist": LatencyHistogram(), "errors": 0})
+            s["hist"].record(secs)
+            if not ok:
+                s["errors"] += 1
+                errs = errors.setdefault(name, {})
+                errs[err] = errs.get(err, 0) + 1
+
+    finished = sum(1 for res in results for s in res["samples"] if s[0] == "finalizar" and s[2])
+    http_requests = sum(
+        ep["total"]["count"] for res in results for ep in res["http"].values()
+    )
+    http_errors = sum(ep["errors"] for res in results for ep in res["http"].values())
+    report = {
+        "config": asdict(cfg),
+        "wall_s": wall,
+        "students_finished": finished,
+        "students_per_s": finished / wall if wall else 0.0,
+        "http_requests": http_requests,
+        "http_requests_per_s": http_requests / wall if wall else 0.0,
+        "http_network_errors": http_errors,
+        "steps": {},
+        "errors": errors,
+    }
+    for name, s in steps.items():
+        hist = s["hist"]
+        summary = hist.summary()
+        summary["errors"] = s["errors"]
+        summary["error_rate"] = s["errors"] / hist.count if hist.count else 0.0
+        report["steps"][name] = summary
+    return report
+
+
+STEP_ORDER = ("login", "catalogo", "cargar", "responder", "finalizar", "outbox")
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [
+        f"estudiantes terminados: {report['students_finished']}/{report['config']['students']}"
+        f"  en {report['wall_s']:.1f}s  ({report['students_per_s']:.2f}/s)",
+        f"peticiones HTTP: {report['http_requests']}  ({report['http_requests_per_s']:.1f}/s)"
+        f"  errores de red: {report['http_network_errors']}",
+        "",
+        f"{'paso':<10} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9} {'error %':>8}",
+    ]
+    names = [n for n in STEP_ORDER if n in report["steps"]] + sorted(set(report["steps"]) - set(STEP_ORDER))
+    for name in names:
+        s = report["steps"][name]
+        lines.append(
+            f"{name:<10} {s['count']:>6} {s['p50'] * 1e3:>9.1f} {s['p95'] * 1e3:>9.1f}"
+            f" {s['p99'] * 1e3:>9.1f} {s['max'] * 1e3:>9.1f} {s['error_rate'] * 100:>7.1f}%"
+        )
+    for name, errs in report["errors"].items():
+        for err, n in sorted(errs.items(), key=lambda t: -t[1])[:3]:
+            lines.append(f"  {name}: {n}× {err}")
+    return "\n".join(lines)
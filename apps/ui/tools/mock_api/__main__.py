@@ -0,0 +1,72 @@
+# tools/mock_api/__main__.py
+"""Levanta el MockAPI local.
+
+Desde apps/ui:
+
+    python -m tools.mock_api --port 8800 --pruebas 50 --latency 0.08 --jitter 0.05
+    MTG_API_URL=http://127.0.0.1:8800/ flet run        # la app apunta al mock
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+
+from .dataset import DatasetConfig
+from .server import FaultConfig, MockAPI
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(prog="python -m tools.mock_api", description="MockAPI local para pruebas de carga")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8800)
+    g = p.add_argument_group("datos")
+    g.add_argument("--users", type=int, default=DatasetConfig.users)
+    g.add_argument("--pruebas", type=int, default=DatasetConfig.pruebas)
+    g.add_argument("--preguntas", type=int, default=DatasetConfig.preguntas, help="preguntas por prueba")
+    g.add_argument("--options", type=int, default=DatasetConfig.options, help="opciones por pregunta")
+    g.add_argument("--intentos", type=int, default=DatasetConfig.intentos)
+    g.add_argument("--results", type=int, default=DatasetConfig.results)
+    g.add_argument("--image-every", type=int, default=DatasetConfig.image_every)
+    g.add_argument("--seed", type=int, default=DatasetConfig.seed)
+    f = p.add_argument_group("fallas")
+    f.add_argument("--latency", type=float, default=0.0, help="segundos por respuesta")
+    f.add_argument("--jitter", type=float, default=0.0, help="+ uniforme en [0, jitter] segundos")
+    f.add_argument("--error-rate", type=float, default=0.0, help="probabilidad de 500/503")
+    f.add_argument("--throttle-rate", type=float, default=0.0, help="probabilidad de 429")
+    f.add_argument("--rate-limit", type=float, default=0.0, help="peticiones/s globales antes de 429")
+    f.add_argument("--retry-after", type=float, default=1.0)
+    f.add_argument("--empty-404", action="store_true", help='filtros sin resultados → 404 "Not found"')
+    return p.parse_args(argv)
+
+
+async def main(argv=None) -> None:
+    args = parse_args(argv)
+    dataset = DatasetConfig(
+        users=args.users,
+        pruebas=args.pruebas,
+        preguntas=args.preguntas,
+        options=args.options,
+        intentos=args.intentos,
+        results=args.results,
+        image_every=args.image_every,
+        seed=args.seed,
+    )
+    faults = FaultConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after,
+        empty_404=args.empty_404,
+    )
+    api = MockAPI(dataset, faults)
+    host, port = await api.start(args.host, args.port)
+    print(f"MockAPI local en http://{host}:{port}/  (export MTG_API_URL=http://{host}:{port}/)")
+    await api.serve_forever()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
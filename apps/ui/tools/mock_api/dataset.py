@@ -0,0 +1,130 @@
+# tools/mock_api/dataset.py
+"""Datos sintéticos con la misma forma que la colección real de MockAPI."""
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+import random
+
+SUBJECTS = ["Matemáticas", "Lenguaje", "Ciencias", "Historia", "Inglés", "Física", "Química"]
+WORDS = [
+    "álgebra", "fracción", "célula", "energía", "revolución", "verbo", "ecuación", "átomo",
+    "geometría", "clima", "lectura", "función", "mapa", "volcán", "número", "sílaba",
+]
+
+
+@dataclass
+class DatasetConfig:
+    users: int = 200
+    pruebas: int = 30
+    preguntas: int = 20        # por prueba
+    options: int = 4           # por pregunta
+    intentos: int = 0
+    results: int = 0
+    image_every: int = 0       # cada N opciones, una con imagen (0 = ninguna)
+    seed: int = 42
+
+
+def _created_at(rng: random.Random) -> str:
+    when = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=rng.randint(0, 300 * 86400))
+    return when.isoformat().replace("+00:00", ".000Z")
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize()
+
+
+def build(cfg: DatasetConfig) -> Dict[str, List[Dict[str, Any]]]:
+    """Devuelve {coleccion: [items]} con ids en texto, como MockAPI."""
+    rng = random.Random(cfg.seed)
+    letters = "abcdefghij"[: max(2, min(cfg.options, 10))]
+    option_count = 0
+
+    users = [
+        {
+            "id": str(i),
+            "createdAt": _created_at(rng),
+            "username": f"estudiante{i}",
+            "nombre": f"Estudiante {i}",
+            "email": f"estudiante{i}@escuela.edu",
+            "password_hash": f"clave{i}",
+            "rol": "estudiante",
+        }
+        for i in range(1, cfg.users + 1)
+    ]
+
+    pruebas: List[Dict[str, Any]] = []
+    preguntas: List[Dict[str, Any]] = []
+    for pid in range(1, cfg.pruebas + 1):
+        subject = rng.choice(SUBJECTS)
+        questions = []  # formato de ExamView (questions/options/correct)
+        for q in range(1, cfg.preguntas + 1):
+            opciones = []
+            for _ in letters:
+                option_count += 1
+                opt = {"text": _sentence(rng, 3), "image": None}
+                if cfg.image_every and option_count % cfg.image_every == 0:
+                    opt["image"] = f"https://picsum.photos/seed/{option_count}/120/120"
+                opciones.append(opt)
+            correcta = rng.randrange(len(opciones))
+            enunciado = f"{_sentence(rng, 8)}?"
+            preguntas.append(
+                {
+                    "id": str(len(preguntas) + 1),
+                    "pruebaId": str(pid),
+                    "enunciado": enunciado,
+                    "secuencia": f"{q}",
+                    "opciones": opciones,
+                    "correcta": correcta,
+                }
+            )
+            questions.append(
+                {
+                    "text": enunciado,
+                    "options": {k: o["text"] for k, o in zip(letters, opciones)},
+                    "correct": letters[correcta],
+                }
+            )
+        pruebas.append(
+            {
+                "id": str(pid),
+                "createdAt": _created_at(rng),
+                "titulo": f"Prueba de {subject} #{pid}",
+                "exam_name": f"Prueba de {subject} #{pid}",
+                "subject": subject,
+                "descripcion": _sentence(rng, 12),
+                "duracion_seg": 60 * rng.choice([10, 15, 20, 30]),
+                "total_points": 100,
+                "questions": questions,
+            }
+        )
+
+    def attempts(n: int) -> List[Dict[str, Any]]:
+        out = []
+        for i in range(1, n + 1):
+            total = cfg.preguntas
+            correctas = rng.randint(0, total)
+            out.append(
+                {
+                    "id": str(i),
+                    "createdAt": _created_at(rng),
+                    "prueba_id": str(rng.randint(1, max(1, cfg.pruebas))),
+                    "user_id": str(rng.randint(1, max(1, cfg.users))),
+                    "total_preguntas": total,
+                    "correctas": correctas,
+                    "incorrectas": total - correctas,
+                    "pendientes": 0,
+                    "puntaje": 100.0 * correctas / total if total else 0.0,
+                    "motivo": "finalizado",
+                }
+            )
+        return out
+
+    return {
+        "users": users,
+        "pruebas": pruebas,
+        "preguntas": preguntas,
+        "exams": [dict(p) for p in pruebas],
+        "intentos": attempts(cfg.intentos),
+        "results": attempts(cfg.results),
+    }
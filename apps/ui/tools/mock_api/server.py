@@ -0,0 +1,318 @@
+# tools/mock_api/server.py
+"""Servidor HTTP asyncio compatible con la parte de MockAPI que usa la app.
+
+Recursos: users, pruebas, pruebas/{id}/preguntas, exams, intentos, results.
+
+Semántica de MockAPI:
+- GET /res                 lista; ?search= busca en todos los campos,
+                           ?<campo>= filtra por ese campo (contiene, sin
+                           distinguir mayúsculas), ?page=&limit= pagina,
+                           ?sortBy=&order=asc|desc ordena.
+- GET /res/{id}            detalle o 404 "Not found".
+- POST /res                crea (id y createdAt automáticos) → 201.
+- PUT /res/{id}            actualiza (merge) → 200.
+- DELETE /res/{id}         borra y devuelve el elemento → 200.
+- /pruebas/{id}/preguntas  igual, limitado a las preguntas de esa prueba.
+
+Las respuestas GET llevan ETag y se responde 304 a If-None-Match, como el
+Express que hay detrás de MockAPI.
+
+Fallas inyectables (FaultConfig): latencia base + jitter, tasa de errores
+5xx, tasa de 429 aleatorios y un límite global de peticiones por segundo que
+responde 429 con Retry-After. Se pueden cambiar en caliente con
+POST /__config {"latency": 0.2, ...}; GET /__stats devuelve contadores.
+"""
+from __future__ import annotations
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+import asyncio
+import hashlib
+import json
+import random
+import time
+
+from .dataset import DatasetConfig, build
+
+# Colección anidada → (colección real, campo que apunta al padre)
+NESTED = {("pruebas", "preguntas"): ("preguntas", "pruebaId")}
+TOP_LEVEL = ("users", "pruebas", "exams", "intentos", "results")
+
+REASONS = {
+    200: "OK", 201: "Created", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 429: "Too Many Requests", 500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+@dataclass
+class FaultConfig:
+    latency: float = 0.0       # segundos añadidos a cada respuesta
+    jitter: float = 0.0        # + uniforme en [0, jitter]
+    error_rate: float = 0.0    # probabilidad de 500/503
+    throttle_rate: float = 0.0  # probabilidad de 429 aleatorio
+    rate_limit: float = 0.0    # peticiones/s globales (0 = sin límite) → 429
+    retry_after: float = 1.0   # valor de Retry-After en los 429
+    empty_404: bool = False    # MockAPI responde 404 "Not found" a filtros sin resultados
+
+
+class _TokenBucket:
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class MockAPI:
+    def __init__(self, dataset: Optional[DatasetConfig] = None, faults: Optional[FaultConfig] = None) -> None:
+        self.dataset = dataset or DatasetConfig()
+        self.faults = faults or FaultConfig()
+        self.data: Dict[str, List[Dict[str, Any]]] = build(self.dataset)
+        self._rng = random.Random(self.dataset.seed)
+        self._bucket = _TokenBucket(self.faults.rate_limit) if self.faults.rate_limit else None
+        self.stats: Dict[str, Any] = {"requests": 0, "statuses": {}, "routes": {}, "started_at": time.time()}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    # -------- ciclo de vida ----------
+    async def start(self, host: str = "127.0.0.1", port: int = 8800) -> Tuple[str, int]:
+        self._server = await asyncio.start_server(self._handle_conn, host, port, backlog=1024)
+        sock = self._server.sockets[0].getsockname()
+        return sock[0], sock[1]
+
+    async def serve_forever(self) -> None:
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def configure(self, **changes: Any) -> None:
+        names = {f.name for f in fields(FaultConfig)}
+        for key, value in changes.items():
+            if key in names:
+                setattr(self.faults, key, type(getattr(self.faults, key))(value))
+        self._bucket = _TokenBucket(self.faults.rate_limit) if self.faults.rate_limit else None
+
+    # -------- conexión HTTP/1.1 (keep-alive) ----------
+    async def _handle_conn(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    method, target, version = line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+                except ValueError:
+                    break
+                headers: Dict[str, str] = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = h.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload, extra = await self._dispatch(method.upper(), target, headers, body)
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                await self._write(writer, status, payload, extra, keep_alive, method.upper() == "HEAD")
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def _write(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        payload: bytes,
+        extra: Dict[str, str],
+        keep_alive: bool,
+        head: bool,
+    ) -> None:
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}"]
+        hdrs = {
+            "Content-Type": "application/json; charset=utf-8",
+            "Content-Length": str(len(payload)),
+            "Connection": "keep-alive" if keep_alive else "close",
+            **extra,
+        }
+        lines += [f"{k}: {v}" for k, v in hdrs.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if payload and not head and status != 304:
+            writer.write(payload)
+        await writer.drain()
+
+    # -------- enrutado ----------
+    async def _dispatch(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        parts = urlsplit(target)
+        segments = [unquote(s) for s in parts.path.strip("/").split("/") if s]
+        query = parse_qsl(parts.query, keep_blank_values=True)
+
+        if segments[:1] in (["__stats"], ["__config"]):
+            return self._admin(method, segments[0], body)
+
+        self.stats["requests"] += 1
+        route = self._route_name(method, segments)
+        self.stats["routes"][route] = self.stats["routes"].get(route, 0) + 1
+
+        # Fallas inyectadas: límite global, 429 y 5xx aleatorios, latencia
+        faults = self.faults
+        delay = faults.latency + (self._rng.uniform(0.0, faults.jitter) if faults.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if (self._bucket is not None and not self._bucket.take()) or (
+            faults.throttle_rate and self._rng.random() < faults.throttle_rate
+        ):
+            return self._count(429, b'"Too many requests"', {"Retry-After": f"{faults.retry_after:g}"})
+        if faults.error_rate and self._rng.random() < faults.error_rate:
+            return self._count(self._rng.choice((500, 503)), b'"Internal error"', {})
+
+        try:
+            json_body = json.loads(body) if body else {}
+        except ValueError:
+            return self._count(400, b'"Invalid JSON"', {})
+
+        status, result = self._handle(method, segments, query, json_body)
+        payload = json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        extra: Dict[str, str] = {}
+        if method == "GET" and status == 200:
+            etag = 'W/"%x-%s"' % (len(payload), hashlib.sha1(payload).hexdigest()[:27])
+            extra["ETag"] = etag
+            if headers.get("if-none-match") == etag:
+                return self._count(304, b"", extra)
+        return self._count(status, payload, extra)
+
+    @staticmethod
+    def _route_name(method: str, segments: List[str]) -> str:
+        named = ["{id}" if i % 2 else s for i, s in enumerate(segments)]
+        return f"{method} /{'/'.join(named)}"
+
+    def _count(self, status: int, payload: bytes, extra: Dict[str, str]) -> Tuple[int, bytes, Dict[str, str]]:
+        key = str(status)
+        self.stats["statuses"][key] = self.stats["statuses"].get(key, 0) + 1
+        return status, payload, extra
+
+    def _admin(self, method: str, name: str, body: bytes) -> Tuple[int, bytes, Dict[str, str]]:
+        if name == "__config":
+            if method == "POST":
+                try:
+                    self.configure(**json.loads(body or b"{}"))
+                except (ValueError, TypeError):
+                    return 400, b'"Invalid config"', {}
+            return 200, json.dumps(asdict(self.faults)).encode(), {}
+        out = dict(self.stats, uptime=time.time() - self.stats["started_at"])
+        out["sizes"] = {k: len(v) for k, v in self.data.items()}
+        return 200, json.dumps(out).encode(), {}
+
+    def _resolve(self, segments: List[str]) -> Optional[Tuple[str, Optional[Tuple[str, str]], Optional[str]]]:
+        """→ (colección, (campo_padre, id_padre) | None, id_elemento | None)."""
+        if len(segments) in (1, 2) and segments[0] in TOP_LEVEL:
+            return segments[0], None, segments[1] if len(segments) == 2 else None
+        if len(segments) in (3, 4):
+            nested = NESTED.get((segments[0], segments[2]))
+            if nested is not None:
+                collection, parent_field = nested
+                return collection, (parent_field, segments[1]), segments[3] if len(segments) == 4 else None
+        return None
+
+    def _handle(
+        self, method: str, segments: List[str], query: List[Tuple[str, str]], body: Any
+    ) -> Tuple[int, Any]:
+        resolved = self._resolve(segments)
+        if resolved is None:
+            return 404, "Not found"
+        collection, parent, item_id = resolved
+        items = self.data[collection]
+        if parent is not None:
+            parent_collection = segments[0]
+            if not any(p["id"] == parent[1] for p in self.data[parent_collection]):
+                return 404, "Not found"
+            scope = [i for i in items if str(i.get(parent[0])) == parent[1]]
+        else:
+            scope = items
+
+        if item_id is None:
+            if method in ("GET", "HEAD"):
+                result = self._list(scope, query)
+                if not result and self.faults.empty_404 and query:
+                    return 404, "Not found"
+                return 200, result
+            if method == "POST":
+                if not isinstance(body, dict):
+                    return 400, "Invalid body"
+                new_id = str(max((int(i["id"]) for i in items if str(i["id"]).isdigit()), default=0) + 1)
+                item = {"id": new_id, "createdAt": datetime.now(timezone.utc).isoformat(), **body}
+                item["id"] = new_id
+                if parent is not None:
+                    item[parent[0]] = parent[1]
+                items.append(item)
+                return 201, item
+            return 405, "Method not allowed"
+
+        item = next((i for i in scope if str(i["id"]) == item_id), None)
+        if item is None:
+            return 404, "Not found"
+        if method in ("GET", "HEAD"):
+            return 200, item
+        if method in ("PUT", "PATCH"):
+            if not isinstance(body, dict):
+                return 400, "Invalid body"
+            item.update({k: v for k, v in body.items() if k != "id"})
+            return 200, item
+        if method == "DELETE":
+            items.remove(item)
+            return 200, item
+        return 405, "Method not allowed"
+
+    @staticmethod
+    def _list(items: List[Dict[str, Any]], query: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        params = dict(query)
+        search = params.pop("search", None)
+        page = params.pop("page", None)
+        limit = params.pop("limit", None)
+        sort_by = params.pop("sortBy", None)
+        order = params.pop("order", "asc")
+
+        out = items
+        for field_name, value in params.items():
+            needle = value.lower()
+            out = [i for i in out if needle in str(i.get(field_name, "")).lower()]
+        if search:
+            needle = search.lower()
+            out = [
+                i for i in out
+                if any(needle in str(v).lower() for v in i.values() if isinstance(v, (str, int, float)))
+            ]
+        if sort_by:
+            out = sorted(out, key=lambda i: str(i.get(sort_by, "")), reverse=order.lower() == "desc")
+        if limit:
+            try:
+                size = max(1, int(limit))
+                start = (max(1, int(page or 1)) - 1) * size
+            except ValueError:
+                return []
+            out = out[start:start + size]
+        return list(out)